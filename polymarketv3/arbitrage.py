@@ -8,6 +8,7 @@ from typing import Optional
 from config import config
 from client_manager import clients
 from market_fetcher import Market, MarketFetcher
+from services import get_service
 import logging
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ class ArbitrageDetector:
     """
     
     def __init__(self):
-        self._fetcher = MarketFetcher()
+        self._fetcher = get_service("fetcher", MarketFetcher)
     
     def check_market(self, market: Market) -> Optional[ArbitrageOpportunity]:
         """
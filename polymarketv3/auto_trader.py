@@ -14,11 +14,14 @@ Just run it and let it work!
 import os
 import time
 import random
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from config import config
 from market_fetcher import MarketFetcher, Market
 from order_manager import OrderManager
@@ -27,7 +30,7 @@ from portfolio import PortfolioManager
 from odds_tracker import OddsTracker
 from persistence import db
 from arbitrage import ArbitrageDetector
-from models import ManualModel, OddsApiModel, MomentumModel, ProbabilityEstimate
+from models import ManualModel, OddsApiModel, MomentumModel, ProbabilityEstimate, batch_edges
 import logging
 logger = logging.getLogger(__name__)
 
@@ -156,6 +159,7 @@ class AutoTrader:
         self.bet_history: list[AutoBet] = []
         self.total_pnl: float = 0.0
         self._running: bool = False
+        self._wake = threading.Event()  # set by wake() to cut the scan wait short
         self._bet_counter: int = 0
         
         logger.info('============================================================')
@@ -427,20 +431,26 @@ class AutoTrader:
             except Exception as e:
                 logger.error(f"   Warning: {model.name} failed: {e}")
         
-        for market in markets:
-            est = all_estimates.get(market.id)
-            if est is None:
-                continue
-            
-            # Check YES side edge
-            yes_edge = est.edge_vs_market(market.price_yes, "YES")
-            if yes_edge >= self.config.min_edge and est.confidence >= 0.5:
-                opportunities.append((market, "YES", yes_edge))
-            
-            # Check NO side edge
-            no_edge = est.edge_vs_market(market.price_no, "NO")
-            if no_edge >= self.config.min_edge and est.confidence >= 0.5:
-                opportunities.append((market, "NO", no_edge))
+        scored = [(m, all_estimates[m.id]) for m in markets if m.id in all_estimates]
+        if not scored:
+            return []
+        
+        # Score both sides of every estimated market in one pass
+        n = len(scored)
+        fair_yes = np.fromiter((est.fair_probability_yes for _, est in scored), float, n)
+        confident = np.fromiter((est.confidence >= 0.5 for _, est in scored), bool, n)
+        yes_edges = batch_edges(fair_yes, np.fromiter((m.price_yes for m, _ in scored), float, n), True)
+        no_edges = batch_edges(fair_yes, np.fromiter((m.price_no for m, _ in scored), float, n), False)
+        
+        min_edge = self.config.min_edge
+        yes_hits = confident & (yes_edges >= min_edge)
+        no_hits = confident & (no_edges >= min_edge)
+        for i in np.flatnonzero(yes_hits | no_hits):
+            market = scored[i][0]
+            if yes_hits[i]:
+                opportunities.append((market, "YES", float(yes_edges[i])))
+            if no_hits[i]:
+                opportunities.append((market, "NO", float(no_edges[i])))
         
         # Sort by edge (highest first)
         opportunities.sort(key=lambda x: x[2], reverse=True)
@@ -462,25 +472,29 @@ class AutoTrader:
         
         opportunities = []
         
+        # One batched history query per model instead of one per market
+        batches = []
+        for model in self._momentum_models:
+            try:
+                batches.append(model.batch_estimate(markets))
+            except Exception as e:
+                logger.error(f"   Warning: momentum analysis failed for {model.name}: {e}")
+        
         for market in markets:
-            for model in self._momentum_models:
-                try:
-                    est = model.estimate(market)
-                    if est is None:
-                        continue
-                    
-                    # Determine which side the momentum favors
-                    yes_edge = est.edge_vs_market(market.price_yes, "YES")
-                    no_edge = est.edge_vs_market(market.price_no, "NO")
-                    
-                    # Pick the side with positive edge
-                    if yes_edge >= self.config.min_edge and yes_edge >= no_edge:
-                        opportunities.append((market, "YES", yes_edge))
-                    elif no_edge >= self.config.min_edge:
-                        opportunities.append((market, "NO", no_edge))
-                        
-                except Exception as e:
-                    logger.error(f"   Warning: momentum analysis failed for {market.question[:30]}...: {e}")
+            for batch in batches:
+                est = batch.get(market.id)
+                if est is None:
+                    continue
+                
+                # Determine which side the momentum favors
+                yes_edge = est.edge_vs_market(market.price_yes, "YES")
+                no_edge = est.edge_vs_market(market.price_no, "NO")
+                
+                # Pick the side with positive edge
+                if yes_edge >= self.config.min_edge and yes_edge >= no_edge:
+                    opportunities.append((market, "YES", yes_edge))
+                elif no_edge >= self.config.min_edge:
+                    opportunities.append((market, "NO", no_edge))
         
         opportunities.sort(key=lambda x: x[2], reverse=True)
         return opportunities
@@ -790,7 +804,7 @@ class AutoTrader:
     
     def run_once(self):
         """Run one cycle of scanning and betting."""
-        logger.info(f"\n🔍 Scanning markets... ({datetime.now().strftime('%H:%M:%S')})")
+        logger.info(f"\n🔍 Scanning markets... ({time.strftime('%H:%M:%S')})")
         
         # Scan markets
         markets = self.scan_markets()
@@ -864,7 +878,10 @@ class AutoTrader:
         self.order_manager.order_tracker.start()
         
         logger.info("\n🚀 AUTO TRADER STARTED")
-        logger.info(f"   Scanning every {self.config.scan_interval} seconds")
+        scan_interval = self.config.scan_interval
+        wake = self._wake
+        
+        logger.info(f"   Scanning every {scan_interval} seconds")
         logger.info("   Press Ctrl+C to stop\n")
         
         try:
@@ -875,9 +892,11 @@ class AutoTrader:
                 if cycles and cycle >= cycles:
                     break
                 
-                # Wait for next scan
-                logger.info(f"\n💤 Waiting {self.config.scan_interval}s until next scan...")
-                time.sleep(self.config.scan_interval)
+                # Wait for next scan (or an early wake from a price alert)
+                logger.info(f"\n💤 Waiting up to {scan_interval}s until next scan...")
+                if wake.wait(timeout=scan_interval):
+                    logger.info("⚡ Price move detected, scanning early")
+                wake.clear()
         
         except KeyboardInterrupt:
             logger.info("\n\n⏹️ Stopping auto trader...")
@@ -890,6 +909,16 @@ class AutoTrader:
     def stop(self):
         """Stop the auto trader."""
         self._running = False
+        self._wake.set()
+    
+    def wake(self, *_args):
+        """
+        Start the next scan now instead of waiting out scan_interval.
+        
+        Signature matches OddsTracker alert callbacks, so it can be passed
+        directly as one.
+        """
+        self._wake.set()
     
     def run_scan_only(self, cycles: int = None):
         """
@@ -917,7 +946,7 @@ class AutoTrader:
         
         try:
             while self._running:
-                logger.info(f"\n🔍 Scanning markets... ({datetime.now().strftime('%H:%M:%S')})")
+                logger.info(f"\n🔍 Scanning markets... ({time.strftime('%H:%M:%S')})")
                 
                 # Scan markets
                 markets = self.scan_markets()
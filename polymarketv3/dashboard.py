@@ -10,13 +10,15 @@ Features:
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import requests
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from typing import NamedTuple, Optional
 import time
-import json
+import orjson
 
 # Page config
 st.set_page_config(
@@ -29,8 +31,26 @@ st.set_page_config(
 # Constants
 GAMMA_API = "https://gamma-api.polymarket.com"
 
+MARKET_COLUMNS = [
+    "id", "question", "category", "price_yes", "price_no",
+    "volume", "liquidity", "token_id_yes", "token_id_no",
+]
+SPORTS_KEYWORDS = ["nba", "nfl", "mlb", "nhl", "soccer", "sport"]
+_SPORTS_RE = "|".join(SPORTS_KEYWORDS)
+
+
+class Strategy(NamedTuple):
+    """A TP/SL strategy preset (percentages, None = not used)."""
+    description: str
+    take_profit: Optional[float]
+    stop_loss: Optional[float]
+    trailing_stop: Optional[float]
+    risk_level: str
+    color: str
+
+
 # Strategy Presets
-STRATEGIES = {
+_STRATEGY_PRESETS = {
     "🛡️ Conservative": {
         "description": "Low risk, small gains, tight stop loss",
         "take_profit": 30,
@@ -73,6 +93,9 @@ STRATEGIES = {
     }
 }
 
+STRATEGIES = {name: Strategy(**preset) for name, preset in _STRATEGY_PRESETS.items()}
+
+
 # Code Examples for 3 Options
 CODE_EXAMPLES = {
     "🟢 Interactive (Easiest)": '''# Just run this in terminal:
@@ -128,7 +151,12 @@ manager.start_monitoring()
 
 @st.cache_data(ttl=60)
 def fetch_markets(limit=50):
-    """Fetch markets from Polymarket API."""
+    """
+    Fetch markets from Polymarket API.
+
+    Returns a DataFrame (one row per market) rather than a list of dicts so
+    the cached value is pickled column-wise instead of dict-by-dict.
+    """
     try:
         params = {
             "active": "true",
@@ -139,14 +167,14 @@ def fetch_markets(limit=50):
         }
         
         response = requests.get(f"{GAMMA_API}/events", params=params, timeout=10)
-        events = response.json()
+        events = orjson.loads(response.content)
         
         markets = []
         for event in events:
             for market in event.get("markets", []):
                 try:
-                    prices = eval(market.get("outcomePrices", "[]"))
-                    outcomes = eval(market.get("outcomes", '["Yes", "No"]'))
+                    prices = orjson.loads(market.get("outcomePrices", "[]"))
+                    outcomes = orjson.loads(market.get("outcomes", '["Yes", "No"]'))
                     token_ids = market.get("clobTokenIds", [])
                     tags = event.get("tags", [{}])
                     category = tags[0].get("label", "Other") if tags else "Other"
@@ -166,10 +194,56 @@ def fetch_markets(limit=50):
                 except Exception:
                     continue
         
-        return markets
+        return _markets_frame(markets)
     except Exception as e:
         st.error(f"Error fetching markets: {e}")
-        return []
+        return _markets_frame([])
+
+
+def _markets_frame(rows):
+    """Build the markets DataFrame, lowercasing categories once at ingest."""
+    df = pd.DataFrame(rows, columns=MARKET_COLUMNS)
+    df["category_lc"] = df["category"].str.lower()
+    return df
+
+
+def get_markets():
+    """
+    Get the shared markets DataFrame for this session.
+
+    The DataFrame is stashed in session_state per 60-second bucket, so
+    reruns within the same bucket (mode switches, widget changes) skip the
+    fetch_markets cache lookup and its unpickle entirely.
+    """
+    bucket = int(time.time() // 60)
+    if st.session_state.get("markets_bucket") != bucket:
+        st.session_state["markets_df"] = fetch_markets()
+        st.session_state["markets_bucket"] = bucket
+    return st.session_state["markets_df"]
+
+
+def crypto_mask(markets):
+    """Boolean mask of crypto rows in a markets DataFrame."""
+    return markets["category_lc"].str.contains("crypto", regex=False)
+
+
+def sports_mask(markets):
+    """Boolean mask of sports rows in a markets DataFrame."""
+    return markets["category_lc"].str.contains(_SPORTS_RE)
+
+
+def category_counts(markets):
+    """
+    Return (crypto_count, sports_count) from the pre-lowered category column.
+
+    Markets share a small set of category labels, so substring matching runs
+    once per distinct label and the per-label counts are summed.
+    """
+    per_label = markets["category_lc"].value_counts()
+    labels = per_label.index.to_series()
+    crypto_count = per_label[labels.str.contains("crypto", regex=False)].sum()
+    sports_count = per_label[labels.str.contains(_SPORTS_RE)].sum()
+    return int(crypto_count), int(sports_count)
 
 
 def calculate_trade_preview(entry_price, amount, strategy):
@@ -182,28 +256,87 @@ def calculate_trade_preview(entry_price, amount, strategy):
         "cost": amount,
     }
     
-    if strategy["take_profit"]:
-        tp_price = entry_price * (1 + strategy["take_profit"] / 100)
+    if strategy.take_profit:
+        tp_price = entry_price * (1 + strategy.take_profit / 100)
         tp_price = min(tp_price, 0.99)
         tp_profit = (tp_price - entry_price) * size
         results["tp_price"] = tp_price
         results["tp_profit"] = tp_profit
     
-    if strategy["stop_loss"]:
-        sl_price = entry_price * (1 - strategy["stop_loss"] / 100)
+    if strategy.stop_loss:
+        sl_price = entry_price * (1 - strategy.stop_loss / 100)
         sl_price = max(sl_price, 0.01)
         sl_loss = (entry_price - sl_price) * size
         results["sl_price"] = sl_price
         results["sl_loss"] = sl_loss
     
-    if strategy["trailing_stop"]:
-        trail_price = entry_price * (1 - strategy["trailing_stop"] / 100)
-        results["trail_percent"] = strategy["trailing_stop"]
+    if strategy.trailing_stop:
+        trail_price = entry_price * (1 - strategy.trailing_stop / 100)
+        results["trail_percent"] = strategy.trailing_stop
         results["trail_price"] = trail_price
     
     return results
 
 
+def calculate_trade_preview_batch(entry_prices, amount, strategy=None):
+    """
+    Vectorized calculate_trade_preview over many entry prices at once.
+
+    Returns a dict of NumPy arrays (one element per entry price). Pass
+    strategy=None to size positions without any exit orders.
+    """
+    entry_prices = np.asarray(entry_prices, dtype=float)
+    size = amount / entry_prices
+    
+    results = {
+        "size": size,
+        "entry_price": entry_prices,
+        "cost": np.full_like(entry_prices, amount),
+    }
+    
+    if strategy is None:
+        return results
+    
+    if strategy.take_profit:
+        tp_price = np.minimum(entry_prices * (1 + strategy.take_profit / 100), 0.99)
+        results["tp_price"] = tp_price
+        results["tp_profit"] = (tp_price - entry_prices) * size
+    
+    if strategy.stop_loss:
+        sl_price = np.maximum(entry_prices * (1 - strategy.stop_loss / 100), 0.01)
+        results["sl_price"] = sl_price
+        results["sl_loss"] = (entry_prices - sl_price) * size
+    
+    if strategy.trailing_stop:
+        results["trail_percent"] = strategy.trailing_stop
+        results["trail_price"] = entry_prices * (1 - strategy.trailing_stop / 100)
+    
+    return results
+
+
+@st.cache_data(max_entries=32)
+def top_markets_markdown(rows):
+    """
+    Render a "Top Markets" block as a single markdown string.
+
+    rows is a tuple of (question, price_yes, price_no, volume) tuples;
+    cache_data keys on its content hash, so an unchanged block is returned
+    as-is and sent to the browser as one element instead of a widget tree.
+    """
+    lines = []
+    for question, price_yes, price_no, volume in rows:
+        lines.append(f"**{question[:50]}...**  ")
+        lines.append(f"YES {price_yes*100:.0f}¢ · NO {price_no*100:.0f}¢ · Vol: ${volume:,.0f}")
+        lines.append("\n---\n")
+    return "\n".join(lines)
+
+
+def _top_rows(markets):
+    """Hashable rows for top_markets_markdown."""
+    cols = markets[["question", "price_yes", "price_no", "volume"]]
+    return tuple(cols.itertuples(index=False, name=None))
+
+
 def main():
     # ==================== SIDEBAR ====================
     with st.sidebar:
@@ -223,10 +356,8 @@ def main():
         st.markdown("---")
         
         # Quick Stats
-        markets = fetch_markets()
-        crypto_count = len([m for m in markets if "crypto" in m["category"].lower()])
-        sports_keywords = ["nba", "nfl", "mlb", "nhl", "soccer", "sport"]
-        sports_count = len([m for m in markets if any(k in m["category"].lower() for k in sports_keywords)])
+        markets = get_markets()
+        crypto_count, sports_count = category_counts(markets)
         
         st.metric("Total Markets", len(markets))
         col1, col2 = st.columns(2)
@@ -237,14 +368,14 @@ def main():
         
         if st.button("🔄 Refresh Data"):
             st.cache_data.clear()
+            st.session_state.pop("markets_bucket", None)
             st.rerun()
         
         st.caption(f"Updated: {datetime.now().strftime('%H:%M:%S')}")
     
     # ==================== MAIN CONTENT ====================
     
-    markets = fetch_markets()
-    sports_keywords = ["nba", "nfl", "mlb", "nhl", "soccer", "sport"]
+    markets = get_markets()
     
     # ---------- HOME ----------
     if mode == "🏠 Home":
@@ -254,13 +385,13 @@ def main():
         # Quick Stats Row
         col1, col2, col3, col4 = st.columns(4)
         
-        total_volume = sum(m["volume"] for m in markets)
-        arb_count = len([m for m in markets if m["price_yes"] + m["price_no"] < 0.99])
+        total_volume = markets["volume"].sum()
+        arb_count = int((markets["price_yes"] + markets["price_no"] < 0.99).sum())
         
         col1.metric("📈 Markets", len(markets))
         col2.metric("💰 Volume (24h)", f"${total_volume/1e6:.1f}M")
         col3.metric("⚡ Arb Opps", arb_count)
-        col4.metric("🎯 Avg Price", f"{sum(m['price_yes'] for m in markets)/len(markets)*100:.0f}¢" if markets else "N/A")
+        col4.metric("🎯 Avg Price", f"{markets['price_yes'].mean()*100:.0f}¢" if len(markets) else "N/A")
         
         st.markdown("---")
         
@@ -269,27 +400,13 @@ def main():
         
         with col1:
             st.subheader("🪙 Top Crypto Markets")
-            crypto = [m for m in markets if "crypto" in m["category"].lower()][:5]
-            for m in crypto:
-                with st.container():
-                    st.markdown(f"**{m['question'][:50]}...**")
-                    c1, c2, c3 = st.columns(3)
-                    c1.metric("YES", f"{m['price_yes']*100:.0f}¢", label_visibility="collapsed")
-                    c2.metric("NO", f"{m['price_no']*100:.0f}¢", label_visibility="collapsed")
-                    c3.caption(f"Vol: ${m['volume']:,.0f}")
-                    st.markdown("---")
+            crypto = markets[crypto_mask(markets)].head(5)
+            st.markdown(top_markets_markdown(_top_rows(crypto)))
         
         with col2:
             st.subheader("🏀 Top Sports Markets")
-            sports = [m for m in markets if any(k in m["category"].lower() for k in sports_keywords)][:5]
-            for m in sports:
-                with st.container():
-                    st.markdown(f"**{m['question'][:50]}...**")
-                    c1, c2, c3 = st.columns(3)
-                    c1.metric("YES", f"{m['price_yes']*100:.0f}¢", label_visibility="collapsed")
-                    c2.metric("NO", f"{m['price_no']*100:.0f}¢", label_visibility="collapsed")
-                    c3.caption(f"Vol: ${m['volume']:,.0f}")
-                    st.markdown("---")
+            sports = markets[sports_mask(markets)].head(5)
+            st.markdown(top_markets_markdown(_top_rows(sports)))
     
     # ---------- TRADE ----------
     elif mode == "💹 Trade":
@@ -311,23 +428,25 @@ def main():
             st.session_state.selected_strategy = "⚖️ Balanced"
         
         selected_strategy = st.session_state.selected_strategy
-        strategy = STRATEGIES[selected_strategy].copy()
+        strategy = STRATEGIES[selected_strategy]
         
         # Show strategy details
-        st.info(f"**{selected_strategy}**: {strategy['description']} | Risk: {strategy['risk_level']}")
+        st.info(f"**{selected_strategy}**: {strategy.description} | Risk: {strategy.risk_level}")
         
         # Custom parameters if Custom selected
         if selected_strategy == "🎯 Custom":
             col1, col2, col3 = st.columns(3)
             with col1:
                 custom_tp = st.number_input("Take Profit %", 0, 200, 50)
-                strategy["take_profit"] = custom_tp
             with col2:
                 custom_sl = st.number_input("Stop Loss %", 0, 100, 25)
-                strategy["stop_loss"] = custom_sl
             with col3:
                 custom_trail = st.number_input("Trailing Stop %", 0, 50, 0)
-                strategy["trailing_stop"] = custom_trail if custom_trail > 0 else None
+            strategy = strategy._replace(
+                take_profit=custom_tp,
+                stop_loss=custom_sl,
+                trailing_stop=custom_trail if custom_trail > 0 else None,
+            )
         
         st.markdown("---")
         
@@ -343,15 +462,15 @@ def main():
         # Filter markets
         filtered = markets
         if search:
-            filtered = [m for m in filtered if search.lower() in m["question"].lower()]
+            filtered = filtered[filtered["question"].str.lower().str.contains(search.lower(), regex=False)]
         if category_filter == "Crypto":
-            filtered = [m for m in filtered if "crypto" in m["category"].lower()]
+            filtered = filtered[crypto_mask(filtered)]
         elif category_filter == "Sports":
-            filtered = [m for m in filtered if any(k in m["category"].lower() for k in sports_keywords)]
+            filtered = filtered[sports_mask(filtered)]
         
         # Market selector
-        if filtered:
-            market_options = {f"{m['question'][:60]}... ({m['price_yes']*100:.0f}¢)": m for m in filtered[:20]}
+        if not filtered.empty:
+            market_options = {f"{m['question'][:60]}... ({m['price_yes']*100:.0f}¢)": m for m in filtered.head(20).to_dict("records")}
             selected_market_name = st.selectbox("Select market:", list(market_options.keys()))
             selected_market = market_options[selected_market_name]
             
@@ -409,15 +528,15 @@ trader.buy(
     amount={amount},
     side="{side}",'''
             
-            if strategy["take_profit"]:
+            if strategy.take_profit:
                 code += f'''
-    take_profit_percent={strategy["take_profit"]},'''
-            if strategy["stop_loss"]:
+    take_profit_percent={strategy.take_profit},'''
+            if strategy.stop_loss:
                 code += f'''
-    stop_loss_percent={strategy["stop_loss"]},'''
-            if strategy["trailing_stop"]:
+    stop_loss_percent={strategy.stop_loss},'''
+            if strategy.trailing_stop:
                 code += f'''
-    trailing_stop_percent={strategy["trailing_stop"]},'''
+    trailing_stop_percent={strategy.trailing_stop},'''
             
             code += '''
 )
@@ -450,26 +569,26 @@ trader.start_monitoring()'''
         # Filter
         filtered = markets
         if search:
-            filtered = [m for m in filtered if search.lower() in m["question"].lower()]
+            filtered = filtered[filtered["question"].str.lower().str.contains(search.lower(), regex=False)]
         if cat_filter == "Crypto":
-            filtered = [m for m in filtered if "crypto" in m["category"].lower()]
+            filtered = filtered[crypto_mask(filtered)]
         elif cat_filter == "Sports":
-            filtered = [m for m in filtered if any(k in m["category"].lower() for k in sports_keywords)]
+            filtered = filtered[sports_mask(filtered)]
         
         # Sort
         if sort_by == "Volume":
-            filtered.sort(key=lambda x: x["volume"], reverse=True)
+            filtered = filtered.sort_values("volume", ascending=False)
         elif sort_by == "Price (High)":
-            filtered.sort(key=lambda x: x["price_yes"], reverse=True)
+            filtered = filtered.sort_values("price_yes", ascending=False)
         elif sort_by == "Price (Low)":
-            filtered.sort(key=lambda x: x["price_yes"])
+            filtered = filtered.sort_values("price_yes")
         elif sort_by == "Liquidity":
-            filtered.sort(key=lambda x: x["liquidity"], reverse=True)
+            filtered = filtered.sort_values("liquidity", ascending=False)
         
         # Display
         st.caption(f"Showing {len(filtered)} markets")
         
-        for m in filtered[:30]:
+        for m in filtered.head(30).to_dict("records"):
             with st.container():
                 col1, col2, col3, col4 = st.columns([4, 1, 1, 1])
                 with col1:
@@ -489,24 +608,23 @@ trader.start_monitoring()'''
         st.caption("Find markets where YES + NO < $1.00 for guaranteed profit")
         
         # Find opportunities
-        opportunities = []
-        for m in markets:
-            combined = m["price_yes"] + m["price_no"]
-            if combined < 0.99:
-                profit = 1 - combined
-                opportunities.append({
-                    **m,
-                    "combined": combined,
-                    "profit_pct": profit * 100,
-                    "profit_per_100": profit * 100
-                })
-        
-        opportunities.sort(key=lambda x: x["profit_pct"], reverse=True)
+        opportunities = markets.assign(combined=markets["price_yes"] + markets["price_no"])
+        opportunities = opportunities[opportunities["combined"] < 0.99].copy()
         
-        if opportunities:
+        if not opportunities.empty:
+            profit = 1 - opportunities["combined"]
+            opportunities["profit_pct"] = profit * 100
+            opportunities["profit_per_100"] = profit * 100
+            
+            # Size both legs of a $100 arb ($50 each side) in one pass
+            opportunities["shares_yes"] = calculate_trade_preview_batch(opportunities["price_yes"], 50)["size"]
+            opportunities["shares_no"] = calculate_trade_preview_batch(opportunities["price_no"], 50)["size"]
+            
+            opportunities = opportunities.sort_values("profit_pct", ascending=False)
+            
             st.success(f"Found {len(opportunities)} arbitrage opportunities!")
             
-            for opp in opportunities[:10]:
+            for opp in opportunities.head(10).to_dict("records"):
                 with st.expander(f"💰 +{opp['profit_pct']:.2f}% - {opp['question'][:50]}..."):
                     col1, col2, col3, col4 = st.columns(4)
                     col1.metric("YES", f"{opp['price_yes']*100:.1f}¢")
@@ -514,7 +632,7 @@ trader.start_monitoring()'''
                     col3.metric("Combined", f"{opp['combined']*100:.1f}¢")
                     col4.metric("Profit/$100", f"+${opp['profit_per_100']:.2f}")
                     
-                    st.info(f"💡 **Strategy:** Buy {50/opp['price_yes']:.0f} YES @ {opp['price_yes']*100:.1f}¢ + {50/opp['price_no']:.0f} NO @ {opp['price_no']*100:.1f}¢ = Guaranteed ${opp['profit_per_100']:.2f} profit per $100")
+                    st.info(f"💡 **Strategy:** Buy {opp['shares_yes']:.0f} YES @ {opp['price_yes']*100:.1f}¢ + {opp['shares_no']:.0f} NO @ {opp['price_no']*100:.1f}¢ = Guaranteed ${opp['profit_per_100']:.2f} profit per $100")
         else:
             st.info("No arbitrage opportunities found right now. Check back later!")
     
@@ -531,33 +649,38 @@ trader.start_monitoring()'''
             {"market": "ETH above $5k?", "side": "NO", "size": 75, "entry": 0.60, "current": 0.55},
         ]
         
-        # Calculate totals
-        total_value = sum(p["size"] * p["current"] for p in positions)
-        total_cost = sum(p["size"] * p["entry"] for p in positions)
-        total_pnl = total_value - total_cost
+        # Calculate totals in one vectorized pass
+        pos_df = pd.DataFrame(positions)
+        pos_df["value"] = pos_df["size"] * pos_df["current"]
+        pos_df["cost"] = pos_df["size"] * pos_df["entry"]
+        pos_df["pnl"] = pos_df["value"] - pos_df["cost"]
+        pos_df["pnl_pct"] = pos_df["pnl"] / pos_df["cost"] * 100
+        totals = pos_df[["value", "cost", "pnl"]].sum()
         
         # Summary
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Value", f"${total_value:.2f}")
-        col2.metric("Total Cost", f"${total_cost:.2f}")
-        col3.metric("Unrealized P&L", f"${total_pnl:.2f}", f"{total_pnl/total_cost*100:.1f}%")
-        col4.metric("Positions", len(positions))
+        col1.metric("Total Value", f"${totals['value']:.2f}")
+        col2.metric("Total Cost", f"${totals['cost']:.2f}")
+        col3.metric("Unrealized P&L", f"${totals['pnl']:.2f}", f"{totals['pnl']/totals['cost']*100:.1f}%")
+        col4.metric("Positions", len(pos_df))
         
         st.markdown("---")
         
         # Positions table
-        for pos in positions:
-            pnl = (pos["current"] - pos["entry"]) * pos["size"]
-            pnl_pct = (pos["current"] - pos["entry"]) / pos["entry"] * 100
-            
-            with st.container():
-                col1, col2, col3, col4, col5 = st.columns([3, 1, 1, 1, 1])
-                col1.markdown(f"**{pos['market']}**")
-                col2.write(f"{pos['side']} x{pos['size']}")
-                col3.write(f"Entry: {pos['entry']*100:.0f}¢")
-                col4.write(f"Now: {pos['current']*100:.0f}¢")
-                col5.markdown(f"**{'🟢' if pnl >= 0 else '🔴'} ${pnl:.2f}** ({pnl_pct:+.1f}%)")
-                st.markdown("---")
+        st.dataframe(
+            pos_df[["market", "side", "size", "entry", "current", "pnl", "pnl_pct"]],
+            column_config={
+                "market": st.column_config.TextColumn("Market", width="large"),
+                "side": "Side",
+                "size": st.column_config.NumberColumn("Shares"),
+                "entry": st.column_config.NumberColumn("Entry", format="$%.2f"),
+                "current": st.column_config.NumberColumn("Now", format="$%.2f"),
+                "pnl": st.column_config.NumberColumn("P&L", format="$%.2f"),
+                "pnl_pct": st.column_config.NumberColumn("P&L %", format="%+.1f%%"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
     
     # ---------- HOW TO USE ----------
     elif mode == "📖 How to Use":
@@ -595,11 +718,11 @@ trader.start_monitoring()'''
             if name != "🎯 Custom":
                 strategy_data.append({
                     "Strategy": name,
-                    "Take Profit": f"+{strat['take_profit']}%" if strat['take_profit'] else "-",
-                    "Stop Loss": f"-{strat['stop_loss']}%" if strat['stop_loss'] else "-",
-                    "Trailing Stop": f"{strat['trailing_stop']}%" if strat['trailing_stop'] else "-",
-                    "Risk Level": strat['risk_level'],
-                    "Description": strat['description']
+                    "Take Profit": f"+{strat.take_profit}%" if strat.take_profit else "-",
+                    "Stop Loss": f"-{strat.stop_loss}%" if strat.stop_loss else "-",
+                    "Trailing Stop": f"{strat.trailing_stop}%" if strat.trailing_stop else "-",
+                    "Risk Level": strat.risk_level,
+                    "Description": strat.description
                 })
         
         df = pd.DataFrame(strategy_data)
@@ -5,16 +5,45 @@ This is the beginner-friendly interface for the bot.
 All the complexity is hidden - just call simple functions!
 """
 
-from typing import Optional
+import shlex
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Optional
 from dataclasses import dataclass
 
 from config import config
 from market_fetcher import MarketFetcher, Market
 from order_manager import OrderManager
 from portfolio import PortfolioManager
+from services import get_service
+import logging
+logger = logging.getLogger(__name__)
 
+# quick_buy() defaults (50% TP, 25% SL) as fixed price multipliers
+QUICK_TP_MULT = 1.5
+QUICK_SL_MULT = 0.75
 
-@dataclass
+# _wait_until() sleeps until this close to the deadline, then spins
+_SPIN_WINDOW_NS = 1_000_000
+
+
+def _wait_until(execute_at: datetime):
+    """
+    Block until the wall-clock time execute_at (no-op if already past).
+    
+    The wall-clock gap is read once and converted to a perf_counter deadline,
+    so clock adjustments during the wait don't move it. Coarse sleeps cover
+    all but the last millisecond, which is busy-waited for precision.
+    """
+    deadline = time.perf_counter_ns() + int((execute_at.timestamp() - time.time()) * 1e9)
+    while (remaining := deadline - time.perf_counter_ns()) > _SPIN_WINDOW_NS:
+        time.sleep((remaining - _SPIN_WINDOW_NS) / 1e9)
+    while time.perf_counter_ns() < deadline:
+        pass
+
+
+@dataclass(slots=True)
 class TradeResult:
     """Result of a trade operation."""
     success: bool
@@ -23,7 +52,7 @@ class TradeResult:
     entry_price: float = 0
     take_profit: Optional[float] = None
     stop_loss: Optional[float] = None
-    order_ids: dict = None
+    order_ids: Optional[dict] = None
 
 
 class EasyTrader:
@@ -49,10 +78,10 @@ class EasyTrader:
     """
     
     def __init__(self):
-        """Initialize the easy trader."""
-        self.fetcher = MarketFetcher()
-        self.manager = OrderManager()
-        self.portfolio = PortfolioManager()
+        """Initialize the easy trader (reusing any already-built shared services)."""
+        self.fetcher = get_service("fetcher", MarketFetcher)
+        self.manager = get_service("order_manager", OrderManager)
+        self.portfolio = get_service("portfolio", PortfolioManager)
         
         # Check credentials
         if not config.has_credentials:
@@ -62,42 +91,39 @@ class EasyTrader:
     
     # ==================== FIND MARKETS ====================
     
-    def find_markets(self, search: str = "", category: str = "all") -> list[Market]:
+    def find_markets(
+        self,
+        search: str = "",
+        category: str = "all",
+        top_n: Optional[int] = None
+    ) -> list[Market]:
         """
         Find markets by search term.
         
         Args:
             search: Search term (e.g., "bitcoin", "lakers")
             category: "crypto", "sports", or "all"
+            top_n: Only return the top N by volume (skips sorting the rest)
         
         Returns:
-            List of matching markets
+            List of matching markets, highest volume first
         """
-        print(f"🔍 Searching for '{search}'...")
-        
-        if category == "crypto":
-            markets = self.fetcher.get_crypto_markets()
-        elif category == "sports":
-            markets = self.fetcher.get_sports_markets()
-        else:
-            markets = self.fetcher.get_all_target_markets()
+        logger.info("🔍 Searching for %r...", search)
         
-        if search:
-            markets = [
-                m for m in markets
-                if search.lower() in m.question.lower()
-            ]
+        # Substring filter + volume sort run on the table's column arrays
+        table = self.fetcher.get_market_table(category)
+        rows = table.match(search.casefold())
         
-        # Sort by volume
-        markets.sort(key=lambda m: m.volume, reverse=True)
+        logger.info("✅ Found %d markets", len(rows))
         
-        print(f"✅ Found {len(markets)} markets\n")
+        markets = table.by_volume(rows, top_n)
         
-        # Show top results
-        for i, m in enumerate(markets[:5], 1):
-            print(f"{i}. {m.question[:60]}...")
-            print(f"   YES: {m.price_yes*100:.0f}¢ | NO: {m.price_no*100:.0f}¢ | Vol: ${m.volume:,.0f}")
-            print()
+        # Show top results (built up and written in one call)
+        sys.stdout.write("".join(
+            f"{i}. {m.question[:60]}...\n"
+            f"   YES: {m.price_yes*100:.0f}¢ | NO: {m.price_no*100:.0f}¢ | Vol: ${m.volume:,.0f}\n\n"
+            for i, m in enumerate(markets[:5], 1)
+        ))
         
         return markets
     
@@ -118,7 +144,8 @@ class EasyTrader:
         side: str = "YES",
         take_profit_percent: Optional[float] = None,
         stop_loss_percent: Optional[float] = None,
-        trailing_stop_percent: Optional[float] = None
+        trailing_stop_percent: Optional[float] = None,
+        execute_at: Optional[datetime] = None
     ) -> TradeResult:
         """
         Buy shares in a market with optional TP/SL.
@@ -130,10 +157,41 @@ class EasyTrader:
             take_profit_percent: Sell when up X% (e.g., 50 = sell at 50% profit)
             stop_loss_percent: Sell when down X% (e.g., 20 = sell at 20% loss)
             trailing_stop_percent: Trail stop by X% (e.g., 15 = 15% trailing stop)
+            execute_at: Hold the order until this time, then submit it
+                        (timed to ~1ms; prices are read at submission)
         
         Returns:
             TradeResult with details
         """
+        # Fold the percentages into price multipliers (TP capped at 99¢, SL floored at 1¢)
+        tp_mult = 1 + take_profit_percent * 0.01 if take_profit_percent else None
+        sl_mult = 1 - stop_loss_percent * 0.01 if stop_loss_percent else None
+        ts_pct = trailing_stop_percent * 0.01 if trailing_stop_percent else None
+        
+        return self._submit_buy(market, amount, side, tp_mult, sl_mult, ts_pct, execute_at)
+    
+    def quick_buy(
+        self,
+        market: Market,
+        amount: float = 50,
+        side: str = "YES"
+    ) -> TradeResult:
+        """
+        Quick buy with default 50% TP and 25% SL.
+        """
+        return self._submit_buy(market, amount, side, QUICK_TP_MULT, QUICK_SL_MULT, None)
+    
+    def _submit_buy(
+        self,
+        market: Market,
+        amount: float,
+        side: str,
+        tp_mult: Optional[float],
+        sl_mult: Optional[float],
+        ts_pct: Optional[float],
+        execute_at: Optional[datetime] = None
+    ) -> TradeResult:
+        """Place a buy whose TP/SL prices are entry price × the given multipliers."""
         if not config.has_credentials:
             return TradeResult(
                 success=False,
@@ -141,42 +199,32 @@ class EasyTrader:
             )
         
         # Get current price
-        if side == "YES":
-            token_id = market.token_id_yes
-            entry_price = market.price_yes
-        else:
-            token_id = market.token_id_no
-            entry_price = market.price_no
+        is_yes = side == "YES"
+        token_id = market.token_id_yes if is_yes else market.token_id_no
+        entry_price = market.price_yes if is_yes else market.price_no
         
         # Calculate size
         size = amount / entry_price
         
         # Calculate TP/SL prices
-        tp_price = None
-        sl_price = None
-        
-        if take_profit_percent:
-            tp_price = entry_price * (1 + take_profit_percent / 100)
-            tp_price = min(tp_price, 0.99)  # Cap at 99¢
-        
-        if stop_loss_percent:
-            sl_price = entry_price * (1 - stop_loss_percent / 100)
-            sl_price = max(sl_price, 0.01)  # Floor at 1¢
-        
-        ts_pct = trailing_stop_percent / 100 if trailing_stop_percent else None
+        tp_price = min(entry_price * tp_mult, 0.99) if tp_mult is not None else None
+        sl_price = max(entry_price * sl_mult, 0.01) if sl_mult is not None else None
         
-        print(f"\n📊 PLACING ORDER")
-        print(f"   Market: {market.question[:50]}...")
-        print(f"   Side: {side}")
-        print(f"   Amount: ${amount:.2f} ({size:.2f} shares @ {entry_price*100:.1f}¢)")
+        logger.info("📊 PLACING ORDER")
+        logger.info("   Market: %s...", market.question_short)
+        logger.info("   Side: %s", side)
+        logger.info("   Amount: $%.2f (%.2f shares @ %.1f¢)", amount, size, entry_price * 100)
         
         if tp_price:
-            print(f"   Take Profit: {tp_price*100:.1f}¢ (+{take_profit_percent}%)")
+            logger.info("   Take Profit: %.1f¢ (+%g%%)", tp_price * 100, (tp_mult - 1) * 100)
         if sl_price:
-            print(f"   Stop Loss: {sl_price*100:.1f}¢ (-{stop_loss_percent}%)")
+            logger.info("   Stop Loss: %.1f¢ (-%g%%)", sl_price * 100, (1 - sl_mult) * 100)
         if ts_pct:
-            print(f"   Trailing Stop: {trailing_stop_percent}%")
-        print()
+            logger.info("   Trailing Stop: %g%%", ts_pct * 100)
+        
+        if execute_at:
+            logger.info("   ⏳ Holding order until %s", execute_at.strftime("%H:%M:%S.%f"))
+            _wait_until(execute_at)
         
         # Execute
         result = self.manager.buy_with_tp_sl(
@@ -206,23 +254,6 @@ class EasyTrader:
                 message=f"❌ Order failed: {result.get('buy_result', {}).error}"
             )
     
-    def quick_buy(
-        self,
-        market: Market,
-        amount: float = 50,
-        side: str = "YES"
-    ) -> TradeResult:
-        """
-        Quick buy with default 50% TP and 25% SL.
-        """
-        return self.buy(
-            market=market,
-            amount=amount,
-            side=side,
-            take_profit_percent=50,
-            stop_loss_percent=25
-        )
-    
     # ==================== SELL ====================
     
     def sell(
@@ -368,6 +399,87 @@ class EasyTrader:
 
 # ==================== INTERACTIVE MODE ====================
 
+def _format_numbered(markets: list[Market]) -> str:
+    """Render a numbered market listing as one string for a single write."""
+    return "".join(
+        f"{i}. {m.question_short}... ({m.price_yes*100:.0f}¢)\n"
+        for i, m in enumerate(markets, 1)
+    )
+
+
+def _cmd_find(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    return trader.find_markets(" ".join(args), top_n=5)
+
+
+def _cmd_crypto(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    markets = trader.get_crypto_markets()
+    sys.stdout.write(_format_numbered(markets[:10]))
+    return markets
+
+
+def _cmd_sports(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    markets = trader.get_sports_markets()
+    sys.stdout.write(_format_numbered(markets[:10]))
+    return markets
+
+
+def _cmd_buy(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    if len(args) < 2:
+        print("Usage: buy <market#> <amount>")
+        print("Example: buy 1 50  (buy $50 of market #1)")
+        return markets
+    
+    idx = int(args[0]) - 1
+    amt = float(args[1])
+    
+    if idx < 0 or idx >= len(markets):
+        print("Invalid market number")
+        return markets
+    
+    result = trader.buy(
+        market=markets[idx],
+        amount=amt,
+        take_profit_percent=50,
+        stop_loss_percent=25
+    )
+    print(result.message)
+    return markets
+
+
+def _cmd_positions(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    trader.show_positions()
+    return markets
+
+
+def _cmd_orders(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    trader.show_orders()
+    return markets
+
+
+def _cmd_start(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    trader.start_monitoring()
+    return markets
+
+
+def _cmd_help(trader: EasyTrader, args: list[str], markets: list[Market]) -> list[Market]:
+    print("Commands: find, crypto, sports, buy, sell, positions, orders, start, quit")
+    return markets
+
+
+# REPL verb → handler(trader, args, markets); each returns the market list
+# that later "buy <n>" commands index into
+COMMANDS: dict[str, Callable[[EasyTrader, list[str], list[Market]], list[Market]]] = {
+    "find": _cmd_find,
+    "crypto": _cmd_crypto,
+    "sports": _cmd_sports,
+    "buy": _cmd_buy,
+    "positions": _cmd_positions,
+    "orders": _cmd_orders,
+    "start": _cmd_start,
+    "help": _cmd_help,
+}
+
+
 def interactive_mode():
     """Run interactive trading session."""
     trader = EasyTrader()
@@ -376,7 +488,7 @@ def interactive_mode():
     print("🎰 POLYMARKET EASY TRADER")
     print("="*60)
     print("\nCommands:")
-    print("  find <term>     - Search markets")
+    print("  find <term>     - Search markets (quote multi-word terms)")
     print("  crypto          - Show crypto markets")
     print("  sports          - Show sports markets")
     print("  buy <n> <amt>   - Buy market #n for $amt")
@@ -391,64 +503,25 @@ def interactive_mode():
     
     while True:
         try:
-            cmd = input(">>> ").strip().lower().split()
+            raw = input(">>> ").strip()
+            if not raw:
+                continue
             
+            # shlex keeps quoted terms together: find "world cup".
+            # Only the verb is case-insensitive; arguments pass through as typed.
+            cmd = shlex.split(raw)
             if not cmd:
                 continue
             
-            action = cmd[0]
+            action, args = cmd[0].lower(), cmd[1:]
             
             if action == "quit" or action == "exit":
                 print("👋 Goodbye!")
                 break
             
-            elif action == "find":
-                term = " ".join(cmd[1:]) if len(cmd) > 1 else ""
-                markets = trader.find_markets(term)
-            
-            elif action == "crypto":
-                markets = trader.get_crypto_markets()
-                for i, m in enumerate(markets[:10], 1):
-                    print(f"{i}. {m.question[:50]}... ({m.price_yes*100:.0f}¢)")
-            
-            elif action == "sports":
-                markets = trader.get_sports_markets()
-                for i, m in enumerate(markets[:10], 1):
-                    print(f"{i}. {m.question[:50]}... ({m.price_yes*100:.0f}¢)")
-            
-            elif action == "buy":
-                if len(cmd) < 3:
-                    print("Usage: buy <market#> <amount>")
-                    print("Example: buy 1 50  (buy $50 of market #1)")
-                    continue
-                
-                idx = int(cmd[1]) - 1
-                amt = float(cmd[2])
-                
-                if idx < 0 or idx >= len(markets):
-                    print("Invalid market number")
-                    continue
-                
-                result = trader.buy(
-                    market=markets[idx],
-                    amount=amt,
-                    take_profit_percent=50,
-                    stop_loss_percent=25
-                )
-                print(result.message)
-            
-            elif action == "positions":
-                trader.show_positions()
-            
-            elif action == "orders":
-                trader.show_orders()
-            
-            elif action == "start":
-                trader.start_monitoring()
-            
-            elif action == "help":
-                print("Commands: find, crypto, sports, buy, sell, positions, orders, start, quit")
-            
+            handler = COMMANDS.get(action)
+            if handler:
+                markets = handler(trader, args, markets)
             else:
                 print(f"Unknown command: {action}")
                 print("Type 'help' for commands")
@@ -458,8 +531,12 @@ def interactive_mode():
             break
         except Exception as e:
             print(f"Error: {e}")
+    
+    print(trader.fetcher.cache_summary())
 
 
 # Quick start
 if __name__ == "__main__":
+    from bot_logging import setup_logging
+    setup_logging()
     interactive_mode()
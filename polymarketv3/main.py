@@ -12,6 +12,7 @@ Usage:
 """
 
 import argparse
+import heapq
 import sys
 import time
 from datetime import datetime
@@ -24,6 +25,9 @@ from portfolio import PortfolioManager
 from arbitrage import ArbitrageDetector
 from trader import Trader, StrategyExecutor
 from auto_trader import AutoTrader, AutoTradeConfig, AutoStrategy
+from services import get_service, peek_service
+import logging
+logger = logging.getLogger(__name__)
 
 
 def print_banner():
@@ -40,16 +44,25 @@ def print_banner():
     print(banner)
 
 
+def _format_listing(markets) -> str:
+    """Render a scan listing as one string so it is written in a single call."""
+    return "".join(
+        f"  • {m.question_short}...\n"
+        f"    YES: ${m.price_yes:.2f} | Volume: ${m.volume:,.0f}\n"
+        for m in markets
+    )
+
+
 def mode_scan():
     """Scan and display available markets."""
     print("\n📊 MARKET SCANNER")
     print("="*60)
     
-    fetcher = MarketFetcher()
+    fetcher = get_service("fetcher", MarketFetcher)
     
     # Get markets
     print("\nFetching markets...")
-    markets = fetcher.get_all_target_markets(
+    markets = fetcher.get_markets(
         min_liquidity=config.trading.min_market_liquidity
     )
     
@@ -57,27 +70,26 @@ def mode_scan():
         print("No markets found matching criteria")
         return
     
-    # Sort by volume
-    markets.sort(key=lambda m: m.volume, reverse=True)
-    
     # Display results
-    print(f"\n✅ Found {len(markets)} markets\n")
+    logger.info("✅ Found %d markets", len(markets))
+    
+    # Split by category in one pass (categories are "crypto" / "sports:<league>")
+    crypto, sports = [], []
+    for m in markets:
+        if m.category_lower.startswith("crypto"):
+            crypto.append(m)
+        elif m.category_lower.startswith("sports"):
+            sports.append(m)
     
     # Crypto markets
-    crypto = [m for m in markets if "crypto" in m.category.lower()]
     print(f"🪙 CRYPTO MARKETS ({len(crypto)}):")
     print("-"*60)
-    for m in crypto[:10]:
-        print(f"  • {m.question[:50]}...")
-        print(f"    YES: ${m.price_yes:.2f} | Volume: ${m.volume:,.0f}")
+    sys.stdout.write(_format_listing(heapq.nlargest(10, crypto, key=lambda m: m.volume)))
     
     # Sports markets
-    sports = [m for m in markets if "sports" in m.category.lower()]
     print(f"\n🏀 SPORTS MARKETS ({len(sports)}):")
     print("-"*60)
-    for m in sports[:10]:
-        print(f"  • {m.question[:50]}...")
-        print(f"    YES: ${m.price_yes:.2f} | Volume: ${m.volume:,.0f}")
+    sys.stdout.write(_format_listing(heapq.nlargest(10, sports, key=lambda m: m.volume)))
     
     print("\n" + "="*60)
 
@@ -87,12 +99,12 @@ def mode_track():
     print("\n📈 ODDS TRACKER")
     print("="*60)
     
-    fetcher = MarketFetcher()
+    fetcher = get_service("fetcher", MarketFetcher)
     tracker = OddsTracker()
     
     # Fetch top markets
     print("\nFetching markets to track...")
-    markets = fetcher.get_all_target_markets(
+    markets = fetcher.get_markets(
         min_liquidity=config.trading.min_market_liquidity
     )
     
@@ -100,18 +112,16 @@ def mode_track():
         print("No markets found")
         return
     
-    # Sort by volume and track top 10
-    markets.sort(key=lambda m: m.volume, reverse=True)
+    # Track the top 10 by volume
+    top = heapq.nlargest(10, markets, key=lambda m: m.volume)
+    tracker.add_markets(top)
     
-    for m in markets[:10]:
-        tracker.add_market(m.token_id_yes, m.question)
-        
-        # Add alert for significant price changes
-        tracker.add_alert(
-            m.token_id_yes,
-            condition="change",
-            threshold=config.alerts.price_change_threshold
-        )
+    # Add alert for significant price changes
+    tracker.add_alerts(
+        [m.token_id_yes for m in top],
+        condition="change",
+        threshold=config.alerts.price_change_threshold
+    )
     
     print(f"\n✅ Tracking {len(tracker.tracked_markets)} markets")
     print("Press Ctrl+C to stop\n")
@@ -125,7 +135,7 @@ def mode_portfolio():
     print("\n💼 PORTFOLIO MANAGER")
     print("="*60)
     
-    portfolio = PortfolioManager()
+    portfolio = get_service("portfolio", PortfolioManager)
     
     if not config.has_credentials:
         print("\n⚠️ No credentials configured")
@@ -158,11 +168,11 @@ def mode_arbitrage():
     print("\n💰 ARBITRAGE SCANNER")
     print("="*60)
     
-    fetcher = MarketFetcher()
-    detector = ArbitrageDetector()
+    fetcher = get_service("fetcher", MarketFetcher)
+    detector = get_service("arbitrage", ArbitrageDetector)
     
     print("\nFetching markets...")
-    markets = fetcher.get_all_target_markets(
+    markets = fetcher.get_markets(
         min_liquidity=1000  # Lower threshold for arb scanning
     )
     
@@ -208,18 +218,40 @@ def mode_trade():
         for issue in issues:
             print(f"  - {issue}")
 
+    trading = config.trading
+    min_liq, max_exp = trading.min_market_liquidity, trading.max_total_exposure
+    
     auto_config = AutoTradeConfig(
-        bankroll=config.trading.max_total_exposure,
-        max_bet_size=config.trading.max_trade_size,
-        min_liquidity=config.trading.min_market_liquidity,
+        bankroll=max_exp,
+        max_bet_size=trading.max_trade_size,
+        min_liquidity=min_liq,
         strategy=AutoStrategy.MIXED,
     )
     bot = AutoTrader(config=auto_config)
 
-    print("\n✅ AutoTrader initialized (live mode)!")
-    print(f"   Max trade size: ${auto_config.max_bet_size}")
-    print(f"   Bankroll cap: ${auto_config.bankroll}")
-    print(f"   Min liquidity: ${auto_config.min_liquidity}")
+    logger.info("✅ AutoTrader initialized (live mode)!")
+    logger.info("   Max trade size: $%s", auto_config.max_bet_size)
+    logger.info("   Bankroll cap: $%s", auto_config.bankroll)
+    logger.info("   Min liquidity: $%s", auto_config.min_liquidity)
+
+    # Stream prices for the busiest markets; a sharp move wakes the scan
+    # loop early, scan_interval remains the heartbeat between moves
+    fetcher = get_service("fetcher", MarketFetcher)
+    watched = heapq.nlargest(
+        10,
+        fetcher.get_markets(min_liquidity=min_liq),
+        key=lambda m: m.volume
+    )
+    bot.tracker.add_markets(watched)
+    bot.tracker.add_alerts(
+        [m.token_id_yes for m in watched],
+        condition="change",
+        threshold=config.alerts.price_change_threshold,
+        callback=bot.wake,
+        repeat=True
+    )
+    bot.tracker.start_stream()
+
     print("\n🔄 Starting AutoTrader loop...")
     print("Press Ctrl+C to stop\n")
 
@@ -227,6 +259,8 @@ def mode_trade():
         bot.run()
     except KeyboardInterrupt:
         print("\n\n⏹️ Trading bot stopped")
+    finally:
+        bot.tracker.stop()
 
 
 def main():
@@ -266,8 +300,9 @@ For more info, see README.md
     # Print config status
     print(f"Configuration:")
     print(f"  Credentials: {'✅ Configured' if config.has_credentials else '❌ Not configured'}")
-    print(f"  Min liquidity: ${config.trading.min_market_liquidity:,.0f}")
-    print(f"  Max trade size: ${config.trading.max_trade_size:,.0f}")
+    trading = config.trading
+    print(f"  Min liquidity: ${trading.min_market_liquidity:,.0f}")
+    print(f"  Max trade size: ${trading.max_trade_size:,.0f}")
     
     # Run selected mode
     modes = {
@@ -283,6 +318,10 @@ For more info, see README.md
     except Exception as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
+    finally:
+        fetcher = peek_service("fetcher")
+        if fetcher:
+            print(fetcher.cache_summary())
 
 
 if __name__ == "__main__":
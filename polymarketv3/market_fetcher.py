@@ -3,15 +3,66 @@ Market Fetcher - Retrieves markets from Polymarket's Gamma API.
 Filters for Sports and Crypto categories only.
 """
 
+import heapq
+import threading
+import time
+import numpy as np
+import orjson
 import requests
+import urllib3
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from config import config
 import logging
 logger = logging.getLogger(__name__)
 
+# How long get_markets() serves a category from memory before re-fetching
+MARKET_CACHE_TTL_SECONDS = 30
 
-@dataclass
+# How long a decoded Gamma GET response is reused for identical
+# (endpoint, params), and how many distinct responses are kept
+RESPONSE_CACHE_TTL_SECONDS = 30
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Concurrent /events requests in get_sports_markets (one per series)
+SERIES_FETCH_WORKERS = 16
+
+# Keep-alive connections the pool may hold open per host; sized above
+# SERIES_FETCH_WORKERS so concurrent fetches never wait for a connection
+HTTP_POOL_SIZE = 32
+
+# Length of Market.question_short, the truncated question used in listings
+QUESTION_SHORT_LEN = 50
+
+# Gamma's usual stringified outcomes; matched verbatim to skip a JSON parse
+_YES_NO_OUTCOMES = '["Yes", "No"]'
+
+
+def _parse_outcome_prices(raw) -> tuple[float, float]:
+    """
+    Return (price_yes, price_no) from Gamma's outcomePrices field.
+    
+    The field is almost always the string '["0.52", "0.48"]', which is
+    split on its quotes directly; anything else goes through orjson.
+    Missing prices default to 0.5 / the complement, as before.
+    """
+    if isinstance(raw, str):
+        parts = raw.split('"')
+        if len(parts) == 5 and parts[0] == "[" and parts[2].strip() == "," and parts[4] == "]":
+            try:
+                return float(parts[1]), float(parts[3])
+            except ValueError:
+                pass
+        raw = orjson.loads(raw)
+    
+    price_yes = float(raw[0]) if raw else 0.5
+    price_no = float(raw[1]) if len(raw) > 1 else 1 - price_yes
+    return price_yes, price_no
+
+
+@dataclass(slots=True, frozen=True)
 class Market:
     """Represents a Polymarket market."""
     id: str
@@ -29,6 +80,22 @@ class Market:
     end_date: Optional[str] = None
     description: Optional[str] = None
     
+    # Derived once at construction for search and listing code
+    # (question_lower is casefolded so non-ASCII searches match too)
+    question_lower: str = field(init=False, repr=False)
+    question_short: str = field(init=False, repr=False)
+    category_lower: str = field(init=False, repr=False)
+    slug_lower: str = field(init=False, repr=False)
+    id_lower: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Frozen: derived fields have to bypass the generated __setattr__
+        object.__setattr__(self, "question_lower", self.question.casefold())
+        object.__setattr__(self, "question_short", self.question[:QUESTION_SHORT_LEN])
+        object.__setattr__(self, "category_lower", self.category.lower())
+        object.__setattr__(self, "slug_lower", (self.slug or "").lower())
+        object.__setattr__(self, "id_lower", self.id.lower())
+    
     @property
     def spread(self) -> float:
         """Calculate bid-ask spread."""
@@ -40,7 +107,7 @@ class Market:
         return self.price_yes
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class Event:
     """Represents a Polymarket event (can contain multiple markets)."""
     id: str
@@ -54,6 +121,82 @@ class Event:
     closed: bool
 
 
+@dataclass
+class MarketTable:
+    """
+    Column arrays over a list of markets, for vectorized filter/sort.
+    
+    Row i of every array describes markets[i]. Build once per fetched list
+    (MarketFetcher caches one per category) and query many times; Market
+    objects are only touched again when rows are materialized via take().
+    """
+    markets: list[Market]
+    question_lower: np.ndarray = field(repr=False)
+    volume: np.ndarray = field(repr=False)
+    liquidity: np.ndarray = field(repr=False)
+    price_yes: np.ndarray = field(repr=False)
+    price_no: np.ndarray = field(repr=False)
+    
+    @classmethod
+    def from_markets(cls, markets: list[Market]) -> "MarketTable":
+        n = len(markets)
+        return cls(
+            markets=markets,
+            question_lower=np.array([m.question_lower for m in markets], dtype=str),
+            volume=np.fromiter((m.volume for m in markets), dtype=float, count=n),
+            liquidity=np.fromiter((m.liquidity for m in markets), dtype=float, count=n),
+            price_yes=np.fromiter((m.price_yes for m in markets), dtype=float, count=n),
+            price_no=np.fromiter((m.price_no for m in markets), dtype=float, count=n),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.markets)
+    
+    def __getitem__(self, row: int) -> Market:
+        return self.markets[row]
+    
+    def take(self, rows) -> list[Market]:
+        """Materialize the Market objects at the given row indices, in order."""
+        markets = self.markets
+        return [markets[i] for i in rows]
+    
+    def liquid(self, min_liquidity: float) -> np.ndarray:
+        """Row indices (ascending) of markets with at least min_liquidity."""
+        return np.flatnonzero(self.liquidity >= min_liquidity)
+    
+    def match(self, needle: str = "") -> np.ndarray:
+        """
+        Row indices of markets whose question contains needle.
+        
+        Args:
+            needle: Casefolded search term ("" matches everything)
+        """
+        rows = np.arange(len(self.markets))
+        if needle:
+            rows = rows[np.char.find(self.question_lower, needle) >= 0]
+        return rows
+    
+    def by_volume(self, rows: np.ndarray, top_n: Optional[int] = None) -> list[Market]:
+        """
+        Markets at the given rows, highest volume first.
+        
+        Args:
+            rows: Row indices, e.g. from match()
+            top_n: Only return this many (selected without a full sort)
+        """
+        if top_n is not None and top_n < len(rows):
+            # nlargest is O(N log k) and keeps input order on ties,
+            # same as the stable argsort below
+            rows = heapq.nlargest(top_n, rows, key=self.volume.__getitem__)
+        else:
+            rows = rows[np.argsort(-self.volume[rows], kind="stable")]
+        return self.take(rows)
+    
+    def search(self, needle: str = "", top_n: Optional[int] = None) -> list[Market]:
+        """Markets whose question contains needle, highest volume first."""
+        return self.by_volume(self.match(needle), top_n)
+
+
 class MarketFetcher:
     """
     Fetches and filters markets from Polymarket's Gamma API.
@@ -69,19 +212,90 @@ class MarketFetcher:
         
         # Get both categories
         all_markets = fetcher.get_all_target_markets()
+        
+        # Same, but served from a short-lived in-process cache
+        all_markets = fetcher.get_markets("all")
+        
+        # Drop cached responses and market lists before the next call
+        fetcher.invalidate()
     """
     
     def __init__(self):
         self.gamma_host = config.gamma_host
-        self.session = requests.Session()
+        # Gamma GETs go straight to a urllib3 pool: requests' Session/Response
+        # layer added per-call overhead and nothing _request uses. The pool
+        # keeps connections alive, gzip bodies are decoded on read, and
+        # transient failures are retried. raise_on_status=False hands the
+        # last response back so _request still reports the HTTP error.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            raise_on_status=False,
+        )
+        self._pool = urllib3.PoolManager(
+            maxsize=HTTP_POOL_SIZE,
+            retries=retry,
+            timeout=30,
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
         self._sports_metadata = None
+        # Each category is fetched unfiltered into a MarketTable (keyed
+        # (category, None)); min-liquidity views are masks over it
+        self._table_cache: dict[tuple, tuple[float, MarketTable]] = {}  # (category, min_liq) → (fetched_at, table)
+        self._market_cache: dict[tuple, tuple[float, list[Market]]] = {}  # (category, min_liq) → (fetched_at, markets)
+        self.cache_stats = {"hits": 0, "misses": 0}
+        # Short-lived cache of decoded responses, shared by the series
+        # fetch threads: (endpoint, sorted params) → (fetched_at, data)
+        self._response_cache: dict[tuple, tuple[float, object]] = {}
+        self._response_lock = threading.Lock()
     
     def _request(self, endpoint: str, params: Optional[dict] = None) -> dict:
-        """Make a GET request to the Gamma API."""
+        """
+        Make a GET request to the Gamma API.
+        
+        Identical requests within RESPONSE_CACHE_TTL_SECONDS are answered
+        from memory; call invalidate() to force a refetch.
+        
+        Errors are raised as requests exceptions, as when this went through
+        requests.Session: requests.HTTPError for a 4xx/5xx status (after
+        the pool's retries) and requests.ConnectionError for urllib3-level
+        failures (connection, timeout, retries exhausted). A body that is
+        not JSON raises orjson.JSONDecodeError, a ValueError.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        now = time.monotonic()
+        with self._response_lock:
+            cached = self._response_cache.get(key)
+        if cached and now - cached[0] < RESPONSE_CACHE_TTL_SECONDS:
+            return cached[1]
+        
         url = f"{self.gamma_host}{endpoint}"
-        response = self.session.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        try:
+            response = self._pool.request("GET", url, fields=params)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(f"{e} for url: {url}") from e
+        if response.status >= 400:
+            raise requests.HTTPError(f"{response.status} Error for url: {url}")
+        # orjson parses the raw bytes directly (several times faster than
+        # response.json() on the large /events payloads)
+        data = orjson.loads(response.data)
+        
+        with self._response_lock:
+            self._response_cache.pop(key, None)
+            if len(self._response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[key] = (now, data)
+        return data
+    
+    def invalidate(self):
+        """Drop every cached response and market list so the next call refetches."""
+        with self._response_lock:
+            self._response_cache.clear()
+        self._sports_metadata = None
+        self._table_cache.clear()
+        self._market_cache.clear()
     
     def get_tags(self) -> list[dict]:
         """Get all available market tags/categories."""
@@ -96,28 +310,37 @@ class MarketFetcher:
             self._sports_metadata = self._request("/sports")
         return self._sports_metadata
     
-    def _parse_market(self, market_data: dict, category: str) -> Optional[Market]:
-        """Parse raw market data into Market object."""
+    def _parse_market(
+        self,
+        market_data: dict,
+        category: str,
+        min_liquidity: Optional[float] = None,
+    ) -> Optional[Market]:
+        """
+        Parse raw market data into Market object.
+        
+        Markets below min_liquidity are rejected before anything else is
+        parsed, so filtered-out markets cost one float conversion.
+        """
         try:
+            liquidity = float(market_data.get("liquidity", 0) or 0)
+            if min_liquidity is not None and liquidity < min_liquidity:
+                return None
+            
             # Parse token IDs from clobTokenIds field
             clob_token_ids = market_data.get("clobTokenIds", [])
             if len(clob_token_ids) < 2:
                 return None
             
             # Parse prices
-            outcome_prices = market_data.get("outcomePrices", "[]")
-            if isinstance(outcome_prices, str):
-                import json
-                outcome_prices = json.loads(outcome_prices)
-            
-            price_yes = float(outcome_prices[0]) if outcome_prices else 0.5
-            price_no = float(outcome_prices[1]) if len(outcome_prices) > 1 else 1 - price_yes
+            price_yes, price_no = _parse_outcome_prices(market_data.get("outcomePrices", "[]"))
             
             # Parse outcomes
-            outcomes = market_data.get("outcomes", '["Yes", "No"]')
-            if isinstance(outcomes, str):
-                import json
-                outcomes = json.loads(outcomes)
+            outcomes = market_data.get("outcomes", _YES_NO_OUTCOMES)
+            if outcomes == _YES_NO_OUTCOMES:
+                outcomes = ["Yes", "No"]
+            elif isinstance(outcomes, str):
+                outcomes = orjson.loads(outcomes)
             
             return Market(
                 id=str(market_data.get("id", "")),
@@ -130,7 +353,7 @@ class MarketFetcher:
                 price_yes=price_yes,
                 price_no=price_no,
                 volume=float(market_data.get("volume", 0) or 0),
-                liquidity=float(market_data.get("liquidity", 0) or 0),
+                liquidity=liquidity,
                 category=category,
                 end_date=market_data.get("endDate"),
                 description=market_data.get("description"),
@@ -139,12 +362,17 @@ class MarketFetcher:
             logger.error(f"Error parsing market: {e}")
             return None
     
-    def _parse_event(self, event_data: dict, category: str) -> Optional[Event]:
-        """Parse raw event data into Event object."""
+    def _parse_event(
+        self,
+        event_data: dict,
+        category: str,
+        min_liquidity: Optional[float] = None,
+    ) -> Optional[Event]:
+        """Parse raw event data into Event object (keeping markets with >= min_liquidity)."""
         try:
             markets = []
             for m in event_data.get("markets", []):
-                market = self._parse_market(m, category)
+                market = self._parse_market(m, category, min_liquidity)
                 if market:
                     markets.append(market)
             
@@ -163,6 +391,24 @@ class MarketFetcher:
             logger.error(f"Error parsing event: {e}")
             return None
     
+    def _iter_markets(
+        self,
+        events_data: list[dict],
+        category: str,
+        min_liquidity: Optional[float] = None,
+    ):
+        """
+        Yield the markets of each /events entry, one event at a time.
+        
+        The liquidity filter is applied while parsing, so callers collect
+        only what they keep and never hold an intermediate list of parsed
+        Events.
+        """
+        for event_data in events_data:
+            event = self._parse_event(event_data, category, min_liquidity)
+            if event is not None:
+                yield from event.markets
+    
     def get_crypto_markets(
         self,
         limit: int = 100,
@@ -192,16 +438,7 @@ class MarketFetcher:
             params["closed"] = "false"
         
         events_data = self._request("/events", params)
-        
-        markets = []
-        for event_data in events_data:
-            event = self._parse_event(event_data, "crypto")
-            if event:
-                for market in event.markets:
-                    if min_liquidity is None or market.liquidity >= min_liquidity:
-                        markets.append(market)
-        
-        return markets
+        return list(self._iter_markets(events_data, "crypto", min_liquidity))
     
     def get_sports_markets(
         self,
@@ -225,9 +462,8 @@ class MarketFetcher:
         # Get sports metadata to find series IDs
         sports_meta = self.get_sports_metadata()
         
-        markets = []
-        
-        # Iterate through sports leagues
+        # Build one /events request per series (league) across all sports
+        jobs = []  # (series_id, category, params)
         for sport in sports_meta:
             sport_name = sport.get("label", "")
             
@@ -252,15 +488,20 @@ class MarketFetcher:
                     params["active"] = "true"
                     params["closed"] = "false"
                 
+                jobs.append((series_id, f"sports:{sport_name}", params))
+        
+        markets = []
+        if not jobs:
+            return markets
+        
+        # Requests are independent and network-bound, so overlap them on the
+        # session's pooled connections; results are consumed in series order
+        with ThreadPoolExecutor(max_workers=min(SERIES_FETCH_WORKERS, len(jobs))) as pool:
+            futures = [pool.submit(self._request, "/events", params) for _, _, params in jobs]
+            
+            for (series_id, category, _), future in zip(jobs, futures):
                 try:
-                    events_data = self._request("/events", params)
-                    
-                    for event_data in events_data:
-                        event = self._parse_event(event_data, f"sports:{sport_name}")
-                        if event:
-                            for market in event.markets:
-                                if min_liquidity is None or market.liquidity >= min_liquidity:
-                                    markets.append(market)
+                    markets.extend(self._iter_markets(future.result(), category, min_liquidity))
                 except Exception as e:
                     logger.error(f"Error fetching series {series_id}: {e}")
                     continue
@@ -284,26 +525,118 @@ class MarketFetcher:
         """
         all_markets = []
         
-        # Fetch crypto markets
-        logger.info("Fetching crypto markets...")
-        crypto = self.get_crypto_markets(
-            min_liquidity=min_liquidity,
-            active_only=active_only
-        )
+        # Crypto and sports hit independent endpoints, so overlap the
+        # round-trips instead of paying for them back to back
+        logger.info("Fetching crypto and sports markets...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            crypto_future = pool.submit(
+                self.get_crypto_markets,
+                min_liquidity=min_liquidity,
+                active_only=active_only
+            )
+            sports_future = pool.submit(
+                self.get_sports_markets,
+                min_liquidity=min_liquidity,
+                active_only=active_only
+            )
+            crypto = crypto_future.result()
+            sports = sports_future.result()
+        
         all_markets.extend(crypto)
         logger.info(f"  Found {len(crypto)} crypto markets")
-        
-        # Fetch sports markets
-        logger.info("Fetching sports markets...")
-        sports = self.get_sports_markets(
-            min_liquidity=min_liquidity,
-            active_only=active_only
-        )
         all_markets.extend(sports)
         logger.info(f"  Found {len(sports)} sports markets")
         
         return all_markets
     
+    def get_markets(
+        self,
+        category: str = "all",
+        min_liquidity: Optional[float] = None
+    ) -> list[Market]:
+        """
+        Fetch markets for a category, reusing results for MARKET_CACHE_TTL_SECONDS.
+        
+        Args:
+            category: "crypto", "sports", or "all"
+            min_liquidity: Minimum liquidity filter (USDC)
+        
+        Returns:
+            A fresh list of Market objects (safe for callers to sort/filter)
+        """
+        return list(self._cached_markets(category, min_liquidity)[1])
+    
+    def get_market_table(
+        self,
+        category: str = "all",
+        min_liquidity: Optional[float] = None
+    ) -> MarketTable:
+        """
+        Same markets as get_markets(), as a MarketTable.
+        
+        The table is built once per cached market list and reused until
+        the list itself is refreshed.
+        """
+        key = (category, min_liquidity)
+        fetched_at, markets = self._cached_markets(category, min_liquidity)
+        
+        cached = self._table_cache.get(key)
+        if cached and cached[0] == fetched_at:
+            return cached[1]
+        
+        table = MarketTable.from_markets(markets)
+        self._table_cache[key] = (fetched_at, table)
+        return table
+    
+    def _cached_markets(
+        self,
+        category: str,
+        min_liquidity: Optional[float]
+    ) -> tuple[float, list[Market]]:
+        """Return (fetched_at, markets) for category, filtered to min_liquidity."""
+        fetched_at, table = self._category_table(category)
+        if min_liquidity is None:
+            return fetched_at, table.markets
+        
+        key = (category, min_liquidity)
+        cached = self._market_cache.get(key)
+        if cached and cached[0] == fetched_at:
+            return cached
+        
+        # Vectorized liquidity mask over the category's columns; keeps
+        # fetch order, same as filtering while parsing
+        entry = (fetched_at, table.take(table.liquid(min_liquidity)))
+        self._market_cache[key] = entry
+        return entry
+    
+    def _category_table(self, category: str) -> tuple[float, MarketTable]:
+        """Return the unfiltered (fetched_at, table) for category, re-fetching if expired."""
+        key = (category, None)
+        now = time.monotonic()
+        
+        cached = self._table_cache.get(key)
+        if cached and now - cached[0] < MARKET_CACHE_TTL_SECONDS:
+            self.cache_stats["hits"] += 1
+            return cached
+        
+        self.cache_stats["misses"] += 1
+        if category == "crypto":
+            markets = self.get_crypto_markets()
+        elif category == "sports":
+            markets = self.get_sports_markets()
+        else:
+            markets = self.get_all_target_markets()
+        
+        self._table_cache[key] = (now, MarketTable.from_markets(markets))
+        return self._table_cache[key]
+    
+    def cache_summary(self) -> str:
+        """One-line hit-rate summary for the get_markets() cache."""
+        hits = self.cache_stats["hits"]
+        total = hits + self.cache_stats["misses"]
+        rate = hits / total * 100 if total else 0.0
+        return f"Market cache: {hits}/{total} hits ({rate:.0f}%)"
+    
     def get_market_by_slug(self, slug: str) -> Optional[Market]:
         """
         Fetch a specific market by its slug.
@@ -370,7 +703,7 @@ def scan_markets():
     # Show top 10
     logger.info("Top 10 markets by volume:\n")
     for i, market in enumerate(markets[:10], 1):
-        logger.info(f"{i}. [{market.category}] {market.question[:50]}...")
+        logger.info(f"{i}. [{market.category}] {market.question_short}...")
         logger.info(f"   YES: ${market.price_yes:.2f} | NO: ${market.price_no:.2f}")
         logger.info(f"   Volume: ${market.volume:,.0f} | Liquidity: ${market.liquidity:,.0f}")
         logger.info()
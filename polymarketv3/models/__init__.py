@@ -22,7 +22,7 @@ Usage:
     momentum = MomentumModel(db=db)  # Needs persistence layer running
 """
 
-from models.base import ProbabilityModel, ProbabilityEstimate
+from models.base import ProbabilityModel, ProbabilityEstimate, batch_edges, batch_expected_values
 from models.manual import ManualModel
 from models.odds_api import OddsApiModel
 from models.momentum import MomentumModel
@@ -30,6 +30,8 @@ from models.momentum import MomentumModel
 __all__ = [
     "ProbabilityModel",
     "ProbabilityEstimate",
+    "batch_edges",
+    "batch_expected_values",
     "ManualModel",
     "OddsApiModel",
     "MomentumModel",
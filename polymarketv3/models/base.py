@@ -12,10 +12,13 @@ crypto market), it returns None.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
+
+import numpy as np
+
 from market_fetcher import Market
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProbabilityEstimate:
     """An independent probability estimate for a market outcome."""
 
@@ -64,6 +67,39 @@ class ProbabilityEstimate:
         return (fair / market_price) - 1.0
 
 
+def _side_fair(fair_yes: np.ndarray, side_yes) -> np.ndarray:
+    """Fair probability of the chosen side (side_yes: bool or bool array)."""
+    fair_yes = np.asarray(fair_yes, dtype=float)
+    return np.where(side_yes, fair_yes, 1.0 - fair_yes)
+
+
+def batch_edges(fair_yes, prices, side_yes) -> np.ndarray:
+    """
+    Vectorized ProbabilityEstimate.edge_vs_market over many markets.
+
+    Args:
+        fair_yes: Estimated YES probabilities, one per market
+        prices: Market price of the side being scored, one per market
+        side_yes: True to score YES, False for NO (scalar or per market)
+
+    Returns edge percentages; 0.0 where the price is not positive.
+    """
+    fair = _side_fair(fair_yes, side_yes)
+    prices = np.asarray(prices, dtype=float)
+    edges = np.zeros_like(prices)
+    np.divide(fair - prices, prices, out=edges, where=prices > 0)
+    return edges * 100
+
+
+def batch_expected_values(fair_yes, prices, side_yes) -> np.ndarray:
+    """Vectorized ProbabilityEstimate.expected_value; same arguments as batch_edges."""
+    fair = _side_fair(fair_yes, side_yes)
+    prices = np.asarray(prices, dtype=float)
+    ev = np.zeros_like(prices)
+    np.divide(fair, prices, out=ev, where=prices > 0)
+    return np.where(prices > 0, ev - 1.0, 0.0)
+
+
 class ProbabilityModel(ABC):
     """
     Abstract base class for probability estimation models.
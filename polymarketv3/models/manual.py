@@ -30,6 +30,7 @@ JSON format:
 
 import json
 import os
+import re
 from typing import Optional
 from dataclasses import dataclass
 
@@ -37,7 +38,7 @@ from market_fetcher import Market
 from models.base import ProbabilityModel, ProbabilityEstimate
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ManualEstimateEntry:
     """A single user-supplied estimate."""
     fair_yes: float
@@ -56,6 +57,10 @@ class ManualModel(ProbabilityModel):
 
     def __init__(self):
         self._estimates: dict[str, ManualEstimateEntry] = {}
+        # Partial-match index over _estimates, rebuilt lazily after edits
+        self._partial_pattern: Optional[re.Pattern] = None
+        self._partial_keys: list[str] = []
+        self._partial_rank: dict[str, int] = {}
 
     @property
     def name(self) -> str:
@@ -85,26 +90,28 @@ class ManualModel(ProbabilityModel):
             confidence=confidence,
             reason=reason,
         )
+        self._partial_pattern = None
 
     def remove_estimate(self, market_id_or_slug: str):
         """Remove an estimate."""
         self._estimates.pop(market_id_or_slug.lower(), None)
+        self._partial_pattern = None
 
     def clear(self):
         """Remove all estimates."""
         self._estimates.clear()
+        self._partial_pattern = None
 
     def estimate(self, market: Market) -> Optional[ProbabilityEstimate]:
-        # Try matching by ID, then by slug
-        entry = self._estimates.get(market.id.lower())
-        if entry is None:
-            entry = self._estimates.get(market.slug.lower()) if market.slug else None
+        # Try matching by ID, then by slug (keys are lowercased at set time,
+        # the market's lowercase forms at construction)
+        estimates = self._estimates
+        entry = estimates.get(market.id_lower)
+        if entry is None and market.slug:
+            entry = estimates.get(market.slug_lower)
         if entry is None:
             # Try partial slug match (user might use a shortened version)
-            for key, val in self._estimates.items():
-                if key in market.slug.lower() or key in market.question.lower():
-                    entry = val
-                    break
+            entry = self._partial_match(market.slug_lower, market.question_lower)
 
         if entry is None:
             return None
@@ -117,6 +124,37 @@ class ManualModel(ProbabilityModel):
             reasoning=entry.reason,
         )
 
+    def _partial_match(self, *texts: str) -> Optional[ManualEstimateEntry]:
+        """
+        Find the earliest-added estimate whose key occurs in any of texts.
+
+        All keys are searched in one regex pass per text instead of one
+        substring scan per key. The lookahead reports a match at every
+        position, and at each position the alternation tries keys in
+        insertion order, so the lowest rank seen is the same entry the
+        plain "first key that is a substring" loop would pick.
+        """
+        if not self._estimates:
+            return None
+        if self._partial_pattern is None:
+            self._partial_keys = list(self._estimates)
+            self._partial_rank = {key: i for i, key in enumerate(self._partial_keys)}
+            self._partial_pattern = re.compile(
+                "(?=(" + "|".join(map(re.escape, self._partial_keys)) + "))"
+            )
+
+        best = None
+        for text in texts:
+            for match in self._partial_pattern.finditer(text):
+                rank = self._partial_rank[match.group(1)]
+                if best is None or rank < best:
+                    best = rank
+                    if best == 0:
+                        break
+        if best is None:
+            return None
+        return self._estimates[self._partial_keys[best]]
+
     @classmethod
     def from_file(cls, filepath: str) -> "ManualModel":
         """Load estimates from a JSON file."""
@@ -24,6 +24,8 @@ This model bets WITH the trend (momentum continuation), not against it.
 from typing import Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from market_fetcher import Market
 from models.base import ProbabilityModel, ProbabilityEstimate
 
@@ -76,17 +78,46 @@ class MomentumModel(ProbabilityModel):
         self._db = db
 
     def estimate(self, market: Market) -> Optional[ProbabilityEstimate]:
-        if self._db is None:
-            return None
+        return self.batch_estimate([market]).get(market.id)
+
+    def batch_estimate(
+        self, markets: list[Market]
+    ) -> dict[str, ProbabilityEstimate]:
+        """
+        Estimate momentum for many markets with a single price-history query.
 
+        Both tokens of every market are fetched together instead of issuing
+        two get_price_history() calls per market.
+        """
+        if self._db is None or not markets:
+            return {}
+
+        # One lookback cutoff for the whole batch
+        cutoff = datetime.now() - timedelta(hours=self.lookback_hours)
+        token_ids = [m.token_id_yes for m in markets] + [m.token_id_no for m in markets]
+        histories = self._db.get_price_histories_bulk(
+            token_ids, as_arrays=True, since=cutoff
+        )
+
+        results = {}
+        for market in markets:
+            est = self._estimate_from_histories(market, histories)
+            if est is not None:
+                results[market.id] = est
+        return results
+
+    def _estimate_from_histories(
+        self, market: Market, histories: dict[str, dict[str, np.ndarray]]
+    ) -> Optional[ProbabilityEstimate]:
+        """Build an estimate for one market from pre-fetched price histories."""
         # Analyze YES side momentum
-        yes_result = self._analyze_token(
-            market.token_id_yes, market.price_yes, "YES"
+        yes_result = self._analyze_token_from_prices(
+            histories.get(market.token_id_yes), market.price_yes, "YES"
         )
 
         # Analyze NO side momentum
-        no_result = self._analyze_token(
-            market.token_id_no, market.price_no, "NO"
+        no_result = self._analyze_token_from_prices(
+            histories.get(market.token_id_no), market.price_no, "NO"
         )
 
         # Pick the stronger signal (if any)
@@ -132,11 +163,11 @@ class MomentumModel(ProbabilityModel):
             ),
         )
 
-    def _analyze_token(
-        self, token_id: str, current_price: float, side: str
+    def _analyze_token_from_prices(
+        self, history: Optional[dict[str, np.ndarray]], current_price: float, side: str
     ) -> Optional[tuple[str, float, int, float, float]]:
         """
-        Analyze price history for a single token.
+        Analyze pre-fetched price history (column arrays) for a single token.
 
         Returns (side, edge_pct, direction, consistency, delta_pct) or None.
         direction: +1 for uptrend, -1 for downtrend.
@@ -145,27 +176,21 @@ class MomentumModel(ProbabilityModel):
         if current_price < self.min_price or current_price > self.max_price:
             return None
 
-        # Get price history
-        history = self._db.get_price_history(
-            token_id, hours=self.lookback_hours
-        )
-
-        if len(history) < 3:
+        if history is None or history["timestamp"].size < 3:
             # Not enough data points
             return None
 
-        # Extract prices (use price_yes column for YES tokens, price_no for NO)
-        if side == "YES":
-            prices = [h.get("price_yes", 0) for h in history if h.get("price_yes")]
-        else:
-            prices = [h.get("price_no", 0) for h in history if h.get("price_no")]
+        # Extract prices (use price_yes column for YES tokens, price_no for NO),
+        # skipping missing (NaN) and zero observations
+        prices = history["price_yes" if side == "YES" else "price_no"]
+        prices = prices[~np.isnan(prices) & (prices != 0)]
 
-        if len(prices) < 3:
+        if prices.size < 3:
             return None
 
         # Compute overall delta
-        oldest_price = prices[0]
-        newest_price = prices[-1]
+        oldest_price = float(prices[0])
+        newest_price = float(prices[-1])
 
         if oldest_price <= 0:
             return None
@@ -177,14 +202,10 @@ class MomentumModel(ProbabilityModel):
             return None
 
         # Check consistency: what fraction of consecutive pairs moved in same direction?
+        # (flat pairs have sign 0 and never count)
         direction = 1 if delta_pct > 0 else -1
-        same_direction_count = 0
-        total_pairs = len(prices) - 1
-
-        for i in range(total_pairs):
-            move = prices[i + 1] - prices[i]
-            if (move > 0 and direction > 0) or (move < 0 and direction < 0):
-                same_direction_count += 1
+        total_pairs = prices.size - 1
+        same_direction_count = int(np.count_nonzero(np.sign(np.diff(prices)) == direction))
 
         consistency = same_direction_count / total_pairs if total_pairs > 0 else 0
 
@@ -20,7 +20,12 @@ The model:
 import os
 import re
 import time
-import requests
+import threading
+from functools import lru_cache
+import numpy as np
+import orjson
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 
@@ -44,6 +49,111 @@ SPORT_KEYS = [
 # Cache TTL: don't re-fetch within this window
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
+# Background refresh runs this long before cached odds would expire
+REFRESH_AHEAD_SECONDS = 30
+
+# The refresher only re-fetches sports whose events matched a market within
+# this window, and exits once batch_estimate has not been called for it
+REFRESH_IDLE_SECONDS = 900
+
+# Substrings that mark a question as sports-related
+SPORTS_KEYWORDS = [
+    "win", "beat", "defeat", "nba", "nfl", "mlb", "nhl", "mma",
+    "ufc", "fight", "championship", "super bowl", "world series",
+    "playoffs", "finals", "game", "match", "vs", "premier league",
+    "serie a", "la liga", "champions league", "epl",
+]
+
+# All keywords in one alternation: a single scan of the question
+# instead of one substring search per keyword
+_SPORTS_KEYWORDS_RE = re.compile("|".join(map(re.escape, SPORTS_KEYWORDS)))
+
+# Common team abbreviations / nicknames (full name → aliases)
+TEAM_ALIASES = {
+    "los angeles lakers": ["lakers", "la lakers"],
+    "golden state warriors": ["warriors", "gsw"],
+    "new york knicks": ["knicks", "ny knicks"],
+    "boston celtics": ["celtics"],
+    "miami heat": ["heat"],
+    "dallas mavericks": ["mavericks", "mavs"],
+    "denver nuggets": ["nuggets"],
+    "milwaukee bucks": ["bucks"],
+    "phoenix suns": ["suns"],
+    "philadelphia 76ers": ["76ers", "sixers"],
+    "new york yankees": ["yankees"],
+    "los angeles dodgers": ["dodgers"],
+    "kansas city chiefs": ["chiefs"],
+    "san francisco 49ers": ["49ers", "niners"],
+    "new england patriots": ["patriots", "pats"],
+    "green bay packers": ["packers"],
+}
+
+
+def _build_alias_index() -> dict[str, tuple[str, tuple[str, ...]]]:
+    """Map each full name and alias → (full name, aliases); first entry wins."""
+    index = {}
+    for full_name, aliases in TEAM_ALIASES.items():
+        for name in (full_name, *aliases):
+            index.setdefault(name, (full_name, tuple(aliases)))
+    return index
+
+
+# Full name or alias → (full name, aliases), so alias checks are one lookup
+_ALIAS_INDEX = _build_alias_index()
+
+# Word tokens used to index team names and probe questions
+_TOKEN_RE = re.compile(r"\w+")
+
+# Question words at least this long that are not team keys may be typos of
+# one ("celtcs", "packrs"). A word is corrected only when it is exactly one
+# edit from a single key, starts with the same letter, and is not itself a
+# known word; shorter words collide with real ones too often ("beats")
+TYPO_MIN_TOKEN_LEN = 6
+
+# Ordinary words one edit from a team key ("layers" → "lakers",
+# "rookies" → "rockies"); never corrected. Words from team names and
+# SPORTS_KEYWORDS are added at runtime, and the singular of a key
+# ("celtic" for "celtics") is always left alone.
+TYPO_KNOWN_WORDS = frozenset({
+    "layers", "lagers", "brains", "dodges", "braver", "marines", "rookies",
+    "winner", "winners", "season", "seasons", "series", "player", "players",
+})
+
+
+@lru_cache(maxsize=4096)
+def _team_keys(team_lower: str) -> frozenset[str]:
+    """
+    Tokens that identify a team in a question: the last token of the name
+    (present whenever the full name or its last word is), plus the last
+    token of each known alias and of the aliased full name. A question
+    mentions the team iff it contains at least one of them as a word.
+    """
+    phrases = [team_lower]
+    entry = _ALIAS_INDEX.get(team_lower)
+    if entry is not None:
+        full_name, aliases = entry
+        phrases += [full_name, *aliases]
+    keys = set()
+    for phrase in phrases:
+        tokens = _TOKEN_RE.findall(phrase)
+        if tokens:
+            keys.add(tokens[-1])
+    return frozenset(keys)
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """True if b is a with exactly one character inserted, deleted or replaced."""
+    if a == b or abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
 
 @dataclass
 class BookmakerOdds:
@@ -54,6 +164,34 @@ class BookmakerOdds:
     implied_probability: float
 
 
+@dataclass(frozen=True, slots=True)
+class OddsEvent:
+    """The parts of an odds-api event the model reads, flattened once per fetch."""
+
+    home_team: str
+    away_team: str
+    # (outcome name, implied probability) for every h2h price above 1.0
+    outcomes: tuple[tuple[str, float], ...]
+
+    @classmethod
+    def from_api(cls, event: dict) -> "OddsEvent":
+        outcomes = []
+        for bookmaker in event.get("bookmakers", []):
+            for market_data in bookmaker.get("markets", []):
+                if market_data.get("key") != "h2h":
+                    continue
+                for outcome in market_data.get("outcomes", []):
+                    decimal_odds = outcome.get("price", 0)
+                    if decimal_odds > 1.0:
+                        # Implied probability is 1 / decimal odds
+                        outcomes.append((outcome.get("name", ""), 1.0 / decimal_odds))
+        return cls(
+            home_team=event.get("home_team", ""),
+            away_team=event.get("away_team", ""),
+            outcomes=tuple(outcomes),
+        )
+
+
 class OddsApiModel(ProbabilityModel):
     """
     Probability model using the-odds-api.com bookmaker consensus.
@@ -64,8 +202,33 @@ class OddsApiModel(ProbabilityModel):
     def __init__(self, api_key: Optional[str] = None):
         self._api_key = api_key or os.getenv("ODDS_API_KEY", "")
         self._base_url = "https://api.the-odds-api.com/v4/sports"
-        self._cache: dict[str, tuple[float, list[dict]]] = {}  # sport_key → (timestamp, data)
-        self._session = requests.Session()
+        self._cache: dict[str, tuple[float, list[OddsEvent]]] = {}  # sport_key → (timestamp, events)
+        self._cache_lock = threading.Lock()
+        # One keep-alive pool with a slot per sport, so the concurrent
+        # prefetch reuses its connections on every refresh. No retries:
+        # each request counts against the monthly quota.
+        self._pool = urllib3.PoolManager(
+            maxsize=len(SPORT_KEYS),
+            retries=False,
+            timeout=15,
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+        # Started by batch_estimate; keeps recently matched sports fresh and
+        # exits after REFRESH_IDLE_SECONDS without a batch_estimate call
+        self._refresher: Optional[threading.Thread] = None
+        self._last_batch = 0.0
+        self._sport_last_matched: dict[str, float] = {}  # sport_key → time of last match
+        # team token → [(sport index, event index)], rebuilt when odds refresh
+        self._team_index: dict[str, list[tuple[int, int]]] = {}
+        self._team_index_source: list[list[OddsEvent]] = []
+        # Words never treated as typos: TYPO_KNOWN_WORDS plus every team
+        # name and sports keyword word, rebuilt with the index
+        self._known_words: frozenset[str] = TYPO_KNOWN_WORDS
+        # question token → team key it is a typo of (or None), reset with the index
+        self._typo_keys: dict[str, Optional[str]] = {}
+        # lowercased question → _find_matching_odds result (None for a miss),
+        # reset with the index
+        self._match_cache: dict[str, Optional[tuple[str, float, int, str]]] = {}
 
     @property
     def name(self) -> str:
@@ -79,12 +242,15 @@ class OddsApiModel(ProbabilityModel):
         if not self.available:
             return None
 
+        # Lowercase once; every matching step below works on q
+        q = market.question.lower()
+
         # Only handle sports
-        if not self._looks_like_sports(market):
+        if not self._looks_like_sports(q):
             return None
 
         # Try to match against bookmaker odds
-        match = self._find_matching_odds(market)
+        match = self._find_matching_odds(q)
         if match is None:
             return None
 
@@ -92,7 +258,9 @@ class OddsApiModel(ProbabilityModel):
 
         # Determine which side this probability applies to
         # If the matched team appears in the YES outcome description, it's YES prob
-        side = self._determine_side(market, team_name)
+        side = self._determine_side(q, team_name)
+        if side is None:
+            return None
         if side == "YES":
             fair_yes = consensus_prob
         else:
@@ -116,9 +284,11 @@ class OddsApiModel(ProbabilityModel):
         if not self.available:
             return {}
 
-        # Pre-warm cache for all sport keys
-        for sport_key in SPORT_KEYS:
-            self._fetch_odds(sport_key)
+        # Pre-warm cache for all sport keys, then keep the ones in use warm
+        # in the background
+        self._last_batch = time.time()
+        self._prefetch_all()
+        self._start_refresher()
 
         # Now estimate each market against the cached data
         results = {}
@@ -130,42 +300,83 @@ class OddsApiModel(ProbabilityModel):
 
     # ── Internal Methods ────────────────────────────────────
 
-    def _looks_like_sports(self, market: Market) -> bool:
-        """Quick check if market looks sports-related."""
-        q = market.question.lower()
-        keywords = [
-            "win", "beat", "defeat", "nba", "nfl", "mlb", "nhl", "mma",
-            "ufc", "fight", "championship", "super bowl", "world series",
-            "playoffs", "finals", "game", "match", "vs", "premier league",
-            "serie a", "la liga", "champions league", "epl",
-        ]
-        return any(kw in q for kw in keywords)
-
-    def _fetch_odds(self, sport_key: str) -> list[dict]:
-        """Fetch odds for a sport, with caching."""
+    def _prefetch_all(self, force: bool = False, sport_keys: list[str] = SPORT_KEYS):
+        """
+        Fill the cache for every sport key (or just sport_keys).
+
+        The requests are independent and network-bound, so run them side by
+        side on the pool's kept-alive connections instead of one RTT after
+        another.
+        """
+        if not sport_keys:
+            return
+        with ThreadPoolExecutor(max_workers=len(sport_keys)) as pool:
+            list(pool.map(lambda k: self._fetch_odds(k, force=force), sport_keys))
+
+    def _start_refresher(self):
+        """
+        Start the refresh-ahead thread if it is not running, so estimates for
+        sports in use never wait on an expired TTL.
+
+        Each round re-fetches only the sports that matched a market within
+        REFRESH_IDLE_SECONDS; the rest expire and are fetched on demand. The
+        thread exits (and the next batch_estimate restarts it) once
+        batch_estimate goes REFRESH_IDLE_SECONDS without a call, or for good
+        if a 401 clears the API key.
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        def _run():
+            while self.available:
+                time.sleep(CACHE_TTL_SECONDS - REFRESH_AHEAD_SECONDS)
+                cutoff = time.time() - REFRESH_IDLE_SECONDS
+                if self._last_batch < cutoff:
+                    break
+                in_use = [k for k, t in self._sport_last_matched.items() if t >= cutoff]
+                self._prefetch_all(force=True, sport_keys=in_use)
+
+        self._refresher = threading.Thread(target=_run, name="odds-api-refresh", daemon=True)
+        self._refresher.start()
+
+    def _looks_like_sports(self, q: str) -> bool:
+        """Quick check if a (lowercased) market question looks sports-related."""
+        return _SPORTS_KEYWORDS_RE.search(q) is not None
+
+    def _fetch_odds(self, sport_key: str, force: bool = False) -> list[OddsEvent]:
+        """
+        Fetch odds for a sport, with caching.
+
+        The response is flattened to OddsEvent on arrival, so the cache
+        holds only team names and implied probabilities, not the raw
+        bookmaker tree.
+
+        Sports the refresher keeps warm are replaced before they expire;
+        only a missing or expired entry, or force=True, hits the API.
+        """
         now = time.time()
 
-        if sport_key in self._cache:
-            cached_time, cached_data = self._cache[sport_key]
-            if now - cached_time < CACHE_TTL_SECONDS:
-                return cached_data
+        cached = self._cache.get(sport_key)
+        if cached and not force and now - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
 
         try:
-            resp = self._session.get(
+            resp = self._pool.request(
+                "GET",
                 f"{self._base_url}/{sport_key}/odds",
-                params={
+                fields={
                     "apiKey": self._api_key,
                     "regions": "us,eu",
                     "markets": "h2h",
                     "oddsFormat": "decimal",
                 },
-                timeout=15,
             )
-            if resp.status_code == 200:
-                data = resp.json()
-                self._cache[sport_key] = (now, data)
+            if resp.status == 200:
+                data = [OddsEvent.from_api(e) for e in orjson.loads(resp.data)]
+                with self._cache_lock:
+                    self._cache[sport_key] = (now, data)
                 return data
-            elif resp.status_code == 401:
+            elif resp.status == 401:
                 # Bad API key — disable future calls
                 self._api_key = ""
                 return []
@@ -175,123 +386,203 @@ class OddsApiModel(ProbabilityModel):
             return self._cache.get(sport_key, (0, []))[1]
 
     def _find_matching_odds(
-        self, market: Market
+        self, q: str
     ) -> Optional[tuple[str, float, int, str]]:
         """
-        Try to match a Polymarket market against bookmaker events.
+        Try to match a Polymarket market (by its lowercased question)
+        against bookmaker events.
 
         Returns (team_name, consensus_probability, n_bookmakers, reasoning)
-        or None if no match found.
+        or None if no match found. The answer, hit or miss, is reused for
+        the same question until the odds data changes.
         """
-        q = market.question.lower()
-
-        for sport_key in SPORT_KEYS:
-            events = self._fetch_odds(sport_key)
-
-            for event in events:
-                home = event.get("home_team", "")
-                away = event.get("away_team", "")
-
-                # Check if either team appears in the market question
-                home_match = self._fuzzy_team_match(home, q)
-                away_match = self._fuzzy_team_match(away, q)
-
-                if not (home_match or away_match):
-                    continue
+        odds_by_sport = [self._fetch_odds(sport_key) for sport_key in SPORT_KEYS]
+        index = self._get_team_index(odds_by_sport)
+
+        if q in self._match_cache:
+            return self._match_cache[q]
+        match = self._search_odds(q, odds_by_sport, index)
+        self._match_cache[q] = match
+        return match
+
+    def _search_odds(
+        self,
+        q: str,
+        odds_by_sport: list[list[OddsEvent]],
+        index: dict[str, list[tuple[int, int]]],
+    ) -> Optional[tuple[str, float, int, str]]:
+        """First event (in sport/event order) whose team appears in q and has prices."""
+
+        # Only events with a team token in the question can match; visit
+        # them in the same sport/event order as a full scan would
+        q_tokens = set(_TOKEN_RE.findall(q))
+        q_tokens |= self._correct_typos(q_tokens)
+        candidates = set()
+        for token in q_tokens:
+            candidates.update(index.get(token, ()))
+
+        for sport_idx, event_idx in sorted(candidates):
+            sport_key = SPORT_KEYS[sport_idx]
+            event = odds_by_sport[sport_idx][event_idx]
+            home = event.home_team
+            away = event.away_team
+
+            # Check if either team appears in the market question
+            home_match = self._fuzzy_team_match(home, q_tokens)
+            away_match = self._fuzzy_team_match(away, q_tokens)
+
+            if not (home_match or away_match):
+                continue
+
+            # Found a match — compute consensus probability
+            target_team = home if home_match else away
+            consensus = self._extract_consensus(event, target_team)
+
+            if consensus:
+                self._sport_last_matched[sport_key] = time.time()
+                avg_prob, n_books = consensus
+                reasoning = (
+                    f"{n_books} bookmakers avg {avg_prob:.1%} for "
+                    f"{target_team} ({sport_key})"
+                )
+                return (target_team, avg_prob, n_books, reasoning)
 
-                # Found a match — compute consensus probability
-                target_team = home if home_match else away
-                probs = self._extract_consensus(event, target_team)
+        return None
 
-                if probs:
-                    avg_prob = sum(probs) / len(probs)
-                    reasoning = (
-                        f"{len(probs)} bookmakers avg {avg_prob:.1%} for "
-                        f"{target_team} ({sport_key})"
-                    )
-                    return (target_team, avg_prob, len(probs), reasoning)
+    def _get_team_index(
+        self, odds_by_sport: list[list[OddsEvent]]
+    ) -> dict[str, list[tuple[int, int]]]:
+        """Inverted index of team tokens → events, rebuilt only when the odds data changes."""
+        source = self._team_index_source
+        # _fetch_odds hands back a fresh [] for sports without data, so
+        # treat any two empty lists as unchanged
+        if len(source) == len(odds_by_sport) and all(
+            a is b or not (a or b) for a, b in zip(source, odds_by_sport)
+        ):
+            return self._team_index
+
+        index: dict[str, list[tuple[int, int]]] = {}
+        known = set(TYPO_KNOWN_WORDS)
+        for sport_idx, events in enumerate(odds_by_sport):
+            for event_idx, event in enumerate(events):
+                keys = set()
+                for team in (event.home_team, event.away_team):
+                    if team:
+                        team_lower = team.lower()
+                        keys |= _team_keys(team_lower)
+                        known.update(_TOKEN_RE.findall(team_lower))
+                for key in keys:
+                    index.setdefault(key, []).append((sport_idx, event_idx))
+        for phrase in (*TEAM_ALIASES, *_ALIAS_INDEX, *SPORTS_KEYWORDS):
+            known.update(_TOKEN_RE.findall(phrase))
+
+        self._team_index = index
+        self._team_index_source = odds_by_sport
+        self._known_words = frozenset(known)
+        self._typo_keys = {}
+        self._match_cache = {}
+        return index
+
+    def _correct_typos(self, tokens: set[str]) -> set[str]:
+        """Team keys that question words are typos of, e.g. "celtcs" → "celtics"."""
+        found = set()
+        for token in tokens:
+            key = self._typo_key(token)
+            if key is not None:
+                found.add(key)
+        return found
+
+    def _typo_key(self, token: str) -> Optional[str]:
+        """
+        The team key a question word is a typo of, or None.
 
-        return None
+        Only a word one edit from exactly one key with the same first
+        letter counts; known words ("texas", team name words) and the
+        singular of a key ("celtic" for "celtics") never do. Each word is
+        decided once per index build.
+        """
+        if token in self._typo_keys:
+            return self._typo_keys[token]
+        key = None
+        if (
+            len(token) >= TYPO_MIN_TOKEN_LEN
+            and token not in self._team_index
+            and token not in self._known_words
+        ):
+            close = [
+                k for k in self._team_index
+                if k[0] == token[0] and k != token + "s" and _one_edit_apart(token, k)
+            ]
+            if len(close) == 1:
+                key = close[0]
+        self._typo_keys[token] = key
+        return key
+
+    def _fuzzy_team_match(self, team_name: str, question_tokens: set[str]) -> bool:
+        """
+        Check if a team name appears in a question, given the question's
+        word tokens (_TOKEN_RE over the lowercased text).
 
-    def _fuzzy_team_match(self, team_name: str, question: str) -> bool:
-        """Check if a team name appears in the market question."""
+        Covers the full name, its last word ("Lakers" from "Los Angeles
+        Lakers") and known aliases ("LA Lakers", "GSW") in one set check.
+        """
         if not team_name:
             return False
-
-        team_lower = team_name.lower()
-
-        # Direct substring match
-        if team_lower in question:
-            return True
-
-        # Try last word (e.g., "Lakers" from "Los Angeles Lakers")
-        parts = team_lower.split()
-        if len(parts) > 1 and parts[-1] in question:
-            return True
-
-        # Try without city (e.g., "Lakers" from "LA Lakers")
-        # Common abbreviations
-        abbrevs = {
-            "los angeles lakers": ["lakers", "la lakers"],
-            "golden state warriors": ["warriors", "gsw"],
-            "new york knicks": ["knicks", "ny knicks"],
-            "boston celtics": ["celtics"],
-            "miami heat": ["heat"],
-            "dallas mavericks": ["mavericks", "mavs"],
-            "denver nuggets": ["nuggets"],
-            "milwaukee bucks": ["bucks"],
-            "phoenix suns": ["suns"],
-            "philadelphia 76ers": ["76ers", "sixers"],
-            "new york yankees": ["yankees"],
-            "los angeles dodgers": ["dodgers"],
-            "kansas city chiefs": ["chiefs"],
-            "san francisco 49ers": ["49ers", "niners"],
-            "new england patriots": ["patriots", "pats"],
-            "green bay packers": ["packers"],
-        }
-
-        for full_name, aliases in abbrevs.items():
-            if team_lower == full_name or team_lower in aliases:
-                return any(a in question for a in aliases) or full_name in question
-
-        return False
+        return not _team_keys(team_name.lower()).isdisjoint(question_tokens)
 
     def _extract_consensus(
-        self, event: dict, target_team: str
-    ) -> list[float]:
+        self, event: OddsEvent, target_team: str
+    ) -> Optional[tuple[float, int]]:
         """
-        Extract implied probabilities for target_team from all bookmakers.
-        Returns list of probabilities (one per bookmaker).
+        Average the implied probability for target_team across all bookmakers.
+        Returns (mean probability, number of prices), or None if no bookmaker
+        prices the team.
         """
         probs = []
         target_lower = target_team.lower()
+        target_tokens = set(_TOKEN_RE.findall(target_lower))
+        # Bookmakers repeat the same outcome names; decide each name once
+        name_matches: dict[str, bool] = {}
+
+        for name, prob in event.outcomes:
+            # Match outcome to our target team
+            matched = name_matches.get(name)
+            if matched is None:
+                outcome_name = name.lower()
+                matched = name_matches[name] = (
+                    target_lower in outcome_name
+                    or outcome_name in target_lower
+                    or self._fuzzy_team_match(name, target_tokens)
+                )
+            if matched:
+                probs.append(prob)
+
+        if not probs:
+            return None
 
-        for bookmaker in event.get("bookmakers", []):
-            for market_data in bookmaker.get("markets", []):
-                if market_data.get("key") != "h2h":
-                    continue
-
-                for outcome in market_data.get("outcomes", []):
-                    outcome_name = outcome.get("name", "").lower()
-                    decimal_odds = outcome.get("price", 0)
-
-                    if decimal_odds <= 1.0:
-                        continue
-
-                    # Match outcome to our target team
-                    if (
-                        target_lower in outcome_name
-                        or outcome_name in target_lower
-                        or self._fuzzy_team_match(outcome.get("name", ""), target_lower)
-                    ):
-                        implied_prob = 1.0 / decimal_odds
-                        probs.append(implied_prob)
-
-        return probs
+        return float(np.mean(probs)), len(probs)
 
-    def _determine_side(self, market: Market, team_name: str) -> str:
-        """Determine if the matched team corresponds to YES or NO."""
-        q = market.question.lower()
+    def _team_position(self, q: str, team_lower: str) -> int:
+        """
+        Index of the team's first mention in q: its full name, one of its
+        key words ("lakers"), or a typo of one; -1 if q never names it.
+        """
+        pos = q.find(team_lower)
+        if pos >= 0:
+            return pos
+        keys = _team_keys(team_lower)
+        for m in _TOKEN_RE.finditer(q):
+            word = m.group()
+            if word in keys or self._typo_key(word) in keys:
+                return m.start()
+        return -1
+
+    def _determine_side(self, q: str, team_name: str) -> Optional[str]:
+        """
+        Determine if the matched team corresponds to YES or NO (q is the
+        lowercased question). None when the question never names the team,
+        so the caller skips the market rather than guessing a side.
+        """
         team_lower = team_name.lower()
 
         # Common patterns:
@@ -300,16 +591,11 @@ class OddsApiModel(ProbabilityModel):
         # "[Team A] vs [Team B]: Who will win?" → depends on phrasing
 
         # If question starts with "Will [team]" → YES
-        if f"will {team_lower}" in q or q.startswith(team_lower):
+        if q.startswith(team_lower) or f"will {team_lower}" in q:
             return "YES"
 
-        # If the question has "win" or "beat" near the team name
-        # Simple heuristic: if team appears before "win"/"beat", it's YES
-        team_pos = q.find(team_lower)
-        win_pos = max(q.find("win"), q.find("beat"), q.find("defeat"))
-
-        if team_pos >= 0 and win_pos >= 0 and team_pos < win_pos:
-            return "YES"
+        if self._team_position(q, team_lower) < 0:
+            return None
 
         # Default: assume team name in question = YES side
         return "YES"
@@ -3,14 +3,20 @@ Odds Tracker - Monitor price changes in real-time.
 Supports alerts and historical tracking.
 """
 
+import math
 import time
-import json
+import queue
+import orjson
+import array
+import bisect
 import asyncio
+import threading
 import websockets
 from datetime import datetime
 from typing import Optional, Callable
 from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from config import config
 from client_manager import clients
@@ -19,6 +25,24 @@ from market_fetcher import Market, MarketFetcher
 import logging
 logger = logging.getLogger(__name__)
 
+# Observations kept per market in PriceHistory (oldest are dropped)
+PRICE_HISTORY_MAXLEN = 1000
+
+# Concurrent fetch_price calls in update_prices (each is two CLOB round trips)
+PRICE_FETCH_WORKERS = 16
+
+# Price snapshots waiting for the writer thread; new rows are dropped when full
+DB_QUEUE_MAXSIZE = 10000
+
+# Rows the writer thread saves per INSERT/commit
+DB_WRITE_BATCH = 256
+
+# WebSocket book frames: midpoint moves smaller than this are ignored, and a
+# token records at most one price per WS_MIN_INTERVAL_SECONDS; the newest
+# frame inside that window is held and recorded once it closes
+WS_PRICE_EPSILON = 1e-6
+WS_MIN_INTERVAL_SECONDS = 0.1
+
 
 @dataclass
 class PricePoint:
@@ -37,57 +61,109 @@ class PricePoint:
         return self.price_yes
 
 
+class PriceSeries:
+    """
+    Price observations stored column-wise: one array of doubles per field
+    (epoch-second timestamps, yes, no, bid, ask) instead of one PricePoint
+    object per tick. A missing bid/ask is stored as NaN.
+    
+    Keeps the newest maxlen points. Indexing and iteration still yield
+    PricePoint, built on demand.
+    """
+    
+    __slots__ = ("maxlen", "ts", "yes", "no", "bid", "ask")
+    
+    def __init__(self, maxlen: int = PRICE_HISTORY_MAXLEN):
+        self.maxlen = maxlen
+        self.ts = array.array("d")
+        self.yes = array.array("d")
+        self.no = array.array("d")
+        self.bid = array.array("d")
+        self.ask = array.array("d")
+    
+    def append(self, point: PricePoint):
+        """Add one observation, dropping the oldest past maxlen."""
+        self.ts.append(point.timestamp.timestamp())
+        self.yes.append(point.price_yes)
+        self.no.append(point.price_no)
+        self.bid.append(math.nan if point.best_bid is None else point.best_bid)
+        self.ask.append(math.nan if point.best_ask is None else point.best_ask)
+        if len(self.ts) > self.maxlen:
+            for col in (self.ts, self.yes, self.no, self.bid, self.ask):
+                del col[:-self.maxlen]
+    
+    def __len__(self) -> int:
+        return len(self.ts)
+    
+    def __getitem__(self, i: int) -> PricePoint:
+        bid, ask = self.bid[i], self.ask[i]
+        return PricePoint(
+            timestamp=datetime.fromtimestamp(self.ts[i]),
+            price_yes=self.yes[i],
+            price_no=self.no[i],
+            best_bid=None if math.isnan(bid) else bid,
+            best_ask=None if math.isnan(ask) else ask,
+        )
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self.ts)))
+
+
 @dataclass
 class PriceHistory:
     """Price history for a market."""
     token_id: str
     market_question: str
-    prices: list[PricePoint] = field(default_factory=list)
+    prices: PriceSeries = field(default_factory=PriceSeries)
     
     def add_price(self, price_point: PricePoint):
         """Add a new price observation."""
         self.prices.append(price_point)
-        # Keep last 1000 observations to manage memory
-        if len(self.prices) > 1000:
-            self.prices = self.prices[-1000:]
     
     @property
     def current_price(self) -> Optional[float]:
         """Get most recent price."""
-        return self.prices[-1].price_yes if self.prices else None
+        return self.prices.yes[-1] if self.prices else None
     
     @property
     def price_change_1h(self) -> Optional[float]:
         """Calculate 1-hour price change."""
-        if len(self.prices) < 2:
-            return None
-        
-        now = datetime.now()
-        hour_ago = None
-        
-        for p in reversed(self.prices):
-            if (now - p.timestamp).total_seconds() >= 3600:
-                hour_ago = p
-                break
-        
-        if hour_ago and self.current_price:
-            return self.current_price - hour_ago.price_yes
-        return None
+        return self.change_1h()[0]
     
     @property
     def price_change_percent_1h(self) -> Optional[float]:
         """Calculate 1-hour price change as percentage."""
-        change = self.price_change_1h
-        if change is None or len(self.prices) < 2:
-            return None
+        return self.change_1h()[1]
+    
+    def change_1h(self, now: Optional[float] = None) -> tuple[Optional[float], Optional[float]]:
+        """
+        (absolute, percent) change against the latest point at least an hour old.
         
-        # Find price from ~1 hour ago
-        for p in reversed(self.prices[:-1]):
-            if (datetime.now() - p.timestamp).total_seconds() >= 3600:
-                if p.price_yes > 0:
-                    return (change / p.price_yes) * 100
-                break
-        return None
+        now: epoch seconds to measure from (default time.time()); pass one
+        value when reporting on many histories at once.
+        
+        Points arrive in time order, so that point is found by bisecting the
+        timestamps instead of walking back from the newest price. The
+        percent base never uses the newest point itself.
+        """
+        yes = self.prices.yes
+        n = len(yes)
+        if n < 2:
+            return None, None
+        
+        # Latest point with timestamp <= now - 1h
+        if now is None:
+            now = time.time()
+        idx = bisect.bisect_right(self.prices.ts, now - 3600) - 1
+        current = yes[-1]
+        if idx < 0 or not current:
+            return None, None
+        
+        change = current - yes[idx]
+        base = yes[min(idx, n - 2)]
+        if base <= 0:
+            return change, None
+        return change, (change / base) * 100
 
 
 @dataclass
@@ -98,6 +174,7 @@ class Alert:
     threshold: float
     triggered: bool = False
     callback: Optional[Callable] = None
+    repeat: bool = False  # keep firing on every matching update instead of once
 
 
 class OddsTracker:
@@ -127,8 +204,23 @@ class OddsTracker:
     
     def __init__(self):
         self.tracked_markets: dict[str, PriceHistory] = {}
-        self.alerts: list[Alert] = []
+        # Alerts bucketed by token so a price update only visits its own
+        self._alerts_by_token: defaultdict[str, list[Alert]] = defaultdict(list)
         self._running = False
+        # Long-lived so each worker keeps its thread-local DB connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=PRICE_FETCH_WORKERS, thread_name_prefix="odds-tracker"
+        )
+        # Snapshot rows are saved by one writer thread, off the polling path
+        self._db_queue: queue.Queue = queue.Queue(maxsize=DB_QUEUE_MAXSIZE)
+        self._db_writer_thread = threading.Thread(
+            target=self._db_writer, name="odds-tracker-db", daemon=True
+        )
+        self._db_writer_thread.start()
+        # token → time.monotonic() of the last price recorded from the stream
+        self._ws_last_recorded: dict[str, float] = {}
+        # token → (best bid, best ask) of the newest frame the throttle held back
+        self._ws_pending: dict[str, tuple[float, float]] = {}
     
     def add_market(self, token_id: str, question: str = ""):
         """Add a market to track."""
@@ -140,9 +232,19 @@ class OddsTracker:
             logger.info(f"📊 Now tracking: {question or token_id[:20]}...")
     
     def add_markets(self, markets: list[Market]):
-        """Add multiple markets to track."""
-        for market in markets:
-            self.add_market(market.token_id_yes, market.question)
+        """
+        Add multiple markets to track in one update.
+        
+        Markets already tracked are left untouched, same as add_market().
+        """
+        new = {
+            m.token_id_yes: PriceHistory(token_id=m.token_id_yes, market_question=m.question)
+            for m in markets
+            if m.token_id_yes not in self.tracked_markets
+        }
+        self.tracked_markets.update(new)
+        if new:
+            logger.info(f"📊 Now tracking {len(new)} markets")
     
     def remove_market(self, token_id: str):
         """Stop tracking a market."""
@@ -154,7 +256,8 @@ class OddsTracker:
         token_id: str,
         condition: str,
         threshold: float,
-        callback: Optional[Callable] = None
+        callback: Optional[Callable] = None,
+        repeat: bool = False
     ):
         """
         Add a price alert.
@@ -164,18 +267,41 @@ class OddsTracker:
             condition: "above", "below", or "change"
             threshold: Price threshold (or change % for "change")
             callback: Function to call when triggered (receives market, price)
+            repeat: Fire on every matching update rather than only the first
         """
-        self.alerts.append(Alert(
+        self._alerts_by_token[token_id].append(Alert(
             market_id=token_id,
             condition=condition,
             threshold=threshold,
-            callback=callback
+            callback=callback,
+            repeat=repeat
         ))
     
+    def add_alerts(
+        self,
+        token_ids: list[str],
+        condition: str,
+        threshold: float,
+        callback: Optional[Callable] = None,
+        repeat: bool = False
+    ):
+        """Add the same price alert (see add_alert) for several markets."""
+        for token_id in token_ids:
+            self._alerts_by_token[token_id].append(
+                Alert(market_id=token_id, condition=condition, threshold=threshold,
+                      callback=callback, repeat=repeat)
+            )
+    
+    @property
+    def alerts(self) -> list[Alert]:
+        """All registered alerts, grouped by market."""
+        return [alert for bucket in self._alerts_by_token.values() for alert in bucket]
+    
     def _check_alerts(self, token_id: str, price: float, old_price: Optional[float]):
         """Check and trigger any alerts for this market."""
-        for alert in self.alerts:
-            if alert.market_id != token_id or alert.triggered:
+        # .get, not [], so ticks for alert-free markets don't add empty buckets
+        for alert in self._alerts_by_token.get(token_id, ()):
+            if alert.triggered:
                 continue
             
             triggered = False
@@ -190,7 +316,7 @@ class OddsTracker:
                     triggered = True
             
             if triggered:
-                alert.triggered = True
+                alert.triggered = not alert.repeat
                 history = self.tracked_markets.get(token_id)
                 market_name = history.market_question if history else token_id
                 
@@ -201,8 +327,50 @@ class OddsTracker:
                 if alert.callback:
                     alert.callback(market_name, price)
     
-    def fetch_price(self, token_id: str) -> Optional[PricePoint]:
-        """Fetch current price for a token."""
+    def _queue_snapshot(self, token_id: str, point: PricePoint):
+        """Hand a snapshot to the writer thread without waiting on SQLite."""
+        try:
+            self._db_queue.put_nowait((
+                token_id, point.timestamp, point.price_yes,
+                point.price_no, point.best_bid, point.best_ask,
+            ))
+        except queue.Full:
+            logger.warning(f"Price snapshot queue full, dropping {token_id[:20]}...")
+    
+    def _db_writer(self):
+        """
+        Writer thread: save queued snapshots in batches of up to DB_WRITE_BATCH.
+        
+        A None on the queue (sent by stop()) ends the thread once the rows
+        ahead of it are saved.
+        """
+        done = False
+        while not done:
+            row = self._db_queue.get()
+            if row is None:
+                return
+            batch = [row]
+            while len(batch) < DB_WRITE_BATCH:
+                try:
+                    row = self._db_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    done = True
+                    break
+                batch.append(row)
+            try:
+                db.save_price_snapshots(batch)
+            except Exception as e:
+                logger.error(f"Error saving price snapshots: {e}")
+    
+    def fetch_price(self, token_id: str, persist: bool = True) -> Optional[PricePoint]:
+        """
+        Fetch current price for a token.
+        
+        With persist=True the snapshot is queued for the writer thread;
+        with persist=False the caller decides what to save.
+        """
         try:
             # Get midpoint
             midpoint = clients.read.get_midpoint(token_id)
@@ -220,31 +388,35 @@ class OddsTracker:
             
             price_yes = float(midpoint) if midpoint else 0.5
             
-            # Persist snapshot to database
-            db.save_price_snapshot(
-                token_id=token_id,
-                price_yes=price_yes,
-                price_no=1.0 - price_yes,
-                best_bid=best_bid,
-                best_ask=best_ask,
-            )
-            
-            return PricePoint(
+            point = PricePoint(
                 timestamp=datetime.now(),
                 price_yes=price_yes,
                 price_no=1.0 - price_yes,
                 best_bid=best_bid,
                 best_ask=best_ask
             )
+            
+            # Persist snapshot to database (asynchronously)
+            if persist:
+                self._queue_snapshot(token_id, point)
+            
+            return point
         except Exception as e:
             logger.error(f"Error fetching price for {token_id[:20]}...: {e}")
             return None
     
     def update_prices(self):
         """Update prices for all tracked markets."""
-        for token_id, history in self.tracked_markets.items():
+        # Fetch concurrently; histories and alerts are still updated from
+        # this thread, in tracking order, as results come back. Snapshots
+        # go to the writer thread, which batches them into few commits.
+        tracked = list(self.tracked_markets.items())
+        price_points = self._executor.map(
+            self.fetch_price, [token_id for token_id, _ in tracked]
+        )
+        
+        for (token_id, history), price_point in zip(tracked, price_points):
             old_price = history.current_price
-            price_point = self.fetch_price(token_id)
             
             if price_point:
                 history.add_price(price_point)
@@ -273,20 +445,28 @@ class OddsTracker:
     
     def _print_status(self):
         """Print current tracking status."""
-        logger.info(f"\n📊 Price Update @ {datetime.now().strftime('%H:%M:%S')}")
+        logger.info(f"\n📊 Price Update @ {time.strftime('%H:%M:%S')}")
         logger.info('============================================================')
         
-        for token_id, history in self.tracked_markets.items():
+        now = time.time()
+        for history in self.tracked_markets.values():
             if history.prices:
-                latest = history.prices[-1]
-                change_1h = history.price_change_percent_1h
-                change_str = f"{change_1h:+.1f}%" if change_1h else "N/A"
-                
-                # Color code based on change
-                emoji = "📈" if change_1h and change_1h > 0 else "📉" if change_1h and change_1h < 0 else "➖"
-                
-                logger.info(f"{emoji} {history.market_question[:40]}...")
-                logger.info(f"   YES: ${latest.price_yes:.4f} | 1h: {change_str}")
+                logger.info(self._format_row(now, history))
+    
+    @staticmethod
+    def _format_row(now: float, history: PriceHistory) -> str:
+        """Two-line status entry for one market, with the 1h change measured from now."""
+        latest_yes = history.prices.yes[-1]
+        change_1h = history.change_1h(now)[1]
+        change_str = f"{change_1h:+.1f}%" if change_1h else "N/A"
+        
+        # Color code based on change
+        emoji = "📈" if change_1h and change_1h > 0 else "📉" if change_1h and change_1h < 0 else "➖"
+        
+        return (
+            f"{emoji} {history.market_question[:40]}...\n"
+            f"   YES: ${latest_yes:.4f} | 1h: {change_str}"
+        )
     
     async def start_websocket(self):
         """
@@ -307,26 +487,56 @@ class OddsTracker:
                 "assets_ids": token_ids
             }
             
-            await ws.send(json.dumps(subscribe_msg))
+            await ws.send(orjson.dumps(subscribe_msg).decode())
             logger.info("✅ Subscribed to market updates")
             
             self._running = True
             
             try:
-                async for message in ws:
-                    if not self._running:
-                        break
+                while self._running:
+                    try:
+                        message = await asyncio.wait_for(ws.recv(), WS_MIN_INTERVAL_SECONDS)
+                    except asyncio.TimeoutError:
+                        # Quiet socket: record books the throttle held back
+                        self._flush_ws_pending()
+                        continue
                     
-                    data = json.loads(message)
-                    await self._handle_ws_message(data)
+                    data = orjson.loads(message)
+                    self._handle_ws_message(data)
                     
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("⚠️ WebSocket connection closed")
             except KeyboardInterrupt:
                 logger.info("\n⏹️ Tracker stopped")
     
-    async def _handle_ws_message(self, data: dict):
-        """Handle incoming WebSocket message."""
+    def start_stream(self) -> threading.Thread:
+        """
+        Run start_websocket() on a background daemon thread.
+        
+        Lets synchronous callers (e.g. the AutoTrader loop) react to alert
+        callbacks without running an event loop themselves. Stop with stop().
+        """
+        def _run():
+            try:
+                asyncio.run(self.start_websocket())
+            except Exception as e:
+                logger.warning(f"⚠️ Price stream stopped: {e}")
+        
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        return thread
+    
+    def _handle_ws_message(self, data: dict):
+        """
+        Handle incoming WebSocket message.
+        
+        Runs inline in the receive loop. Book frames that leave the midpoint
+        unchanged return before any PricePoint or alert work. A frame within
+        WS_MIN_INTERVAL_SECONDS of the token's last recorded price is held
+        as pending (replacing any older one) and recorded by
+        _flush_ws_pending once the window closes, so the last price of a
+        burst is never lost.
+        """
         msg_type = data.get("type", "")
         
         if msg_type == "book":
@@ -335,6 +545,8 @@ class OddsTracker:
             if token_id in self.tracked_markets:
                 history = self.tracked_markets[token_id]
                 old_price = history.current_price
+                # This frame supersedes any book held back for the token
+                self._ws_pending.pop(token_id, None)
                 
                 # Parse book data
                 bids = data.get("bids", [])
@@ -346,20 +558,55 @@ class OddsTracker:
                 if best_bid and best_ask:
                     midpoint = (best_bid + best_ask) / 2
                     
-                    price_point = PricePoint(
-                        timestamp=datetime.now(),
-                        price_yes=midpoint,
-                        price_no=1.0 - midpoint,
-                        best_bid=best_bid,
-                        best_ask=best_ask
-                    )
-                    
-                    history.add_price(price_point)
-                    self._check_alerts(token_id, midpoint, old_price)
+                    changed = old_price is None or abs(midpoint - old_price) >= WS_PRICE_EPSILON
+                    last = self._ws_last_recorded.get(token_id, -math.inf)
+                    if changed and time.monotonic() - last < WS_MIN_INTERVAL_SECONDS:
+                        self._ws_pending[token_id] = (best_bid, best_ask)
+                    elif changed:
+                        self._record_ws_price(token_id, best_bid, best_ask)
+        
+        self._flush_ws_pending()
+    
+    def _flush_ws_pending(self):
+        """Record held-back books whose token is past its WS_MIN_INTERVAL_SECONDS window."""
+        if not self._ws_pending:
+            return
+        now = time.monotonic()
+        for token_id, (best_bid, best_ask) in list(self._ws_pending.items()):
+            if now - self._ws_last_recorded.get(token_id, -math.inf) < WS_MIN_INTERVAL_SECONDS:
+                continue
+            del self._ws_pending[token_id]
+            if token_id in self.tracked_markets:
+                self._record_ws_price(token_id, best_bid, best_ask)
+    
+    def _record_ws_price(self, token_id: str, best_bid: float, best_ask: float):
+        """Add a stream book's midpoint to the token's history and check its alerts."""
+        history = self.tracked_markets[token_id]
+        old_price = history.current_price
+        midpoint = (best_bid + best_ask) / 2
+        self._ws_last_recorded[token_id] = time.monotonic()
+        
+        price_point = PricePoint(
+            timestamp=datetime.now(),
+            price_yes=midpoint,
+            price_no=1.0 - midpoint,
+            best_bid=best_bid,
+            best_ask=best_ask
+        )
+        
+        history.add_price(price_point)
+        self._check_alerts(token_id, midpoint, old_price)
     
     def stop(self):
-        """Stop the tracker."""
+        """
+        Stop the tracker for good: end polling/streaming, shut down the
+        fetch pool, and let the writer thread save queued snapshots and exit.
+        """
         self._running = False
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._db_writer_thread.is_alive():
+            self._db_queue.put(None)
+            self._db_writer_thread.join(timeout=5)
     
     def get_history(self, token_id: str) -> Optional[PriceHistory]:
         """Get price history for a market."""
@@ -370,22 +617,23 @@ class OddsTracker:
         export_data = {}
         
         for token_id, history in self.tracked_markets.items():
+            s = history.prices
             export_data[token_id] = {
                 "question": history.market_question,
                 "prices": [
                     {
-                        "timestamp": p.timestamp.isoformat(),
-                        "price_yes": p.price_yes,
-                        "price_no": p.price_no,
-                        "best_bid": p.best_bid,
-                        "best_ask": p.best_ask
+                        "timestamp": datetime.fromtimestamp(ts).isoformat(),
+                        "price_yes": yes,
+                        "price_no": no,
+                        "best_bid": None if math.isnan(bid) else bid,
+                        "best_ask": None if math.isnan(ask) else ask
                     }
-                    for p in history.prices
+                    for ts, yes, no, bid, ask in zip(s.ts, s.yes, s.no, s.bid, s.ask)
                 ]
             }
         
-        with open(filepath, "w") as f:
-            json.dump(export_data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"📁 Exported history to {filepath}")
 
@@ -407,16 +655,15 @@ if __name__ == "__main__":
         tracker = OddsTracker()
         
         # Add first 3 markets
-        for m in markets[:3]:
-            tracker.add_market(m.token_id_yes, m.question)
-            
-            # Add alert for 10% price change
-            tracker.add_alert(
-                m.token_id_yes,
-                condition="change",
-                threshold=0.10,
-                callback=default_alert_callback
-            )
+        tracker.add_markets(markets[:3])
+        
+        # Add alert for 10% price change
+        tracker.add_alerts(
+            [m.token_id_yes for m in markets[:3]],
+            condition="change",
+            threshold=0.10,
+            callback=default_alert_callback
+        )
         
         # Start polling
         logger.info("\nStarting tracker (Ctrl+C to stop)...\n")
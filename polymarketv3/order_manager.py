@@ -9,13 +9,24 @@ Handles:
 - Order monitoring and execution
 """
 
+import math
 import time
+import struct
+import asyncio
+import hashlib
 import threading
+import numpy as np
+import orjson
+import websockets
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Callable, List
 from dataclasses import dataclass, field
 from enum import Enum
 
+from py_clob_client.clob_types import BookParams
+
 from config import config
 from client_manager import clients
 from persistence import db
@@ -25,12 +36,33 @@ from order_tracker import OrderTracker
 import logging
 logger = logging.getLogger(__name__)
 
+# Market-channel price stream: wait this long before reconnecting after a
+# drop (REST polling covers the gap), and check this often for newly
+# added tokens that need a resubscribe
+STREAM_RECONNECT_SECONDS = 5
+STREAM_RECV_TIMEOUT_SECONDS = 1.0
+
+# A stream with no frames for this long counts as down (REST polling resumes
+# at full cadence until the next frame); while it is up, REST still polls
+# this often as a heartbeat for moves the stream did not report
+STREAM_QUIET_SECONDS = 30
+STREAM_HEARTBEAT_SECONDS = 30
+
+# A token's last seen price (polled or pushed) is reused for this long
+# instead of asking the CLOB again; half the default monitor interval
+PRICE_CACHE_TTL_SECONDS = 5
+
+# Concurrent per-token midpoint lookups when the batched call fails; each
+# is one CLOB round trip, so overlap enough of them to cover a full basket
+PRICE_FETCH_WORKERS = 16
+
 
 class OrderType(Enum):
     """Types of automated orders."""
     TAKE_PROFIT = "take_profit"
     STOP_LOSS = "stop_loss"
     TRAILING_STOP = "trailing_stop"
+    BRACKET = "bracket"  # take profit + stop loss in one order (OCO)
     LIMIT_BUY = "limit_buy"
     LIMIT_SELL = "limit_sell"
 
@@ -45,7 +77,7 @@ class OrderState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoOrder:
     """Automated order with trigger conditions."""
     id: str
@@ -58,6 +90,7 @@ class AutoOrder:
     limit_price: Optional[float] = None  # For limit orders
     trailing_percent: Optional[float] = None  # For trailing stops
     highest_price: float = 0.0  # Track for trailing stop
+    take_profit_price: Optional[float] = None  # Bracket upper exit; trigger_price is its stop
     state: OrderState = OrderState.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     triggered_at: Optional[datetime] = None
@@ -67,7 +100,7 @@ class AutoOrder:
     callback: Optional[Callable] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position with associated orders."""
     token_id: str
@@ -80,6 +113,107 @@ class Position:
     trailing_stop_percent: Optional[float] = None
 
 
+# TriggerTable.kind codes; 0 marks a free row (or an order type that never triggers)
+_KIND_CODES = {
+    OrderType.TAKE_PROFIT: 1,
+    OrderType.STOP_LOSS: 2,
+    OrderType.TRAILING_STOP: 3,
+    OrderType.BRACKET: 4,
+}
+
+
+class TriggerTable:
+    """
+    Trigger fields of the active orders as parallel NumPy columns, one row
+    per order, so a price update checks every order in a few array ops.
+    
+    Rows are reused after removal; the columns double when full. Trailing
+    stop moves are written back to the AutoOrder by OrderManager.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.trig = np.zeros(capacity)
+        self.trail = np.zeros(capacity)
+        self.high = np.zeros(capacity)
+        self.tp = np.zeros(capacity)  # bracket take-profit level
+        self.tok = np.zeros(capacity, dtype=np.int32)
+        self.order_ids: list[Optional[str]] = [None] * capacity
+        self._rows: dict[str, int] = {}
+        self._free = list(range(capacity - 1, -1, -1))
+        # token_id → column index into the per-update price vector
+        self._token_idx: dict[str, int] = {}
+    
+    def add(self, order: AutoOrder):
+        if order.id in self._rows:
+            return
+        if not self._free:
+            self._grow()
+        row = self._free.pop()
+        self._rows[order.id] = row
+        self.order_ids[row] = order.id
+        self.kind[row] = _KIND_CODES.get(order.order_type, 0)
+        self.trig[row] = order.trigger_price
+        self.trail[row] = order.trailing_percent or 0.0
+        self.high[row] = order.highest_price
+        self.tp[row] = order.take_profit_price or 0.0
+        self.tok[row] = self._token_idx.setdefault(order.token_id, len(self._token_idx))
+    
+    def remove(self, order_id: str):
+        row = self._rows.pop(order_id, None)
+        if row is None:
+            return
+        self.kind[row] = 0
+        self.order_ids[row] = None
+        self._free.append(row)
+    
+    def _grow(self):
+        n = len(self.kind)
+        for name in ("kind", "trig", "trail", "high", "tp", "tok"):
+            col = getattr(self, name)
+            setattr(self, name, np.concatenate([col, np.zeros_like(col)]))
+        self.order_ids.extend([None] * n)
+        self._free.extend(range(2 * n - 1, n - 1, -1))
+    
+    def evaluate(self, prices: dict[str, float]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Apply prices (token_id → price) to every row.
+        
+        Raises trailing stops whose price made a new high, then returns
+        (per-row prices, rows whose trailing stop moved, rows that fired).
+        Rows without a price compare as NaN and never move or fire.
+        """
+        price_vec = np.full(len(self._token_idx) + 1, np.nan)
+        for token_id, price in prices.items():
+            idx = self._token_idx.get(token_id)
+            if idx is not None:
+                price_vec[idx] = price
+        p = price_vec[self.tok]
+        
+        kind = self.kind
+        trailing = kind == 3
+        moved = trailing & (p > self.high)
+        if moved.any():
+            self.high[moved] = p[moved]
+            self.trig[moved] = np.maximum(self.trig[moved], p[moved] * (1 - self.trail[moved]))
+        
+        bracket = kind == 4
+        fired = (
+            ((kind == 1) & (p >= self.trig))
+            | (((kind == 2) | trailing | bracket) & (p <= self.trig))
+            | (bracket & (p >= self.tp))
+        )
+        return p, np.flatnonzero(moved), np.flatnonzero(fired)
+
+
+# Log line per order type when a trigger fires
+_TRIGGER_LOGS = {
+    OrderType.TAKE_PROFIT: "🎯 Take Profit TRIGGERED @ $%.4f",
+    OrderType.STOP_LOSS: "🛑 Stop Loss TRIGGERED @ $%.4f",
+    OrderType.TRAILING_STOP: "📉 Trailing Stop TRIGGERED @ $%.4f",
+}
+
+
 class OrderManager:
     """
     Manages automated orders including Take Profit and Stop Loss.
@@ -113,16 +247,41 @@ class OrderManager:
         self.order_tracker = OrderTracker(
             on_fill=self._on_order_fill,
             on_cancel=self._on_order_cancel,
-            poll_interval=5,
-            stale_timeout_minutes=30,
+            poll_interval=None,  # adaptive: sub-second while fresh orders are live
+            stale_timeout_seconds=30 * 60,
         )
         
         self.orders: dict[str, AutoOrder] = {}
         self.positions: dict[str, Position] = {}
+        # positions is written from the tracker thread (_on_order_fill) too
+        self._positions_lock = threading.Lock()
+        # ACTIVE orders only, in creation order (orders keeps the full history)
+        self._active: dict[str, AutoOrder] = {}
+        # token_id → IDs of its ACTIVE orders; tokens drop out when they have none
+        self._orders_by_token: defaultdict[str, set[str]] = defaultdict(set)
+        # Trigger fields of the ACTIVE orders, checked in bulk per price update
+        self._triggers = TriggerTable()
+        self._index_lock = threading.Lock()
         
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
+        # WebSocket push; while connected the REST monitor loop only heartbeats
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_connected = False
+        # Serializes trigger checks between the stream and the REST loop
+        self._dispatch_lock = threading.Lock()
+        # token_id → (time.monotonic(), price) of the last price seen
+        self._price_cache: dict[str, tuple[float, float]] = {}
         self._order_counter = 0
+        # Process-start stamp shared by every generated ID; per-order time
+        # lives in AutoOrder.created_at
+        self._id_prefix = f"AUTO_{datetime.now().strftime('%Y%m%d%H%M%S')}_"
+        
+        # Reused across monitor ticks for per-token price lookups when the
+        # batched midpoints call fails
+        self._executor = ThreadPoolExecutor(
+            max_workers=PRICE_FETCH_WORKERS, thread_name_prefix="order-manager"
+        )
         
         # Callbacks
         self.on_order_triggered: Optional[Callable] = None
@@ -140,8 +299,8 @@ class OrderManager:
                 exit_price=fill_price,
             )
             logger.info(
-                f"✅ Sell fill confirmed: -{new_fill_size:.2f} {tracked_order.side} "
-                f"@ {fill_price:.4f} | Realized: ${realized:.2f}"
+                "✅ Sell fill confirmed: -%.2f %s @ %.4f | Realized: $%.2f",
+                new_fill_size, tracked_order.side, fill_price, realized,
             )
             return
 
@@ -153,32 +312,82 @@ class OrderManager:
             entry_price=fill_price,
         )
         # Record position for TP/SL logic (only after fill confirmed)
-        self.positions[tracked_order.token_id] = Position(
-            token_id=tracked_order.token_id,
-            market_question=tracked_order.market_question,
-            side=tracked_order.side,
-            size=new_fill_size,
-            entry_price=fill_price,
-        )
+        with self._positions_lock:
+            self.positions[tracked_order.token_id] = Position(
+                token_id=tracked_order.token_id,
+                market_question=tracked_order.market_question,
+                side=tracked_order.side,
+                size=new_fill_size,
+                entry_price=fill_price,
+            )
         logger.info(
-            f"💼 Position updated: +{new_fill_size:.2f} {tracked_order.side} "
-            f"@ {fill_price:.4f} ({tracked_order.market_question[:35]}...)"
+            "💼 Position updated: +%.2f %s @ %.4f (%s...)",
+            new_fill_size, tracked_order.side, fill_price, tracked_order.market_question[:35],
         )
 
     def _on_order_cancel(self, tracked_order):
         """Called by OrderTracker when an order is cancelled/expired unfilled."""
         if tracked_order.filled_size > 0:
             logger.info(
-                f"⚠️ Order {tracked_order.order_id} cancelled with partial fill "
-                f"({tracked_order.filled_size:.2f}/{tracked_order.size:.2f})"
+                "⚠️ Order %s cancelled with partial fill (%.2f/%.2f)",
+                tracked_order.order_id, tracked_order.filled_size, tracked_order.size,
             )
         else:
-            logger.info(f"📭 Order {tracked_order.order_id} cancelled/expired — no position created")
+            logger.info("📭 Order %s cancelled/expired — no position created", tracked_order.order_id)
+    
+    def _activate(self, order: AutoOrder):
+        """Register an ACTIVE order and index it under its token."""
+        self.orders[order.id] = order
+        with self._index_lock:
+            self._active[order.id] = order
+            self._orders_by_token[order.token_id].add(order.id)
+            self._triggers.add(order)
+    
+    def _set_state(self, order: AutoOrder, state: OrderState):
+        """Move an order out of (or back into) ACTIVE, keeping the token index in step."""
+        order.state = state
+        with self._index_lock:
+            if state == OrderState.ACTIVE:
+                self._active[order.id] = order
+                self._orders_by_token[order.token_id].add(order.id)
+                self._triggers.add(order)
+                return
+            self._active.pop(order.id, None)
+            self._triggers.remove(order.id)
+            ids = self._orders_by_token.get(order.token_id)
+            if ids is not None:
+                ids.discard(order.id)
+                if not ids:
+                    del self._orders_by_token[order.token_id]
     
     def _generate_order_id(self) -> str:
         """Generate unique order ID."""
         self._order_counter += 1
-        return f"AUTO_{datetime.now().strftime('%Y%m%d%H%M%S')}_{self._order_counter}"
+        return self._id_prefix + str(self._order_counter)
+    
+    @staticmethod
+    def _make_intent_id(
+        token_id: str,
+        side: str,
+        order_side: str,
+        size: float,
+        price: float,
+        strategy: Optional[str] = None,
+    ) -> str:
+        """
+        Idempotency key for an order: the same order within one
+        intent_ttl_seconds window maps to the same ID.
+        
+        Numbers are packed as raw doubles and everything goes through a
+        single 128-bit BLAKE2b, so no string formatting is involved.
+        """
+        window = int(time.time() // max(config.safety.intent_ttl_seconds, 1))
+        h = hashlib.blake2b(digest_size=16, person=b"order-intent")
+        h.update(struct.pack("<ddq", size, price, window))
+        h.update(b"\0".join((
+            token_id.encode(), side.encode(), order_side.encode(), (strategy or "").encode(),
+        )))
+        return h.hexdigest()
     
     # ==================== BUY METHODS ====================
     
@@ -228,7 +437,7 @@ class OrderManager:
                 limit_price=price,
                 strategy=strategy,
             )
-            logger.info(f"📋 Order {result.order_id} placed — awaiting fill confirmation")
+            logger.info("📋 Order %s placed — awaiting fill confirmation", result.order_id)
         
         return result
     
@@ -272,13 +481,26 @@ class OrderManager:
         result["buy_result"] = buy_result
         
         if not buy_result.success:
-            logger.error(f"❌ Buy failed: {buy_result.error}")
+            logger.error("❌ Buy failed: %s", buy_result.error)
             return result
         
         result["success"] = True
         
+        # Both exits → one bracket order, so only one of them can ever sell
+        if take_profit and stop_loss:
+            bracket_id = self.set_bracket(
+                token_id=token_id,
+                size=size,
+                take_profit_price=take_profit,
+                stop_loss_price=stop_loss,
+                market_question=market_question,
+                side=side
+            )
+            result["take_profit_id"] = bracket_id
+            result["stop_loss_id"] = bracket_id
+        
         # Set Take Profit
-        if take_profit:
+        elif take_profit:
             tp_id = self.set_take_profit(
                 token_id=token_id,
                 price=take_profit,
@@ -289,7 +511,7 @@ class OrderManager:
             result["take_profit_id"] = tp_id
         
         # Set Stop Loss
-        if stop_loss:
+        elif stop_loss:
             sl_id = self.set_stop_loss(
                 token_id=token_id,
                 price=stop_loss,
@@ -312,11 +534,11 @@ class OrderManager:
             result["trailing_stop_id"] = ts_id
         
         # Update position
-        if token_id in self.positions:
-            pos = self.positions[token_id]
-            pos.take_profit_price = take_profit
-            pos.stop_loss_price = stop_loss
-            pos.trailing_stop_percent = trailing_stop_percent
+        with self._positions_lock:
+            if (pos := self.positions.get(token_id)) is not None:
+                pos.take_profit_price = take_profit
+                pos.stop_loss_price = stop_loss
+                pos.trailing_stop_percent = trailing_stop_percent
         
         return result
     
@@ -391,7 +613,7 @@ class OrderManager:
                 limit_price=price,
                 strategy=strategy,
             )
-            logger.info(f"📋 Sell order {result.order_id} placed — awaiting fill confirmation")
+            logger.info("📋 Sell order %s placed — awaiting fill confirmation", result.order_id)
         return result
     
     def market_sell(
@@ -454,10 +676,10 @@ class OrderManager:
             state=OrderState.ACTIVE
         )
         
-        self.orders[order_id] = order
+        self._activate(order)
         
-        logger.info(f"📈 Take Profit set: Sell {size} {side} @ ${price:.4f}")
-        logger.info(f"   Order ID: {order_id}")
+        logger.info("📈 Take Profit set: Sell %s %s @ $%.4f", size, side, price)
+        logger.info("   Order ID: %s", order_id)
         
         return order_id
     
@@ -498,10 +720,10 @@ class OrderManager:
             state=OrderState.ACTIVE
         )
         
-        self.orders[order_id] = order
+        self._activate(order)
         
-        logger.info(f"🛑 Stop Loss set: Sell {size} {side} if price <= ${price:.4f}")
-        logger.info(f"   Order ID: {order_id}")
+        logger.info("🛑 Stop Loss set: Sell %s %s if price <= $%.4f", size, side, price)
+        logger.info("   Order ID: %s", order_id)
         
         return order_id
     
@@ -549,16 +771,53 @@ class OrderManager:
             state=OrderState.ACTIVE
         )
         
-        self.orders[order_id] = order
+        self._activate(order)
         
-        logger.info(f"📉 Trailing Stop set: {trail_percent*100:.1f}% trail")
-        logger.info(f"   Current: ${current_price:.4f} → Stop: ${stop_price:.4f}")
-        logger.info(f"   Order ID: {order_id}")
+        logger.info("📉 Trailing Stop set: %.1f%% trail", trail_percent*100)
+        logger.info("   Current: $%.4f → Stop: $%.4f", current_price, stop_price)
+        logger.info("   Order ID: %s", order_id)
         
         return order_id
     
     # ==================== OCO (ONE-CANCELS-OTHER) ====================
     
+    def set_bracket(
+        self,
+        token_id: str,
+        size: float,
+        take_profit_price: float,
+        stop_loss_price: float,
+        market_question: str = "",
+        side: str = "YES"
+    ) -> str:
+        """
+        Set a bracket: one order that sells when price rises to
+        take_profit_price or falls to stop_loss_price, whichever comes first.
+        
+        Returns:
+            Order ID
+        """
+        order_id = self._generate_order_id()
+        
+        order = AutoOrder(
+            id=order_id,
+            token_id=token_id,
+            market_question=market_question,
+            order_type=OrderType.BRACKET,
+            side=side,
+            size=size,
+            trigger_price=stop_loss_price,
+            take_profit_price=take_profit_price,
+            state=OrderState.ACTIVE
+        )
+        
+        self._activate(order)
+        
+        logger.info("🔗 Bracket set: Sell %s %s @ $%.4f or <= $%.4f", size, side, take_profit_price, stop_loss_price)
+        logger.info("   Order ID: %s", order_id)
+        
+        return order_id
+    
     def set_oco(
         self,
         token_id: str,
@@ -572,65 +831,64 @@ class OrderManager:
         Set OCO (One-Cancels-Other) order pair.
         When one triggers, the other is cancelled.
         
+        Implemented as a single bracket order, so both returned IDs are
+        the same and cancelling either cancels the pair.
+        
         Returns:
             Tuple of (take_profit_id, stop_loss_id)
         """
-        tp_id = self.set_take_profit(token_id, take_profit_price, size, market_question, side)
-        sl_id = self.set_stop_loss(token_id, stop_loss_price, size, market_question, side)
-        
-        # Link orders
-        self.orders[tp_id].linked_order_id = sl_id
-        self.orders[sl_id].linked_order_id = tp_id
-        
-        logger.info(f"🔗 OCO pair created: TP {tp_id} <-> SL {sl_id}")
-        
-        return tp_id, sl_id
+        bracket_id = self.set_bracket(
+            token_id, size, take_profit_price, stop_loss_price, market_question, side
+        )
+        return bracket_id, bracket_id
     
     # ==================== ORDER MANAGEMENT ====================
     
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an automated order."""
         if order_id not in self.orders:
-            logger.warning(f"⚠️ Order {order_id} not found")
+            logger.warning("⚠️ Order %s not found", order_id)
             return False
         
         order = self.orders[order_id]
         
         if order.state in [OrderState.EXECUTED, OrderState.CANCELLED]:
-            logger.warning(f"⚠️ Order {order_id} already {order.state.value}")
+            logger.warning("⚠️ Order %s already %s", order_id, order.state.value)
             return False
         
-        order.state = OrderState.CANCELLED
-        logger.error(f"❌ Cancelled order {order_id}")
+        self._set_state(order, OrderState.CANCELLED)
+        logger.error("❌ Cancelled order %s", order_id)
         
         return True
     
     def cancel_all_orders(self, token_id: Optional[str] = None) -> int:
         """Cancel all orders, optionally for specific token."""
-        cancelled = 0
+        # Take the orders out of every index in one pass, then flip states
+        with self._index_lock:
+            if token_id is None:
+                victims = list(self._active.values())
+                self._active.clear()
+                self._orders_by_token.clear()
+                self._triggers = TriggerTable()
+            else:
+                victims = [self._active.pop(oid) for oid in self._orders_by_token.pop(token_id, ())]
+                for order in victims:
+                    self._triggers.remove(order.id)
         
-        for order_id, order in self.orders.items():
-            if token_id and order.token_id != token_id:
-                continue
-            
-            if order.state == OrderState.ACTIVE:
-                order.state = OrderState.CANCELLED
-                cancelled += 1
+        for order in victims:
+            order.state = OrderState.CANCELLED
+        cancelled = len(victims)
         
-        logger.error(f"❌ Cancelled {cancelled} orders")
+        logger.error("❌ Cancelled %s orders", cancelled)
         return cancelled
     
     def get_active_orders(self, token_id: Optional[str] = None) -> list[AutoOrder]:
-        """Get all active orders."""
-        orders = [
-            o for o in self.orders.values()
-            if o.state == OrderState.ACTIVE
-        ]
-        
-        if token_id:
-            orders = [o for o in orders if o.token_id == token_id]
-        
-        return orders
+        """Get all active orders (in creation order)."""
+        with self._index_lock:
+            if token_id:
+                ids = self._orders_by_token.get(token_id, ())
+                return [o for o in self._active.values() if o.id in ids]
+            return list(self._active.values())
     
     # ==================== MONITORING ====================
     
@@ -642,55 +900,48 @@ class OrderManager:
         except Exception:
             return None
     
-    def _check_order(self, order: AutoOrder, current_price: float) -> bool:
+    def _get_current_prices(self, token_ids: list[str]) -> dict[str, float]:
         """
-        Check if order should trigger.
-        Returns True if triggered.
+        Current midpoints for many tokens in one POST /midpoints.
+        
+        Prices seen within PRICE_CACHE_TTL_SECONDS are reused; only the
+        rest are requested. Falls back to concurrent per-token lookups if
+        the batched call fails. Tokens without a price are left out.
         """
-        if order.state != OrderState.ACTIVE:
-            return False
+        now = time.monotonic()
+        prices = {}
+        missing = []
+        for t in token_ids:
+            cached = self._price_cache.get(t)
+            if cached and now - cached[0] < PRICE_CACHE_TTL_SECONDS:
+                prices[t] = cached[1]
+            else:
+                missing.append(t)
+        if not missing:
+            return prices
         
-        triggered = False
-        
-        if order.order_type == OrderType.TAKE_PROFIT:
-            # Trigger when price >= target
-            if current_price >= order.trigger_price:
-                triggered = True
-                logger.info(f"🎯 Take Profit TRIGGERED @ ${current_price:.4f}")
-        
-        elif order.order_type == OrderType.STOP_LOSS:
-            # Trigger when price <= stop
-            if current_price <= order.trigger_price:
-                triggered = True
-                logger.info(f"🛑 Stop Loss TRIGGERED @ ${current_price:.4f}")
-        
-        elif order.order_type == OrderType.TRAILING_STOP:
-            # Update highest price
-            if current_price > order.highest_price:
-                order.highest_price = current_price
-                # Update stop price
-                new_stop = current_price * (1 - order.trailing_percent)
-                if new_stop > order.trigger_price:
-                    order.trigger_price = new_stop
-                    logger.info(f"📈 Trailing stop moved: ${order.trigger_price:.4f}")
-            
-            # Check if triggered
-            if current_price <= order.trigger_price:
-                triggered = True
-                logger.info(f"📉 Trailing Stop TRIGGERED @ ${current_price:.4f}")
+        try:
+            mids = clients.read.get_midpoints([BookParams(token_id=t) for t in missing])
+            fetched = {t: float(mids[t]) for t in missing if mids.get(t)}
+        except Exception:
+            results = self._executor.map(self._get_current_price, missing)
+            fetched = {t: p for t, p in zip(missing, results) if p is not None}
         
-        return triggered
+        for t, p in fetched.items():
+            self._price_cache[t] = (now, p)
+        prices.update(fetched)
+        return prices
     
     def _execute_order(self, order: AutoOrder, current_price: float):
         """Execute a triggered order."""
-        order.state = OrderState.TRIGGERED
+        self._set_state(order, OrderState.TRIGGERED)
         order.triggered_at = datetime.now()
         
         # Callback
         if self.on_order_triggered:
             self.on_order_triggered(order)
         
-        logger.info(f"⚡ Executing {order.order_type.value} order {order.id}...")
+        logger.info("⚡ Executing %s order %s...", order.order_type.value, order.id)
         
         # Place sell order
         result = self.trader.market_sell(order.token_id, order.size)
@@ -700,62 +951,181 @@ class OrderManager:
             order.executed_at = datetime.now()
             order.execution_price = current_price
             
-            logger.info(f"✅ Order executed: Sold {order.size} @ ~${current_price:.4f}")
+            logger.info("✅ Order executed: Sold %s @ ~$%.4f", order.size, current_price)
             
             # Cancel linked OCO order
             if order.linked_order_id and order.linked_order_id in self.orders:
                 linked = self.orders[order.linked_order_id]
-                linked.state = OrderState.CANCELLED
-                logger.info(f"🔗 Cancelled linked order {order.linked_order_id}")
+                self._set_state(linked, OrderState.CANCELLED)
+                logger.info("🔗 Cancelled linked order %s", order.linked_order_id)
             
             if self.on_order_executed:
                 self.on_order_executed(order)
         else:
             order.state = OrderState.FAILED
-            logger.error(f"❌ Order failed: {result.error}")
+            logger.error("❌ Order failed: %s", result.error)
             
             if self.on_order_failed:
                 self.on_order_failed(order, result.error)
     
+    def _dispatch_prices(self, prices: dict[str, float]):
+        """
+        Check every active order against new prices (token_id → price) and
+        execute the ones that trigger.
+        
+        Take profits fire at price >= trigger; stop losses and trailing
+        stops at price <= trigger, after a trailing stop has followed any
+        new high up by its trail percent.
+        """
+        if not prices:
+            return
+        
+        with self._dispatch_lock:
+            with self._index_lock:
+                t = self._triggers
+                p, moved, fired = t.evaluate(prices)
+                fired_orders = [(self.orders[t.order_ids[r]], float(p[r])) for r in fired]
+                for r in moved:
+                    order = self.orders[t.order_ids[r]]
+                    order.highest_price = float(t.high[r])
+                    if t.trig[r] > order.trigger_price:
+                        order.trigger_price = float(t.trig[r])
+                        logger.info("📈 Trailing stop moved: $%.4f", order.trigger_price)
+            
+            for order, current_price in fired_orders:
+                # An earlier execution this round may have cancelled its OCO partner
+                if order.state != OrderState.ACTIVE:
+                    continue
+                if order.order_type == OrderType.BRACKET:
+                    hit_tp = current_price >= order.take_profit_price
+                    logger.info(_TRIGGER_LOGS[OrderType.TAKE_PROFIT if hit_tp else OrderType.STOP_LOSS], current_price)
+                else:
+                    logger.info(_TRIGGER_LOGS[order.order_type], current_price)
+                self._execute_order(order, current_price)
+    
     def _monitor_loop(self, interval: int = 10):
-        """Main monitoring loop."""
-        logger.info(f"🔄 Order monitor started (checking every {interval}s)")
+        """
+        Main monitoring loop: REST polling every interval, slowed to every
+        STREAM_HEARTBEAT_SECONDS while the price stream is up.
+        """
+        logger.info("🔄 Order monitor started (checking every %ss)", interval)
+        last_poll = -math.inf
         
         while self._monitoring:
-            active_orders = self.get_active_orders()
-            
-            if not active_orders:
+            # Nothing to allocate or fetch while idle; just a heartbeat while the stream is up
+            heartbeat_due = time.monotonic() - last_poll >= STREAM_HEARTBEAT_SECONDS
+            if not self._orders_by_token or (self._stream_connected and not heartbeat_due):
                 time.sleep(interval)
                 continue
+            last_poll = time.monotonic()
             
-            # Group by token
-            tokens = set(o.token_id for o in active_orders)
+            # The token list is the one per-tick snapshot (the stream thread
+            # and callers mutate the index)
+            with self._index_lock:
+                tokens = list(self._orders_by_token)
             
-            for token_id in tokens:
-                current_price = self._get_current_price(token_id)
-                
-                if current_price is None:
-                    continue
-                
-                # Check orders for this token
-                for order in active_orders:
-                    if order.token_id != token_id:
-                        continue
-                    
-                    if self._check_order(order, current_price):
-                        self._execute_order(order, current_price)
+            # One batched price lookup for every token with active orders
+            prices = self._get_current_prices(tokens)
+            
+            self._dispatch_prices(prices)
             
             time.sleep(interval)
         
         logger.info("⏹️ Order monitor stopped")
     
-    def start_monitoring(self, interval: int = 10):
+    def _stream_loop(self):
+        """
+        Stream thread: keep a market-channel WebSocket subscribed to every
+        token with active orders, reconnecting after drops and whenever a
+        new token is added.
+        """
+        while self._monitoring:
+            with self._index_lock:
+                tokens = set(self._orders_by_token)
+            
+            if not tokens:
+                time.sleep(STREAM_RECV_TIMEOUT_SECONDS)
+                continue
+            
+            try:
+                asyncio.run(self._stream_prices(tokens))
+            except Exception as e:
+                logger.warning("⚠️ Price stream dropped (%s) — polling until it reconnects", e)
+                time.sleep(STREAM_RECONNECT_SECONDS)
+            finally:
+                self._stream_connected = False
+    
+    async def _stream_prices(self, tokens: set[str]):
+        """Receive pushed prices for tokens until monitoring stops or a new token needs subscribing."""
+        async with websockets.connect(f"{config.WS_HOST}/ws/market") as ws:
+            await ws.send(orjson.dumps({"type": "market", "assets_ids": sorted(tokens)}).decode())
+            self._stream_connected = True
+            last_frame = time.monotonic()
+            logger.info("📡 Streaming prices for %s token(s)", len(tokens))
+            
+            while self._monitoring:
+                with self._index_lock:
+                    if not tokens.issuperset(self._orders_by_token):
+                        return  # reconnect with the new token included
+                try:
+                    message = await asyncio.wait_for(ws.recv(), STREAM_RECV_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    # An open but silent socket must not keep REST polling slowed
+                    if self._stream_connected and time.monotonic() - last_frame > STREAM_QUIET_SECONDS:
+                        self._stream_connected = False
+                        logger.warning("⚠️ Price stream quiet for %ss — polling until it speaks", STREAM_QUIET_SECONDS)
+                    continue
+                last_frame = time.monotonic()
+                self._stream_connected = True
+                self._handle_stream_message(message)
+    
+    def _handle_stream_message(self, message):
+        """
+        Dispatch midpoints from one stream frame: full book snapshots, and
+        price_change events (sent when orders are placed or cancelled)
+        through their best bid/ask. Trade prints are ignored, so orders
+        trigger on midpoints only, as with REST polling.
+        """
+        data = orjson.loads(message)
+        events = data if isinstance(data, list) else [data]
+        prices = {}
+        
+        for event in events:
+            kind = event.get("event_type") or event.get("type")
+            
+            if kind == "book":
+                bids = event.get("bids") or []
+                asks = event.get("asks") or []
+                if bids and asks:
+                    best_bid = max(float(b["price"]) for b in bids)
+                    best_ask = min(float(a["price"]) for a in asks)
+                    prices[event.get("asset_id")] = (best_bid + best_ask) / 2
+            elif kind == "price_change":
+                # One entry per changed asset; older frames carry the fields inline
+                for change in event.get("price_changes") or [event]:
+                    best_bid, best_ask = change.get("best_bid"), change.get("best_ask")
+                    if best_bid and best_ask:
+                        token_id = change.get("asset_id") or event.get("asset_id")
+                        prices[token_id] = (float(best_bid) + float(best_ask)) / 2
+        
+        if not prices:
+            return
+        now = time.monotonic()
+        for token_id, price in prices.items():
+            self._price_cache[token_id] = (now, price)
+        self._dispatch_prices(prices)
+    
+    def start_monitoring(self, interval: int = 10, stream: bool = True):
         """
         Start monitoring orders in background thread.
         Also starts the OrderTracker for fill polling.
         
         Args:
             interval: Seconds between price checks
+            stream: Trigger from WebSocket book/price_change pushes; REST
+                    polling drops to a STREAM_HEARTBEAT_SECONDS heartbeat
+                    while the stream is up and resumes every interval when
+                    it is down or quiet
         """
         if self._monitoring:
             logger.warning("⚠️ Already monitoring")
@@ -771,6 +1141,10 @@ class OrderManager:
             daemon=True
         )
         self._monitor_thread.start()
+        
+        if stream:
+            self._stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
+            self._stream_thread.start()
     
     def stop_monitoring(self):
         """Stop monitoring."""
@@ -778,11 +1152,17 @@ class OrderManager:
         self.order_tracker.stop()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
+        if self._stream_thread:
+            self._stream_thread.join(timeout=5)
     
     # ==================== STATUS ====================
     
     def print_status(self):
         """Print current orders and positions."""
+        # The report is all INFO lines; skip building it when they'd be dropped
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         logger.info('============================================================')
         logger.info("📋 ORDER MANAGER STATUS")
         logger.info('============================================================')
@@ -790,7 +1170,7 @@ class OrderManager:
         active = self.get_active_orders()
         
         if active:
-            logger.info(f"\n🔔 Active Orders ({len(active)}):")
+            logger.info("\n🔔 Active Orders (%s):", len(active))
             logger.info('============================================================')
             
             for order in active:
@@ -798,43 +1178,49 @@ class OrderManager:
                     OrderType.TAKE_PROFIT: "📈",
                     OrderType.STOP_LOSS: "🛑", 
                     OrderType.TRAILING_STOP: "📉",
+                    OrderType.BRACKET: "🔗",
                 }.get(order.order_type, "📌")
                 
-                logger.info(f"\n{type_emoji} {order.order_type.value.upper()}")
-                logger.info(f"   Market: {order.market_question[:40]}...")
-                logger.info(f"   Size: {order.size} {order.side}")
-                logger.info(f"   Trigger: ${order.trigger_price:.4f}")
+                logger.info("\n%s %s", type_emoji, order.order_type.value.upper())
+                logger.info("   Market: %s...", order.market_question[:40])
+                logger.info("   Size: %s %s", order.size, order.side)
+                logger.info("   Trigger: $%.4f", order.trigger_price)
+                if order.order_type == OrderType.BRACKET:
+                    logger.info("   Take Profit: $%.4f", order.take_profit_price)
                 
                 if order.order_type == OrderType.TRAILING_STOP:
-                    logger.info(f"   Highest: ${order.highest_price:.4f}")
-                    logger.info(f"   Trail: {order.trailing_percent*100:.1f}%")
+                    logger.info("   Highest: $%.4f", order.highest_price)
+                    logger.info("   Trail: %.1f%%", order.trailing_percent*100)
                 
-                logger.info(f"   ID: {order.id}")
+                logger.info("   ID: %s", order.id)
         else:
             logger.info("\n📭 No active orders")
         
         # Pending fills
         pending = self.order_tracker.pending_count
         if pending:
-            logger.info(f"\n⏳ Pending fills: {pending} order(s) awaiting confirmation")
+            logger.info("\n⏳ Pending fills: %s order(s) awaiting confirmation", pending)
             for tracked in self.order_tracker.get_tracked_orders():
                 if not tracked.is_terminal:
                     fill_pct = (tracked.filled_size / tracked.size * 100) if tracked.size > 0 else 0
-                    logger.info(f"   • {tracked.order_id}: {tracked.order_side} {tracked.size:.1f} {tracked.side} "
-                          f"@ {tracked.limit_price:.4f} [{tracked.status}] ({fill_pct:.0f}% filled)")
+                    logger.info(
+                        "   • %s: %s %.1f %s @ %.4f [%s] (%.0f%% filled)",
+                        tracked.order_id, tracked.order_side, tracked.size, tracked.side,
+                        tracked.limit_price, tracked.status, fill_pct,
+                    )
         
         # Positions
         if self.positions:
-            logger.info(f"\n💼 Tracked Positions ({len(self.positions)}):")
+            logger.info("\n💼 Tracked Positions (%s):", len(self.positions))
             logger.info('============================================================')
             
             for token_id, pos in self.positions.items():
-                logger.info(f"\n• {pos.market_question[:40]}...")
-                logger.info(f"  {pos.size} {pos.side} @ ${pos.entry_price:.4f}")
+                logger.info("\n• %s...", pos.market_question[:40])
+                logger.info("  %s %s @ $%.4f", pos.size, pos.side, pos.entry_price)
                 if pos.take_profit_price:
-                    logger.info(f"  TP: ${pos.take_profit_price:.4f}")
+                    logger.info("  TP: $%.4f", pos.take_profit_price)
                 if pos.stop_loss_price:
-                    logger.info(f"  SL: ${pos.stop_loss_price:.4f}")
+                    logger.info("  SL: $%.4f", pos.stop_loss_price)
         
         logger.info('============================================================')
 
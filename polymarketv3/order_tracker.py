@@ -30,7 +30,7 @@ Usage:
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 from dataclasses import dataclass, field
 
 from client_manager import clients
@@ -38,6 +38,17 @@ from persistence import db
 import logging
 logger = logging.getLogger(__name__)
 
+# Adaptive polling (poll_interval=None): poll every HOT_POLL_INTERVAL_SECONDS
+# while a LIVE order is younger than HOT_ORDER_AGE_SECONDS, otherwise back
+# off by POLL_BACKOFF_FACTOR per cycle up to MAX_POLL_INTERVAL_SECONDS
+HOT_POLL_INTERVAL_SECONDS = 0.25
+HOT_ORDER_AGE_SECONDS = 30
+POLL_BACKOFF_FACTOR = 1.5
+MAX_POLL_INTERVAL_SECONDS = 10.0
+
+# Fixed poll_interval: stretch the wait by this factor while nothing is pending
+IDLE_POLL_MULTIPLIER = 6
+
 
 @dataclass
 class TrackedOrder:
@@ -78,7 +89,11 @@ class TrackedOrder:
     @property
     def is_stale(self) -> bool:
         """Order has been live too long without filling."""
-        return datetime.now() - self.created_at > self.stale_after
+        return self.is_stale_at(datetime.now())
+
+    def is_stale_at(self, now: datetime) -> bool:
+        """is_stale against a caller-supplied clock (one datetime.now() per poll cycle)."""
+        return now - self.created_at > self.stale_after
 
 
 class OrderTracker:
@@ -98,8 +113,9 @@ class OrderTracker:
         self,
         on_fill: Optional[Callable] = None,
         on_cancel: Optional[Callable] = None,
-        poll_interval: int = 5,
+        poll_interval: Union[float, Callable[[], float], None] = 5,
         stale_timeout_seconds: int = 1800,
+        retention_seconds: int = 3600,
     ):
         """
         Args:
@@ -107,15 +123,32 @@ class OrderTracker:
                      Signature: on_fill(order: TrackedOrder, new_fill_size: float, fill_price: float)
             on_cancel: Called when an order is cancelled/expired.
                        Signature: on_cancel(order: TrackedOrder)
-            poll_interval: Seconds between API polls
+            poll_interval: Seconds between API polls, a callable returning the
+                           next interval, or None for adaptive polling (fast
+                           while fresh orders are live, backing off when idle)
             stale_timeout_seconds: Cancel (and attempt to cancel on-exchange) for orders older than this
+            retention_seconds: Keep finished orders in memory (get_order) this long before evicting them
         """
         self.on_fill = on_fill
         self.on_cancel = on_cancel
         self.poll_interval = poll_interval
+        if poll_interval is None:
+            self._next_interval = self._adaptive_interval
+        elif callable(poll_interval):
+            self._next_interval = poll_interval
+        else:
+            self._next_interval = self._fixed_interval
+        self._interval = MAX_POLL_INTERVAL_SECONDS  # adaptive state
+        # Set by track_order/stop to cut the current sleep short
+        self._wake = threading.Event()
         self.stale_timeout = timedelta(seconds=stale_timeout_seconds)
+        self.retention_seconds = retention_seconds
 
         self._orders: dict[str, TrackedOrder] = {}
+        # Non-terminal order IDs, so a poll cycle walks only live orders
+        self._active_ids: set[str] = set()
+        # Terminal order ID -> monotonic time it finished, oldest first
+        self._finished: dict[str, float] = {}
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
@@ -155,6 +188,7 @@ class OrderTracker:
 
         with self._lock:
             self._orders[order_id] = order
+            self._active_ids.add(order_id)
 
         # Persist to database
         db.save_pending_order(
@@ -169,6 +203,9 @@ class OrderTracker:
         )
 
         logger.info(f"📋 Tracking order {order_id}: {order_side} {size:.1f} {side} @ {limit_price:.4f}")
+        
+        # Poll for the new order now rather than after the current sleep
+        self._wake.set()
 
     def get_tracked_orders(self) -> list[TrackedOrder]:
         """Get all currently tracked orders."""
@@ -184,13 +221,14 @@ class OrderTracker:
     def pending_count(self) -> int:
         """Number of orders still being tracked."""
         with self._lock:
-            return sum(1 for o in self._orders.values() if not o.is_terminal)
+            return len(self._active_ids)
 
     def cancel_tracking(self, order_id: str):
         """Stop tracking an order (does NOT cancel the order on the exchange)."""
-        with self._lock:
-            if order_id in self._orders:
-                self._orders[order_id].status = "CANCELLED"
+        order = self.get_order(order_id)
+        if order:
+            order.status = "CANCELLED"
+            self._retire(order)
         db.update_pending_order(order_id, "CANCELLED")
 
     # ── Lifecycle ─────────────────────────────────────────────
@@ -202,11 +240,15 @@ class OrderTracker:
         self._running = True
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
-        logger.info(f"🔄 Order tracker started (polling every {self.poll_interval}s)")
+        if isinstance(self.poll_interval, (int, float)):
+            logger.info(f"🔄 Order tracker started (polling every {self.poll_interval}s)")
+        else:
+            logger.info("🔄 Order tracker started (adaptive polling)")
 
     def stop(self):
         """Stop background polling."""
         self._running = False
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=10)
         logger.info("⏹️ Order tracker stopped")
@@ -237,6 +279,8 @@ class OrderTracker:
                 stale_after=self.stale_timeout,
             )
             self._orders[order.order_id] = order
+            if not order.is_terminal:
+                self._active_ids.add(order.order_id)
 
         if rows:
             logger.info(f"📋 Recovered {len(rows)} pending orders from database")
@@ -248,60 +292,141 @@ class OrderTracker:
                 self._check_all_orders()
             except Exception as e:
                 logger.warning(f"⚠️ Order tracker error: {e}")
-            time.sleep(self.poll_interval)
+            self._wake.wait(self._next_interval())
+            self._wake.clear()
+    
+    def _fixed_interval(self) -> float:
+        """Next sleep for a numeric poll_interval: as given, or stretched when idle."""
+        if self.pending_count:
+            return self.poll_interval
+        return self.poll_interval * IDLE_POLL_MULTIPLIER
+
+    def _adaptive_interval(self) -> float:
+        """
+        Next sleep for poll_interval=None: HOT_POLL_INTERVAL_SECONDS while
+        any LIVE order is under HOT_ORDER_AGE_SECONDS old, otherwise the
+        previous interval grown by POLL_BACKOFF_FACTOR (capped).
+        """
+        hot_after = datetime.now() - timedelta(seconds=HOT_ORDER_AGE_SECONDS)
+        with self._lock:
+            hot = any(
+                self._orders[oid].status == "LIVE" and self._orders[oid].created_at > hot_after
+                for oid in self._active_ids
+            )
+        if hot:
+            self._interval = HOT_POLL_INTERVAL_SECONDS
+        else:
+            self._interval = min(self._interval * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL_SECONDS)
+        return self._interval
 
     def _check_all_orders(self):
         """Check status of all non-terminal orders."""
+        self._evict_finished()
         with self._lock:
-            active = [
-                o for o in self._orders.values()
-                if not o.is_terminal
-            ]
+            active = [self._orders[oid] for oid in self._active_ids]
 
         if not active or not clients.has_auth:
             return
 
-        for order in active:
+        now = datetime.now()
+        stale = [o for o in active if o.is_stale_at(now)]
+        if stale:
             try:
-                self._check_order(order)
+                self._cancel_stale(stale)
             except Exception as e:
-                logger.warning(f"⚠️ Failed to check order {order.order_id}: {e}")
-
-    def _check_order(self, order: TrackedOrder):
-        """Poll the CLOB API for a single order's fill status."""
-        # Check for stale orders
-        if order.is_stale:
-            # Stale LIVE order: attempt to cancel on-exchange, then stop tracking
-            logger.info(f"⏰ Order {order.order_id} stale after {self.stale_timeout} — attempting cancel")
-            cancelled = False
-            try:
-                if clients.has_auth:
-                    # ClobClient uses cancel(order_id)
-                    resp = clients.auth.cancel(order.order_id)
-                    # Best-effort: some versions return {"success": True}
-                    if isinstance(resp, dict):
-                        cancelled = bool(resp.get("success", True))
-                    else:
-                        cancelled = True
-            except Exception:
-                cancelled = False
-
-            order.status = "CANCELLED" if cancelled else "EXPIRED"
-            db.update_pending_order(order.order_id, order.status, order.filled_size, order.avg_fill_price)
-            if self.on_cancel:
-                self.on_cancel(order)
-            return
+                logger.warning(f"⚠️ Failed to cancel stale orders: {e}")
+
+        # One request for every open order; orders missing from it (filled,
+        # cancelled, or the request failed) are fetched one by one
+        open_orders = self._fetch_open_orders()
+        
+        fetched = []
+        for order in active:
+            if order.status in ("CANCELLED", "EXPIRED"):
+                continue  # just handled by _cancel_stale
+            api_order = open_orders.get(order.order_id) or self._fetch_order(order.order_id)
+            if api_order:
+                fetched.append((order, api_order))
+        
+        # All network calls are done; commit the cycle's updates (and any
+        # fill callbacks' writes) together
+        with db.transaction():
+            for order, api_order in fetched:
+                try:
+                    self._apply_api_order(order, api_order, now)
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to check order {order.order_id}: {e}")
+                if order.is_terminal:
+                    self._retire(order)
+
+    def _retire(self, order: TrackedOrder):
+        """Drop a terminal order from the active index and start its retention clock."""
+        with self._lock:
+            if order.order_id in self._active_ids:
+                self._active_ids.discard(order.order_id)
+                self._finished[order.order_id] = time.monotonic()
 
+    def _evict_finished(self):
+        """Forget terminal orders finished more than retention_seconds ago."""
+        cutoff = time.monotonic() - self.retention_seconds
+        with self._lock:
+            # _finished is in retirement order, so stop at the first young one
+            while self._finished:
+                oid = next(iter(self._finished))
+                if self._finished[oid] > cutoff:
+                    break
+                del self._finished[oid]
+                self._orders.pop(oid, None)
+    
+    def _fetch_open_orders(self) -> dict[str, dict]:
+        """All of this account's open orders keyed by order ID ({} on failure)."""
         try:
-            api_order = clients.auth.get_order(order.order_id)
-        except Exception as e:
-            # API error — skip this cycle, don't change state
-            return
+            resp = clients.auth.get_orders()
+        except Exception:
+            return {}
+        if isinstance(resp, dict):
+            resp = resp.get("data") or []
+        return {o["id"]: o for o in resp or [] if isinstance(o, dict) and o.get("id")}
+
+    def _cancel_stale(self, orders: list[TrackedOrder]):
+        """
+        Cancel stale LIVE orders on-exchange in one request, then stop tracking them.
 
-        if not api_order:
-            return
+        Orders the exchange confirms as cancelled become CANCELLED; the rest
+        (including every order if the request fails) become EXPIRED.
+        """
+        ids = [o.order_id for o in orders]
+        logger.info(f"⏰ {len(ids)} order(s) stale after {self.stale_timeout} — attempting cancel")
 
-        order.last_checked = datetime.now()
+        try:
+            # ClobClient.cancel_orders posts all IDs in one DELETE /orders
+            resp = clients.auth.cancel_orders(ids)
+            # Best-effort: expect {"canceled": [...], "not_canceled": {...}}
+            if isinstance(resp, dict) and "canceled" in resp:
+                cancelled = set(resp.get("canceled") or [])
+            else:
+                cancelled = set(ids)
+        except Exception:
+            cancelled = set()
+
+        with db.transaction():
+            for order in orders:
+                order.status = "CANCELLED" if order.order_id in cancelled else "EXPIRED"
+                db.update_pending_order(order.order_id, order.status, order.filled_size, order.avg_fill_price)
+                if self.on_cancel:
+                    self.on_cancel(order)
+                self._retire(order)
+
+    def _fetch_order(self, order_id: str) -> Optional[dict]:
+        """One order's CLOB state, or None on an API error (skip this cycle, don't change state)."""
+        try:
+            return clients.auth.get_order(order_id)
+        except Exception:
+            return None
+
+    def _apply_api_order(self, order: TrackedOrder, api_order: dict, now: Optional[datetime] = None):
+        """Apply an order's CLOB state to the tracked order: record new fills and status."""
+        order.last_checked = now or datetime.now()
 
         # Extract fill info from API response
         # The CLOB API returns different fields depending on version.
@@ -313,11 +438,13 @@ class OrderTracker:
 
         # Compute average fill price from trades if available
         if trades:
-            total_value = sum(
-                float(t.get("size", 0)) * float(t.get("price", 0))
-                for t in trades
-            )
-            total_size = sum(float(t.get("size", 0)) for t in trades)
+            # One pass: each trade's size is read and converted once
+            total_value = 0.0
+            total_size = 0.0
+            for t in trades:
+                size = float(t.get("size", 0))
+                total_size += size
+                total_value += size * float(t.get("price", 0))
             fill_price = total_value / total_size if total_size > 0 else order.limit_price
             size_matched = max(size_matched, total_size)
         else:
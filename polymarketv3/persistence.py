@@ -24,6 +24,7 @@ Usage:
 
     # Price snapshots
     db.save_price_snapshot(token_id, price_yes, price_no, best_bid, best_ask)
+    db.save_price_snapshots([(token_id, ts, price_yes, price_no, best_bid, best_ask), ...])
     history = db.get_price_history(token_id, hours=24)
 
     # Key-value store for bot state
@@ -36,8 +37,12 @@ import json
 import sqlite3
 import threading
 from datetime import datetime, timedelta
+from itertools import groupby, islice
+from operator import itemgetter
 from typing import Optional
 from contextlib import contextmanager
+
+import numpy as np
 import logging
 logger = logging.getLogger(__name__)
 
@@ -46,6 +51,23 @@ logger = logging.getLogger(__name__)
 DB_PATH = os.getenv("BOT_DB_PATH", os.path.join(os.path.dirname(__file__), "bot_data.db"))
 
 
+def _snapshot_arrays(rows) -> dict[str, np.ndarray]:
+    """
+    Transpose (timestamp, price_yes, price_no) rows into column arrays.
+
+    NULL prices become NaN. Prices are float32, which is plenty for 0-1 values.
+    """
+    if not rows:
+        empty = np.empty(0, dtype=np.float32)
+        return {"timestamp": np.empty(0, dtype=str), "price_yes": empty, "price_no": empty}
+    timestamps, prices_yes, prices_no = zip(*rows)
+    return {
+        "timestamp": np.array(timestamps, dtype=str),
+        "price_yes": np.array(prices_yes, dtype=np.float32),
+        "price_no": np.array(prices_no, dtype=np.float32),
+    }
+
+
 class Database:
     """
     SQLite persistence layer for the Polymarket bot.
@@ -67,23 +89,67 @@ class Database:
             self._local.conn = sqlite3.connect(self.db_path)
             self._local.conn.row_factory = sqlite3.Row
             self._local.conn.execute("PRAGMA journal_mode=WAL")
+            # With WAL, NORMAL syncs at checkpoints rather than on every commit
+            # (still crash-safe); checkpoint every 1000 pages; temp b-trees
+            # for sorts/groupings stay in memory
+            self._local.conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn.execute("PRAGMA wal_autocheckpoint=1000")
+            self._local.conn.execute("PRAGMA temp_store=MEMORY")
             self._local.conn.execute("PRAGMA foreign_keys=ON")
         return self._local.conn
 
     @contextmanager
     def _cursor(self):
-        """Context manager that provides a cursor and auto-commits."""
+        """
+        Context manager that provides a cursor and auto-commits.
+
+        Inside transaction() the commit (or rollback) is left to the
+        outermost transaction block.
+        """
         conn = self._get_conn()
         cursor = conn.cursor()
+        in_transaction = getattr(self._local, "tx_depth", 0) > 0
         try:
             yield cursor
-            conn.commit()
+            if not in_transaction:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if not in_transaction:
+                conn.rollback()
             raise
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group this thread's writes into one commit.
+
+        Every write method called inside the block joins the same SQLite
+        transaction, committed when the outermost block exits and rolled
+        back if it raises. Keep network calls out of the block: the write
+        lock is held from the first write until the commit.
+        """
+        local = self._local
+        depth = getattr(local, "tx_depth", 0)
+        conn = self._get_conn()
+        local.tx_depth = depth + 1
+        try:
+            yield
+            if depth == 0:
+                conn.commit()
+        except Exception:
+            if depth == 0:
+                conn.rollback()
+            raise
+        finally:
+            local.tx_depth = depth
+
     def _init_schema(self):
         """Create tables if they don't exist."""
+        # Crash recovery (pending_orders) counts on WAL; say so if it didn't stick
+        mode = self._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+        if str(mode).lower() != "wal":
+            logger.warning(f"⚠️ SQLite journal_mode is {mode!r}, not 'wal', for {self.db_path}")
+
         with self._cursor() as cur:
             cur.executescript("""
                 CREATE TABLE IF NOT EXISTS positions (
@@ -356,6 +422,23 @@ class Database:
                 VALUES (?, ?, ?, ?, ?, ?)
             """, (token_id, now, price_yes, price_no, best_bid, best_ask))
 
+    def save_price_snapshots(self, snapshots: list[tuple]):
+        """
+        Save many price observations in one statement and one commit.
+
+        Each row is (token_id, timestamp, price_yes, price_no, best_bid, best_ask)
+        with timestamp a datetime.
+        """
+        if not snapshots:
+            return
+        rows = [(token_id, ts.isoformat(), *prices) for token_id, ts, *prices in snapshots]
+        with self._cursor() as cur:
+            cur.executemany("""
+                INSERT INTO price_snapshots (token_id, timestamp, price_yes,
+                                             price_no, best_bid, best_ask)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+
     def get_price_history(
         self,
         token_id: str,
@@ -373,6 +456,49 @@ class Database:
             """, (token_id, since, limit))
             return [dict(row) for row in cur.fetchall()]
 
+    def get_price_histories_bulk(
+        self,
+        token_ids: list[str],
+        hours: int = 24,
+        limit: int = 1000,
+        as_arrays: bool = False,
+        since: Optional[datetime] = None,
+    ) -> dict:
+        """
+        Get price history for many tokens within the last N hours.
+
+        Same rows as get_price_history() per token (oldest first, at most
+        `limit` each), but fetched with one query per chunk of IDs instead
+        of one query per token. Tokens with no history are omitted.
+        Values are lists of row dicts, or column arrays with as_arrays=True.
+        Pass `since` to use a cutoff the caller already computed instead of hours.
+        """
+        if since is None:
+            since = datetime.now() - timedelta(hours=hours)
+        since = since.isoformat()
+        ids = list(dict.fromkeys(token_ids))
+        histories: dict[str, list[dict]] = {}
+
+        with self._cursor() as cur:
+            # SQLite caps bound parameters at 999 on older builds
+            for start in range(0, len(ids), 900):
+                chunk = ids[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                cur.execute(f"""
+                    SELECT token_id, timestamp, price_yes, price_no
+                    FROM price_snapshots
+                    WHERE token_id IN ({placeholders}) AND timestamp >= ?
+                    ORDER BY token_id, timestamp ASC
+                """, (*chunk, since))
+                for token_id, rows in groupby(cur.fetchall(), key=itemgetter(0)):
+                    rows = list(islice(rows, limit))
+                    if as_arrays:
+                        histories[token_id] = _snapshot_arrays([row[1:] for row in rows])
+                    else:
+                        histories[token_id] = [dict(row) for row in rows]
+
+        return histories
+
     def cleanup_old_snapshots(self, days: int = 7):
         """Delete price snapshots older than N days to manage DB size."""
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
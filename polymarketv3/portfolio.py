@@ -377,16 +377,21 @@ class PortfolioManager:
         logger.info("💼 PORTFOLIO SUMMARY")
         logger.info("=" * 60)
         
-        logger.info(f"\n📊 Overview:")
-        logger.info(f"   Positions: {stats.total_positions}")
-        logger.info(f"   Total Value: ${stats.total_value:,.2f}")
-        logger.info(f"   Cost Basis: ${stats.total_cost_basis:,.2f}")
-        
-        pnl_emoji = "📈" if stats.total_unrealized_pnl >= 0 else "📉"
-        logger.info(f"\n{pnl_emoji} P&L:")
-        logger.info(f"   Unrealized: ${stats.total_unrealized_pnl:,.2f}")
-        logger.info(f"   Realized: ${stats.total_realized_pnl:,.2f}")
-        logger.info(f"   Win Rate: {stats.win_rate:.1f}%")
+        unrealized = stats.total_unrealized_pnl
+        logger.info(
+            f"\n📊 Overview:\n"
+            f"   Positions: {stats.total_positions}\n"
+            f"   Total Value: ${stats.total_value:,.2f}\n"
+            f"   Cost Basis: ${stats.total_cost_basis:,.2f}"
+        )
+        
+        pnl_emoji = "📈" if unrealized >= 0 else "📉"
+        logger.info(
+            f"\n{pnl_emoji} P&L:\n"
+            f"   Unrealized: ${unrealized:,.2f}\n"
+            f"   Realized: ${stats.total_realized_pnl:,.2f}\n"
+            f"   Win Rate: {stats.win_rate:.1f}%"
+        )
         
         if stats.exposure_by_category:
             logger.info(f"\n📁 Exposure by Category:")
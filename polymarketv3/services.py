@@ -0,0 +1,43 @@
+"""
+Service Registry - Shared helper objects for the whole process.
+
+PROBLEM THIS SOLVES:
+Each CLI mode and the EasyTrader REPL built its own MarketFetcher,
+PortfolioManager, OrderManager, ... on every entry. That threw away the
+fetcher's HTTP session (TCP/TLS handshakes) and its market cache each time.
+
+NOW: Callers ask the registry by name and pass a factory. The first call
+builds the object; later calls get the same instance.
+
+Usage:
+    from services import get_service
+
+    fetcher = get_service("fetcher", MarketFetcher)
+"""
+
+import threading
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_services: dict[str, object] = {}
+_lock = threading.RLock()  # factories may themselves look up services
+
+
+def get_service(name: str, factory: Callable[[], T]) -> T:
+    """
+    Return the shared instance registered under name, building it on first use.
+
+    Args:
+        name: Registry key, e.g. "fetcher"
+        factory: Zero-argument callable that builds the instance
+    """
+    with _lock:
+        if name not in _services:
+            _services[name] = factory()
+        return _services[name]
+
+
+def peek_service(name: str) -> Optional[object]:
+    """Return the instance registered under name, or None if never built."""
+    return _services.get(name)
@@ -21,6 +21,7 @@ USAGE:
 """
 
 import time
+import orjson
 import requests
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -361,7 +362,7 @@ def _fetch_external_sports_odds(api_key: str) -> list[dict]:
             if resp.status_code != 200:
                 continue
 
-            for event in resp.json():
+            for event in orjson.loads(resp.content):
                 teams = [
                     event.get("home_team", ""),
                     event.get("away_team", ""),
@@ -62,6 +62,7 @@ def mock_external_modules(monkeypatch):
     mock_clob.client = mock_client
     mock_types.OrderArgs = MagicMock
     mock_types.OrderType = MagicMock
+    mock_types.BookParams = MagicMock
     mock_clob.clob_types = mock_types
 
     monkeypatch.setitem(sys.modules, "py_clob_client", mock_clob)
@@ -366,3 +367,397 @@ def test_autotrader_strategy_mapping(strategy_modules):
     for member in auto_trader_mod.AutoStrategy:
         if member != auto_trader_mod.AutoStrategy.MIXED:
             assert member.value in strategy_modules.strategy.STRATEGY_REGISTRY or member.value == "value_sports"
+
+
+# ── OddsApiModel matching ─────────────────────────────────────
+
+
+@pytest.fixture
+def odds_mod(strategy_modules):
+    import models.odds_api as odds_mod
+    importlib.reload(odds_mod)
+    return odds_mod
+
+
+def _odds_model_with_events(odds_mod, sport_key, events):
+    """OddsApiModel whose cache holds fresh odds for one sport and none for the rest."""
+    import time
+
+    model = odds_mod.OddsApiModel(api_key="test")
+    now = time.time()
+    for key in odds_mod.SPORT_KEYS:
+        model._cache[key] = (now, [])
+    model._cache[sport_key] = (now, [
+        odds_mod.OddsEvent.from_api({
+            "home_team": home,
+            "away_team": away,
+            "bookmakers": [{"markets": [{"key": "h2h", "outcomes": [
+                {"name": home, "price": 1.6},
+                {"name": away, "price": 2.5},
+            ]}]}],
+        })
+        for home, away in events
+    ])
+    return model
+
+
+def test_odds_typo_corrected_to_team(odds_mod, strategy_modules):
+    model = _odds_model_with_events(odds_mod, "basketball_nba", [("Boston Celtics", "Miami Heat")])
+    m = make_market(strategy_modules.market_fetcher, question="Will the Celtcs win the NBA finals?")
+    est = model.estimate(m)
+    assert est is not None
+    assert "Boston Celtics" in est.reasoning
+    assert model._typo_key("celtcs") == "celtics"
+
+
+@pytest.mark.parametrize("question", [
+    "Will Texas win the NFL game?",              # "texas" is not a typo of "texans"
+    "Will Celtic win the Champions League match?",  # singular of "celtics"
+    "Will the Rookies win the NBA finals?",       # known word one edit from "rockies"
+])
+def test_odds_ordinary_words_not_corrected(odds_mod, strategy_modules, question):
+    model = _odds_model_with_events(odds_mod, "basketball_nba", [
+        ("Boston Celtics", "Miami Heat"),
+        ("Houston Texans", "Dallas Cowboys"),
+        ("Colorado Rockies", "San Diego Padres"),
+    ])
+    m = make_market(strategy_modules.market_fetcher, question=question)
+    assert model.estimate(m) is None
+
+
+def test_odds_determine_side_team_absent(odds_mod):
+    model = odds_mod.OddsApiModel(api_key="test")
+    assert model._determine_side("will texas win the game?", "Houston Texans") is None
+    assert model._determine_side("can the texans beat dallas?", "Houston Texans") == "YES"
+
+
+# ── OrderTracker polling ──────────────────────────────────────
+
+
+class FakeAuthClient:
+    """Authenticated CLOB stand-in: get_orders for the batch, get_order per order."""
+
+    def __init__(self, open_orders=None, orders=None, batch_error=False):
+        self.open_orders = open_orders or []
+        self.orders = orders or {}
+        self.batch_error = batch_error
+        self.get_order_calls = []
+
+    def get_orders(self):
+        if self.batch_error:
+            raise RuntimeError("batch unavailable")
+        return self.open_orders
+
+    def get_order(self, order_id):
+        self.get_order_calls.append(order_id)
+        return self.orders.get(order_id)
+
+
+@pytest.fixture
+def tracker_factory(strategy_modules, monkeypatch):
+    import order_tracker as order_tracker_mod
+    importlib.reload(order_tracker_mod)
+    monkeypatch.setattr(order_tracker_mod, "db", strategy_modules.db)
+
+    def make(auth):
+        monkeypatch.setattr(order_tracker_mod, "clients", SimpleNamespace(has_auth=True, auth=auth))
+        fills = []
+        tracker = order_tracker_mod.OrderTracker(
+            on_fill=lambda order, size, price: fills.append((order.order_id, size, price)),
+        )
+        for oid in ("o1", "o2"):
+            tracker.track_order(oid, f"tok_{oid}", "Q?", "YES", "BUY", 10, 0.5)
+        return tracker, fills
+
+    return make
+
+
+def test_order_tracker_batched_open_orders(tracker_factory):
+    auth = FakeAuthClient(open_orders=[
+        {"id": "o1", "status": "LIVE", "size_matched": "4", "price": "0.5"},
+        {"id": "o2", "status": "LIVE", "size_matched": "0", "price": "0.5"},
+    ])
+    tracker, fills = tracker_factory(auth)
+    tracker.poll_once()
+
+    assert auth.get_order_calls == []  # both answered by the one batch call
+    assert fills == [("o1", 4.0, 0.5)]
+    assert tracker.get_order("o1").status == "PARTIALLY_FILLED"
+    assert tracker.pending_count == 2
+
+
+def test_order_tracker_falls_back_per_order(tracker_factory):
+    auth = FakeAuthClient(batch_error=True, orders={
+        "o1": {"status": "MATCHED", "size_matched": "10", "price": "0.5"},
+        "o2": {"status": "LIVE", "size_matched": "0", "price": "0.5"},
+    })
+    tracker, fills = tracker_factory(auth)
+    tracker.poll_once()
+
+    assert sorted(auth.get_order_calls) == ["o1", "o2"]
+    assert fills == [("o1", 10.0, 0.5)]
+    assert tracker.get_order("o1").status == "MATCHED"
+    assert tracker.pending_count == 1
+
+
+def test_order_tracker_fetches_orders_missing_from_batch(tracker_factory):
+    # o2 left the open-orders list (filled), so it is fetched on its own
+    auth = FakeAuthClient(
+        open_orders=[{"id": "o1", "status": "LIVE", "size_matched": "0", "price": "0.5"}],
+        orders={"o2": {"status": "MATCHED", "size_matched": "10", "price": "0.48"}},
+    )
+    tracker, fills = tracker_factory(auth)
+    tracker.poll_once()
+
+    assert auth.get_order_calls == ["o2"]
+    assert fills == [("o2", 10.0, 0.48)]
+    assert tracker.pending_count == 1
+
+
+# ── OrderManager triggers ─────────────────────────────────────
+
+
+@pytest.fixture
+def order_manager_mod(strategy_modules):
+    import order_tracker as order_tracker_mod
+    import order_manager as order_manager_mod
+    importlib.reload(order_tracker_mod)
+    importlib.reload(order_manager_mod)
+    return order_manager_mod
+
+
+@pytest.fixture
+def manager(order_manager_mod):
+    sells = []
+
+    def market_sell(token_id, size):
+        sells.append((token_id, size))
+        return SimpleNamespace(success=True, error=None)
+
+    trader = SimpleNamespace(portfolio=MagicMock(), market_sell=market_sell)
+    om = order_manager_mod.OrderManager(trader=trader)
+    om.sells = sells
+    return om
+
+
+def _auto_order(om_mod, order_id, order_type, trigger, **kw):
+    return om_mod.AutoOrder(
+        id=order_id, token_id=kw.pop("token_id", "tok"), market_question="Q?",
+        order_type=order_type, side="YES", size=10, trigger_price=trigger,
+        state=om_mod.OrderState.ACTIVE, **kw,
+    )
+
+
+def test_trigger_table_take_profit_and_stop_loss(order_manager_mod):
+    om_mod = order_manager_mod
+    table = om_mod.TriggerTable(capacity=1)  # forces a grow on the second add
+    table.add(_auto_order(om_mod, "tp", om_mod.OrderType.TAKE_PROFIT, 0.60))
+    table.add(_auto_order(om_mod, "sl", om_mod.OrderType.STOP_LOSS, 0.40))
+
+    def fired(price):
+        return {table.order_ids[r] for r in table.evaluate({"tok": price})[2]}
+
+    assert fired(0.50) == set()
+    assert fired(0.60) == {"tp"}
+    assert fired(0.40) == {"sl"}
+    assert fired(float("nan")) == set()
+    assert table.evaluate({"other": 0.10})[2].size == 0  # no price for tok
+
+    table.remove("tp")
+    assert fired(0.70) == set()
+
+
+def test_trigger_table_trailing_stop_follows_high(order_manager_mod):
+    om_mod = order_manager_mod
+    table = om_mod.TriggerTable()
+    table.add(_auto_order(om_mod, "ts", om_mod.OrderType.TRAILING_STOP, 0.45,
+                          trailing_percent=0.10, highest_price=0.50))
+
+    p, moved, fired = table.evaluate({"tok": 0.60})
+    assert [table.order_ids[r] for r in moved] == ["ts"] and fired.size == 0
+    row = moved[0]
+    assert table.high[row] == pytest.approx(0.60)
+    assert table.trig[row] == pytest.approx(0.54)
+
+    # A lower high never lowers the stop
+    _, moved, fired = table.evaluate({"tok": 0.55})
+    assert moved.size == 0 and fired.size == 0
+    assert table.trig[row] == pytest.approx(0.54)
+
+    _, _, fired = table.evaluate({"tok": 0.54})
+    assert [table.order_ids[r] for r in fired] == ["ts"]
+
+
+def test_dispatch_executes_and_removes_fired_orders(manager, order_manager_mod):
+    om_mod = order_manager_mod
+    tp = manager.set_take_profit("tok", price=0.60, size=5)
+    sl = manager.set_stop_loss("tok", price=0.40, size=5)
+    ts = manager.set_trailing_stop("tok2", trail_percent=0.10, size=3, current_price=0.50)
+
+    manager._dispatch_prices({"tok": 0.65, "tok2": 0.70})
+    assert manager.orders[tp].state == om_mod.OrderState.EXECUTED
+    assert manager.orders[sl].state == om_mod.OrderState.ACTIVE
+    assert manager.orders[ts].highest_price == pytest.approx(0.70)
+    assert manager.orders[ts].trigger_price == pytest.approx(0.63)
+    assert manager.sells == [("tok", 5)]
+
+    # The executed take profit left the table: a repeat price fires nothing new
+    manager._dispatch_prices({"tok": 0.65})
+    assert manager.sells == [("tok", 5)]
+
+    manager._dispatch_prices({"tok": 0.35, "tok2": 0.62})
+    assert manager.sells == [("tok", 5), ("tok", 5), ("tok2", 3)]
+    assert manager.get_active_orders() == []
+
+
+@pytest.mark.parametrize("price, expected_log", [(0.70, "Take Profit"), (0.30, "Stop Loss")])
+def test_bracket_one_leg_cancels_other(manager, order_manager_mod, caplog, price, expected_log):
+    om_mod = order_manager_mod
+    tp_id, sl_id = manager.set_oco("tok", size=10, take_profit_price=0.65, stop_loss_price=0.35)
+    assert tp_id == sl_id
+    assert manager.orders[tp_id].order_type == om_mod.OrderType.BRACKET
+
+    manager._dispatch_prices({"tok": 0.50})
+    assert manager.sells == []
+
+    with caplog.at_level("INFO"):
+        manager._dispatch_prices({"tok": price})
+    assert expected_log in caplog.text
+    assert manager.orders[tp_id].state == om_mod.OrderState.EXECUTED
+    assert manager.sells == [("tok", 10)]
+
+    # The other leg went with it: crossing its level sells nothing more
+    other = 0.30 if price > 0.5 else 0.70
+    manager._dispatch_prices({"tok": other})
+    assert manager.sells == [("tok", 10)]
+    assert manager.get_active_orders() == []
+
+
+# ── Fast paths pinned against the general code ────────────────
+
+
+def _outcome_prices_reference(raw):
+    """_parse_outcome_prices without the string-splitting fast path."""
+    import orjson
+
+    if isinstance(raw, str):
+        raw = orjson.loads(raw)
+    price_yes = float(raw[0]) if raw else 0.5
+    price_no = float(raw[1]) if len(raw) > 1 else 1 - price_yes
+    return price_yes, price_no
+
+
+@pytest.mark.parametrize("raw", [
+    '["0.52", "0.48"]',
+    '["0.52","0.48"]',
+    '[ "0.52" , "0.48" ]',
+    '["0.52",\n "0.48"]',
+    '["1", "0"]',
+    '["0.0005", "0.9995"]',
+    '["0.2", "0.3", "0.5"]',       # 3-outcome market
+    '["0.7"]',
+    "[]",
+    '[0.52, 0.48]',                 # numbers, not strings
+    ["0.52", "0.48"],               # already decoded
+    [0.25, 0.75, 0.0],
+    [],
+])
+def test_parse_outcome_prices_matches_orjson(strategy_modules, raw):
+    parse = strategy_modules.market_fetcher._parse_outcome_prices
+    assert parse(raw) == _outcome_prices_reference(raw)
+
+
+def _change_1h_reference(points, now):
+    """Linear scan from the newest point, as PriceHistory did before bisecting."""
+    if len(points) < 2:
+        return None, None
+    current = points[-1][1]
+    hour_ago = next((p for p in reversed(points) if now - p[0] >= 3600), None)
+    if not (hour_ago and current):
+        return None, None
+    change = current - hour_ago[1]
+    base = next((p for p in reversed(points[:-1]) if now - p[0] >= 3600), None)
+    if base is None or base[1] <= 0:
+        return change, None
+    return change, change / base[1] * 100
+
+
+@pytest.mark.parametrize("offsets, prices", [
+    ([], []),                                            # empty series
+    ([7200], [0.5]),                                     # single point
+    ([600, 300, 0], [0.4, 0.5, 0.6]),                    # nothing an hour old
+    ([3600, 0], [0.4, 0.5]),                             # exactly one hour
+    ([5400, 3700, 3599, 60], [0.3, 0.4, 0.45, 0.6]),     # straddles the boundary
+    ([7200, 3600], [0.4, 0.5]),                          # newest is the only candidate
+    ([7200, 5000, 0], [0.0, 0.0, 0.5]),                  # zero base
+    ([7200, 0], [0.5, 0.0]),                             # zero current price
+])
+def test_change_1h_matches_linear_scan(strategy_modules, offsets, prices):
+    import odds_tracker as odds_tracker_mod
+    importlib.reload(odds_tracker_mod)
+
+    now = 1_700_000_000.0
+    history = odds_tracker_mod.PriceHistory(token_id="tok", market_question="Q?")
+    for offset, price in zip(offsets, prices):
+        history.add_price(odds_tracker_mod.PricePoint(
+            timestamp=datetime.fromtimestamp(now - offset), price_yes=price, price_no=1 - price,
+        ))
+    expected = _change_1h_reference([(now - o, p) for o, p in zip(offsets, prices)], now)
+    assert history.change_1h(now) == pytest.approx(expected)
+
+
+def test_stream_triggers_on_price_change_midpoints_only(manager, order_manager_mod):
+    import orjson
+
+    sl = manager.set_stop_loss("tok", price=0.40, size=5)
+
+    # A trade print below the stop is not a midpoint: nothing fires
+    manager._handle_stream_message(orjson.dumps({"event_type": "last_trade_price", "asset_id": "tok", "price": "0.30"}))
+    assert manager.sells == []
+
+    # Bids pulled without a trade: the price_change midpoint crosses the stop
+    manager._handle_stream_message(orjson.dumps({
+        "event_type": "price_change",
+        "market": "cond",
+        "price_changes": [{"asset_id": "tok", "price": "0.36", "side": "BUY", "best_bid": "0.36", "best_ask": "0.40"}],
+    }))
+    assert manager.orders[sl].state == order_manager_mod.OrderState.EXECUTED
+    assert manager.sells == [("tok", 5)]
+
+
+def test_quiet_stream_counts_as_down(manager, order_manager_mod, monkeypatch):
+    import asyncio
+
+    class SilentSocket:
+        sent = []
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def send(self, msg):
+            self.sent.append(msg)
+
+        async def recv(self):
+            await asyncio.sleep(3600)
+
+    monkeypatch.setattr(order_manager_mod.websockets, "connect", lambda url: SilentSocket(), raising=False)
+    monkeypatch.setattr(order_manager_mod, "STREAM_RECV_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(order_manager_mod, "STREAM_QUIET_SECONDS", 0.05)
+    manager.set_stop_loss("tok", price=0.40, size=5)
+    manager._monitoring = True
+    seen = []
+
+    async def run():
+        task = asyncio.ensure_future(manager._stream_prices({"tok"}))
+        await asyncio.sleep(0.02)
+        seen.append(manager._stream_connected)
+        await asyncio.sleep(0.1)
+        seen.append(manager._stream_connected)
+        manager._monitoring = False
+        await task
+
+    asyncio.run(run())
+    assert seen == [True, False]